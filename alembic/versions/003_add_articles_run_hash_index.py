@@ -0,0 +1,20 @@
+"""Add composite index on news_articles(run_id, content_hash) for dedup lookups.
+
+Revision ID: 003_run_hash_index
+Revises: 002_digest_entries
+Create Date: 2026-08-28
+"""
+from alembic import op
+
+revision = "003_run_hash_index"
+down_revision = "002_digest_entries"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_articles_run_hash", "news_articles", ["run_id", "content_hash"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_articles_run_hash", table_name="news_articles")
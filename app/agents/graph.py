@@ -5,8 +5,8 @@ Architecture: Manual supervisor pattern using StateGraph + Command routing.
 See design doc Section 1 for the full flow diagram.
 
 Flow:
-  START → scrape (fan-out) → merge → deduplicate → credibility
-  → analyse → summarise → linkedin_gen → image_gen
+  START → scrape_all (4 sources gathered concurrently) → deduplicate
+  → credibility → analyse → summarise → linkedin_gen → image_gen
   → human_approval [interrupt] → (approved) email + linkedin_publish
                                  (rejected) revision loop
 """
@@ -17,19 +17,13 @@ from typing import Literal
 
 from langgraph.checkpoint.memory import InMemorySaver
 from langgraph.graph import END, START, StateGraph
-from langgraph.types import RetryPolicy, Send
+from langgraph.types import RetryPolicy
 
 from app.agents.nodes.approval import human_approval_node
 from app.agents.nodes.credibility import credibility_node
 from app.agents.nodes.image_gen import image_gen_node
 from app.agents.nodes.linkedin_gen import linkedin_gen_node
-from app.agents.nodes.scraper import (
-    merge_results_node,
-    scrape_arxiv_node,
-    scrape_rss_node,
-    scrape_serper_node,
-    scrape_tavily_node,
-)
+from app.agents.nodes.scraper import scrape_all_node
 from app.agents.nodes.db_persist import persist_to_db_node
 from app.agents.nodes.summarizer import (
     analyze_node,
@@ -38,29 +32,71 @@ from app.agents.nodes.summarizer import (
     summarize_node,
 )
 from app.agents.state import PipelineState
+from app.core.config import get_settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
+settings = get_settings()
+
+# Shared default for state lookups — never mutated, so one allocation serves
+# every call instead of a fresh [] per .get() default.
+_EMPTY_LIST: list = []
+
+# Process-wide default checkpointer, shared by every build_graph() call that
+# doesn't pass its own. A fresh InMemorySaver per call would silently break
+# interrupt/resume across requests in prod (each request would get an empty
+# saver), and per-run AsyncPostgresSaver instances each pay pool setup.
+_default_checkpointer_instance = None
+
+
+def _default_checkpointer():
+    """InMemorySaver on SQLite/dev; pooled AsyncPostgresSaver otherwise."""
+    global _default_checkpointer_instance
+    if _default_checkpointer_instance is None:
+        if settings.is_sqlite:
+            _default_checkpointer_instance = InMemorySaver()
+        else:
+            import warnings
+
+            from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+            from psycopg.rows import dict_row
+            from psycopg_pool import AsyncConnectionPool
+
+            # The default path is only reached from async callers (FastAPI
+            # routes), so a running loop is guaranteed here. Constructor-open
+            # is deprecated in psycopg_pool but remains the only way to open
+            # from this sync helper; silence just that warning.
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                pool = AsyncConnectionPool(
+                    settings.langgraph_pg_uri,
+                    max_size=settings.pg_pool_size,
+                    open=True,
+                    kwargs={"autocommit": True, "row_factory": dict_row},
+                )
+            _default_checkpointer_instance = AsyncPostgresSaver(pool)
+    return _default_checkpointer_instance
 
 # ── Retry policy for scraper nodes (transient failure handling) ──
+def _retry_scraper_error(exc: Exception) -> bool:
+    """Retry transient failures, but never 429s — the scrapers' token bucket
+    already spaces requests, and immediate retries amplify the throttling."""
+    import httpx
+
+    if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 429:
+        return False
+    return True
+
+
 _scraper_retry = RetryPolicy(
     max_attempts=3,
     initial_interval=2.0,
     backoff_factor=2,
     jitter=True,
+    retry_on=_retry_scraper_error,
 )
 
 
-def _fan_out_scrapers(state: PipelineState) -> list[Send]:
-    """Fan out to all scraper nodes in parallel via Send."""
-    return [
-        Send("scrape_tavily", state),
-        Send("scrape_rss", state),
-        Send("scrape_arxiv", state),
-        Send("scrape_serper", state),
-    ]
-
-
 def _route_after_approval(state: PipelineState) -> Literal["publish", "revise"]:
     """Conditional edge: route based on human approval decision."""
     if state.get("approval_status") == "approved":
@@ -68,6 +104,13 @@ def _route_after_approval(state: PipelineState) -> Literal["publish", "revise"]:
     return "revise"
 
 
+# Compiled graphs keyed by checkpointer identity. The topology is static, so
+# recompiling per request only re-walks nodes and rebuilds the Pregel executor
+# for an identical result. The compiled graph holds a reference to its
+# checkpointer, so the id() key can't be recycled while the entry lives.
+_compiled_graphs: dict[int, object] = {}
+
+
 def build_graph(checkpointer=None) -> StateGraph:
     """
     Construct and compile the full pipeline graph.
@@ -79,14 +122,17 @@ def build_graph(checkpointer=None) -> StateGraph:
     Returns:
         Compiled StateGraph ready for .invoke() or .ainvoke().
     """
+    if checkpointer is None:
+        checkpointer = _default_checkpointer()
+
+    cached = _compiled_graphs.get(id(checkpointer))
+    if cached is not None:
+        return cached
+
     workflow = StateGraph(PipelineState)
 
-    # ── Scraper nodes (parallel fan-out) ────────────────────
-    workflow.add_node("scrape_tavily", scrape_tavily_node, retry=_scraper_retry)
-    workflow.add_node("scrape_rss", scrape_rss_node, retry=_scraper_retry)
-    workflow.add_node("scrape_arxiv", scrape_arxiv_node, retry=_scraper_retry)
-    workflow.add_node("scrape_serper", scrape_serper_node, retry=_scraper_retry)
-    workflow.add_node("merge_results", merge_results_node)
+    # ── Scrape node (all 4 sources gathered concurrently in-node) ──
+    workflow.add_node("scrape_all", scrape_all_node, retry=_scraper_retry)
 
     # ── Processing nodes (sequential) ───────────────────────
     workflow.add_node("deduplicate", deduplicate_node)
@@ -108,15 +154,9 @@ def build_graph(checkpointer=None) -> StateGraph:
     workflow.add_node("revise", _revise_node)
 
     # ── Edges ───────────────────────────────────────────────
-    # Fan-out from START to all scrapers
-    workflow.add_conditional_edges(START, _fan_out_scrapers)
-
-    # All scrapers → merge
-    for scraper in ["scrape_tavily", "scrape_rss", "scrape_arxiv", "scrape_serper"]:
-        workflow.add_edge(scraper, "merge_results")
-
     # Sequential pipeline
-    workflow.add_edge("merge_results", "deduplicate")
+    workflow.add_edge(START, "scrape_all")
+    workflow.add_edge("scrape_all", "deduplicate")
     workflow.add_edge("deduplicate", "credibility")
     workflow.add_edge("credibility", "analyze")
     workflow.add_edge("analyze", "cluster_stories")
@@ -132,41 +172,23 @@ def build_graph(checkpointer=None) -> StateGraph:
     workflow.add_edge("revise", "summarize")  # revision loop
 
     # ── Compile ─────────────────────────────────────────────
-    if checkpointer is None:
-        checkpointer = InMemorySaver()
-
     app = workflow.compile(checkpointer=checkpointer)
+    _compiled_graphs[id(checkpointer)] = app
     logger.info("pipeline_graph_compiled", node_count=len(workflow.nodes))
     return app
 
 
 # ── Publish / Revise placeholder nodes ──────────────────────
-def _build_newsletter_html(summaries: list, run_id: str) -> str:
-    """Build a simple HTML newsletter from summaries."""
-    items = ""
-    for s in summaries:
-        items += f"""
-        <div style="border-left:4px solid #0a66c2;padding:12px 16px;margin-bottom:24px;">
-            <span style="font-size:11px;color:#666;text-transform:uppercase;">
-                {s.get("category", "AI")}
-            </span>
-            <h2 style="margin:4px 0;font-size:18px;">{s.get("headline", "")}</h2>
-            <p style="color:#333;line-height:1.6;">{s.get("body", "")}</p>
-        </div>"""
-
-    return f"""<!DOCTYPE html>
-<html><head><meta charset="utf-8"></head>
-<body style="font-family:-apple-system,BlinkMacSystemFont,sans-serif;
-             max-width:640px;margin:0 auto;padding:24px;color:#111;">
-    <h1 style="border-bottom:2px solid #0a66c2;padding-bottom:12px;">
-        AI/ML Weekly Digest
-    </h1>
-    <p style="color:#666;font-size:13px;">Run ID: {run_id}</p>
-    {items}
-    <p style="color:#aaa;font-size:11px;margin-top:32px;">
-        Generated by AI News Summarizer
-    </p>
-</body></html>"""
+def _stream_newsletter(f, summaries: list, run_id: str) -> None:
+    """Stream the newsletter render into a file-like object chunk by chunk.
+
+    Jinja's streaming renderer never holds the full document, so with a
+    SpooledTemporaryFile sink the render stays within the spool's memory cap
+    no matter how many summaries a run produces.
+    """
+    from app.agents.nodes._templates import ENV
+
+    ENV.get_template("newsletter.html").stream(summaries=summaries, run_id=run_id).dump(f)
 
 
 def _ensure_images(state: dict, run_id: str) -> tuple[list[str], str | None]:
@@ -183,17 +205,15 @@ def _ensure_images(state: dict, run_id: str) -> tuple[list[str], str | None]:
 
     from app.agents.nodes.image_gen import (
         OUTPUT_DIR,
-        TEMPLATE_DIR,
         _generate_cards,
         _generate_carousel_pdf,
     )
-    from jinja2 import Environment, FileSystemLoader, select_autoescape
 
-    summaries = state.get("summaries", [])
+    summaries = state.get("summaries") or _EMPTY_LIST
     if not summaries:
         return [], None
 
-    existing_paths = [p for p in state.get("image_paths", []) if Path(p).exists()]
+    existing_paths = [p for p in state.get("image_paths") or _EMPTY_LIST if Path(p).exists()]
     existing_pdf = state.get("carousel_pdf_path")
     pdf_exists = bool(existing_pdf and Path(existing_pdf).exists())
 
@@ -204,12 +224,8 @@ def _ensure_images(state: dict, run_id: str) -> tuple[list[str], str | None]:
     # Files are missing — regenerate from state summaries
     logger.info("regenerating_images_from_state", run_id=run_id, reason="files_missing_on_this_container")
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    env = Environment(
-        loader=FileSystemLoader(str(TEMPLATE_DIR)),
-        autoescape=select_autoescape(["html"]),
-    )
-    new_paths = _generate_cards(summaries, run_id, env) if not existing_paths else existing_paths
-    new_pdf = _generate_carousel_pdf(summaries, run_id, env) if not pdf_exists else existing_pdf
+    new_paths = _generate_cards(summaries, run_id) if not existing_paths else existing_paths
+    new_pdf = _generate_carousel_pdf(summaries, run_id) if not pdf_exists else existing_pdf
     return new_paths, new_pdf
 
 
@@ -219,7 +235,7 @@ def _publish_node(state: PipelineState) -> dict:
     from app.services.linkedin_service import LinkedInService
 
     run_id = state["run_id"]
-    summaries = state.get("summaries", [])
+    summaries = state.get("summaries") or _EMPTY_LIST
     linkedin_draft = state.get("linkedin_draft", "")
 
     logger.info(
@@ -240,12 +256,18 @@ def _publish_node(state: PipelineState) -> dict:
     )
 
     # ── Email newsletter ──────────────────────────────────────────────────────
-    html = _build_newsletter_html(summaries, run_id)
+    # Spool the rendered HTML: stays in a 64KB memory buffer for typical runs
+    # and spills to disk for oversized digests instead of ballooning RSS.
+    from tempfile import SpooledTemporaryFile
+
     try:
-        EmailService().send_newsletter(
-            html_content=html,
-            image_paths=image_paths or None,
-        )
+        with SpooledTemporaryFile(max_size=64 * 1024, mode="w+", encoding="utf-8") as f:
+            _stream_newsletter(f, summaries, run_id)
+            f.seek(0)
+            EmailService.get().send_newsletter(
+                html_stream=f,
+                image_paths=image_paths or None,
+            )
         logger.info("newsletter_sent", run_id=run_id)
     except Exception as e:
         logger.error("newsletter_send_failed", run_id=run_id, error=str(e))
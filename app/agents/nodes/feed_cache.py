@@ -0,0 +1,64 @@
+"""
+Disk-backed conditional-GET cache for RSS/Atom feeds.
+
+Most feeds publish a handful of entries per day but are fetched on every run.
+Feeds that send ETag / Last-Modified validators can answer `304 Not Modified`
+to a conditional request, which skips both the download and the parse; this
+cache stores the validators plus the already-parsed entries per feed URL so
+a 304 costs one header round-trip and zero CPU. Feeds that send no
+validators are not cached — a conditional request can never hit for them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_DIR = Path("./data/feed_cache")
+
+
+def _cache_path(feed_url: str, cache_dir: Path) -> Path:
+    digest = hashlib.blake2b(feed_url.encode("utf-8"), digest_size=16).hexdigest()
+    return cache_dir / f"{digest}.json"
+
+
+def load_feed_cache(feed_url: str, cache_dir: Path = DEFAULT_CACHE_DIR) -> dict | None:
+    """Return {"etag", "last_modified", "entries"} for the feed, or None."""
+    path = _cache_path(feed_url, cache_dir)
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except Exception as e:
+        logger.warning("feed_cache_read_failed", path=str(path), error=str(e))
+        return None
+
+
+def conditional_headers(cached: dict) -> dict[str, str]:
+    """Build If-None-Match / If-Modified-Since headers from a cache record."""
+    headers: dict[str, str] = {}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+    return headers
+
+
+def store_feed_cache(
+    feed_url: str,
+    etag: str | None,
+    last_modified: str | None,
+    entries: list[dict],
+    cache_dir: Path = DEFAULT_CACHE_DIR,
+) -> None:
+    """Persist validators + parsed entries; no-op when the feed sent neither."""
+    if not etag and not last_modified:
+        return
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    record = {"etag": etag, "last_modified": last_modified, "entries": entries}
+    _cache_path(feed_url, cache_dir).write_text(json.dumps(record), encoding="utf-8")
@@ -16,26 +16,31 @@ from __future__ import annotations
 import base64
 import re
 from collections import Counter
+from html import escape
 from datetime import date
 from pathlib import Path
 from typing import TYPE_CHECKING
 from urllib.parse import urljoin, urlparse
 
-import httpx
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+import orjson
 
 if TYPE_CHECKING:
     from app.agents.state import PipelineState
 
-from app.agents.nodes.screenshot_utils import capture_slide, make_hti
+from app.agents.nodes._templates import TEMPLATE_DIR, get_template
+from app.agents.nodes.screenshot_utils import capture_slide, capture_slides_parallel, make_hti
 from app.core.config import get_settings
+from app.core.http import get_client
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 settings = get_settings()
 
 OUTPUT_DIR = Path("./output/images")
-TEMPLATE_DIR = Path(__file__).parent.parent.parent / "templates"
+
+# Shared default for state/summary lookups — never mutated, so one allocation
+# serves every call instead of a fresh [] per .get() default.
+_EMPTY_LIST: list = []
 
 # Single source of truth for how many stories appear in the carousel AND the LinkedIn post.
 # Changing this one constant keeps both in sync.
@@ -283,14 +288,15 @@ def _reliability_label(pct: int) -> str:
 def _download_image_data_uri(image_url: str) -> str | None:
     """Download an image URL and return a data URI (mime + base64). Returns None on failure."""
     try:
-        with httpx.Client(timeout=8, follow_redirects=True) as client:
-            resp = client.get(image_url, headers={"User-Agent": _HTTP_USER_AGENT})
-            resp.raise_for_status()
-            mime = resp.headers.get("content-type", "").split(";")[0].strip()
-            if not mime.startswith("image/"):
-                return None
-            b64 = base64.b64encode(resp.content).decode("utf-8")
-            return f"data:{mime};base64,{b64}"
+        resp = get_client().get(
+            image_url, headers={"User-Agent": _HTTP_USER_AGENT}, timeout=8
+        )
+        resp.raise_for_status()
+        mime = resp.headers.get("content-type", "").split(";")[0].strip()
+        if not mime.startswith("image/"):
+            return None
+        b64 = base64.b64encode(resp.content).decode("utf-8")
+        return f"data:{mime};base64,{b64}"
     except Exception as e:
         logger.debug("image_download_failed", url=image_url, error=str(e))
         return None
@@ -326,10 +332,9 @@ _META_IMAGE_PATTERNS: list[tuple[str, str]] = [
 def _fetch_page_html(url: str) -> str | None:
     """Fetch a page's raw HTML. Returns None on any network failure."""
     try:
-        with httpx.Client(timeout=6, follow_redirects=True) as client:
-            resp = client.get(url, headers={"User-Agent": _HTTP_USER_AGENT})
-            resp.raise_for_status()
-            return resp.text
+        resp = get_client().get(url, headers={"User-Agent": _HTTP_USER_AGENT}, timeout=6)
+        resp.raise_for_status()
+        return resp.text
     except Exception as e:
         logger.debug("page_fetch_failed", url=url, error=str(e))
         return None
@@ -419,14 +424,14 @@ def _serper_image_search(headline: str) -> str | None:
     if not settings.serper_api_key or settings.serper_api_key.startswith("your-"):
         return None
     try:
-        with httpx.Client(timeout=6) as client:
-            resp = client.post(
-                "https://google.serper.dev/images",
-                headers={"X-API-KEY": settings.serper_api_key},
-                json={"q": headline, "num": 5},
-            )
-            resp.raise_for_status()
-            images = resp.json().get("images", [])
+        resp = get_client().post(
+            "https://google.serper.dev/images",
+            headers={"X-API-KEY": settings.serper_api_key},
+            json={"q": headline, "num": 5},
+            timeout=6,
+        )
+        resp.raise_for_status()
+        images = orjson.loads(resp.content).get("images", [])
 
         for img in images:
             image_url = img.get("imageUrl", "")
@@ -450,22 +455,22 @@ def _wikipedia_image_search(query: str) -> str | None:
     a topical stock photo beats an empty gradient when nothing else lands.
     """
     try:
-        with httpx.Client(timeout=6) as client:
-            resp = client.get(
-                "https://en.wikipedia.org/w/api.php",
-                params={
-                    "action": "query",
-                    "generator": "search",
-                    "gsrsearch": query,
-                    "gsrlimit": 1,
-                    "prop": "pageimages",
-                    "piprop": "original",
-                    "format": "json",
-                },
-                headers={"User-Agent": _HTTP_USER_AGENT},
-            )
-            resp.raise_for_status()
-            pages = resp.json().get("query", {}).get("pages", {})
+        resp = get_client().get(
+            "https://en.wikipedia.org/w/api.php",
+            params={
+                "action": "query",
+                "generator": "search",
+                "gsrsearch": query,
+                "gsrlimit": 1,
+                "prop": "pageimages",
+                "piprop": "original",
+                "format": "json",
+            },
+            headers={"User-Agent": _HTTP_USER_AGENT},
+            timeout=6,
+        )
+        resp.raise_for_status()
+        pages = orjson.loads(resp.content).get("query", {}).get("pages", {})
 
         for page in pages.values():
             image_url = page.get("original", {}).get("source", "")
@@ -528,34 +533,44 @@ def _make_hti(size: tuple[int, int]):
 # Email cards (1200 × 627)
 # ──────────────────────────────────────────────────────────────────────────────
 
-def _generate_cards(summaries: list[dict], run_id: str, env: Environment) -> list[str]:
+def _generate_cards(summaries: list[dict], run_id: str) -> list[str]:
     """Render individual 1200×627 news cards for email attachments."""
-    template = env.get_template("news_card.html")
-    hti = _make_hti((1200, 627))
-    paths: list[str] = []
+    template = get_template("news_card.html")
 
+    # Render all templates first, then screenshot the batch concurrently —
+    # the Chrome renders are independent and dominated by layout wait.
+    slides: list[tuple[str, str, str]] = []
     for i, summary in enumerate(summaries[:5]):
+        # credibility_bp is int basis points set by summarize_node; the badge
+        # is integer division away, no float percent-formatting. Fallback
+        # covers summaries checkpointed before the field existed.
+        cred_bp = summary.get("credibility_bp")
+        if cred_bp is None:
+            cred_bp = int(summary.get("credibility_score", 0) * 1000)
         html = template.render(
-            headline=summary.get("headline", "AI News Update"),
-            body=summary.get("body", "")[:180],
+            # *_html fields are pre-escaped by summarize_node (the template
+            # renders them |safe); escape() fallbacks cover summaries
+            # checkpointed before those fields existed
+            headline=summary.get("headline_html")
+            or escape(summary.get("headline", "AI News Update")),
+            body=summary.get("body_preview_html")
+            or escape(summary.get("body_preview") or summary.get("body", "")[:180]),
             category=summary.get("category", "AI"),
-            source_count=len(summary.get("source_urls", [])),
-            credibility=f"{summary.get('credibility_score', 0):.0%}",
+            source_count=len(summary.get("source_urls") or _EMPTY_LIST),
+            credibility=f"{cred_bp // 10}%",
             run_id=run_id,
         )
-        filename = f"card_{run_id}_{i}.png"
-        path = capture_slide(hti, html, filename, label=f"card_{i}", output_dir=OUTPUT_DIR)
-        if path:
-            paths.append(path)
+        slides.append((html, f"card_{run_id}_{i}.png", f"card_{i}"))
 
-    return paths
+    results = capture_slides_parallel(slides, OUTPUT_DIR, (1200, 627))
+    return [p for p in results if p]
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # LinkedIn carousel (1080 × 1080 slides → PDF)
 # ──────────────────────────────────────────────────────────────────────────────
 
-def _generate_carousel_pdf(summaries: list[dict], run_id: str, env: Environment) -> tuple[str, list[str]] | None:
+def _generate_carousel_pdf(summaries: list[dict], run_id: str) -> tuple[str, list[str]] | None:
     """
     Render infographic carousel slides (portrait 1080×1350) and combine into a PDF.
 
@@ -564,7 +579,7 @@ def _generate_carousel_pdf(summaries: list[dict], run_id: str, env: Environment)
       2… Stories   — headline, 3 bullets, real article photo, source names
       N  Closing   — CTA + follow prompt
     """
-    template = env.get_template("carousel_slide.html")
+    template = get_template("carousel_slide.html")
     hti = _make_hti((1080, 1350))  # portrait 4:5 — better for LinkedIn mobile
 
     story_summaries = summaries[:CAROUSEL_STORY_COUNT]
@@ -581,7 +596,7 @@ def _generate_carousel_pdf(summaries: list[dict], run_id: str, env: Environment)
     if not cover_topics:
         cover_topics = ["AI", "Technology"]
 
-    all_source_urls = [url for s in story_summaries for url in s.get("source_urls", []) if url]
+    all_source_urls = [url for s in story_summaries for url in s.get("source_urls") or _EMPTY_LIST if url]
     total_source_count = len({
         urlparse(u).netloc.lower().replace("www.", "")
         for u in all_source_urls
@@ -605,7 +620,10 @@ def _generate_carousel_pdf(summaries: list[dict], run_id: str, env: Environment)
     for i, summary in enumerate(story_summaries):
         body = summary.get("body", "")
         cred_score = summary.get("credibility_score", 0.0)
-        source_urls = summary.get("source_urls", [])
+        cred_bp = summary.get("credibility_bp")
+        if cred_bp is None:
+            cred_bp = int(cred_score * 1000)
+        source_urls = summary.get("source_urls") or _EMPTY_LIST
         source_count = len(source_urls)
         category = summary.get("category", "Other")
 
@@ -620,7 +638,7 @@ def _generate_carousel_pdf(summaries: list[dict], run_id: str, env: Environment)
 
         outlet_names = _outlet_names_from_urls(source_urls)
         bias_dist = _bias_distribution(source_urls)
-        reliability_pct = int(cred_score * 100)
+        reliability_pct = cred_bp // 10
         html = template.render(
             slide_type="story",
             slide_num=i + 1,
@@ -685,7 +703,7 @@ def _generate_carousel_pdf(summaries: list[dict], run_id: str, env: Environment)
 
 def image_gen_node(state: PipelineState) -> dict:
     """Generate email cards and a LinkedIn carousel PDF from pipeline summaries."""
-    summaries = state.get("summaries", [])
+    summaries = state.get("summaries") or _EMPTY_LIST
     if not summaries:
         logger.info("image_gen_skipped", reason="no summaries available")
         return {"image_paths": [], "current_step": "images_generated"}
@@ -693,20 +711,15 @@ def image_gen_node(state: PipelineState) -> dict:
     try:
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-        env = Environment(
-            loader=FileSystemLoader(str(TEMPLATE_DIR)),
-            autoescape=select_autoescape(["html"]),
-        )
-
         run_id = state.get("run_id", "dev")
 
-        image_paths = _generate_cards(summaries, run_id, env)
+        image_paths = _generate_cards(summaries, run_id)
         logger.info("news_cards_generated", count=len(image_paths))
 
         result: dict = {"image_paths": image_paths, "current_step": "images_generated"}
 
         try:
-            carousel_result = _generate_carousel_pdf(summaries, run_id, env)
+            carousel_result = _generate_carousel_pdf(summaries, run_id)
             if carousel_result:
                 pdf_path, slide_paths = carousel_result
                 result["carousel_pdf_path"] = pdf_path
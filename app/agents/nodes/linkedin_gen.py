@@ -8,6 +8,8 @@ dwell time, comments, and reach.
 
 from __future__ import annotations
 
+import io
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from langchain_core.messages import HumanMessage, SystemMessage
@@ -23,6 +25,21 @@ from app.core.logging import get_logger
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Shared default for state lookups — never mutated, so one allocation serves
+# every call instead of a fresh [] per .get() default.
+_EMPTY_LIST: list = []
+
+
+@lru_cache(maxsize=4)
+def _get_llm(model: str, temperature: float) -> ChatGoogleGenerativeAI:
+    """One client per (model, temperature) — construction rebuilds the HTTP
+    channel and re-reads credentials, so don't pay it on every node run."""
+    return ChatGoogleGenerativeAI(
+        model=model,
+        temperature=temperature,
+        google_api_key=settings.google_api_key,
+    )
+
 # ──────────────────────────────────────────────────────────────────────────────
 # LinkedIn algorithm facts baked into this prompt:
 #   • First ~210 chars are visible BEFORE "see more" — that's the hook window.
@@ -94,32 +111,40 @@ Output ONLY the post text. No explanations, no markdown fences."""
 
 def linkedin_gen_node(state: PipelineState) -> dict:
     """Generate a LinkedIn post from the summarised articles."""
-    summaries = state.get("summaries", [])
+    summaries = state.get("summaries") or _EMPTY_LIST
+    articles = state.get("deduplicated_articles") or _EMPTY_LIST
     feedback = state.get("feedback", "")
 
-    if not summaries and not state.get("deduplicated_articles"):
+    if not summaries and not articles:
         return {"error_log": ["LinkedIn gen: no content to work with"]}
 
     try:
-        llm = ChatGoogleGenerativeAI(
-            model=settings.model_summarizer,
-            temperature=0.7,
-            google_api_key=settings.google_api_key,
-        )
+        llm = _get_llm(settings.model_summarizer, 0.7)
 
-        # Build context from summaries (preferred) or raw articles (fallback)
+        # Build context from summaries (preferred) or raw articles (fallback).
+        # Written into one StringIO buffer — no per-story f-string intermediates,
+        # which matters on the revision loop where this reruns per feedback pass.
+        buf = io.StringIO()
+        sep = ""
         if summaries:
-            context = "\n---\n".join(
-                f"Headline: {s.get('headline', 'N/A')}\n"
-                f"Body: {s.get('body', 'N/A')}\n"
-                f"Category: {s.get('category', 'N/A')}"
-                for s in summaries[:CAROUSEL_STORY_COUNT]
-            )
+            for s in summaries[:CAROUSEL_STORY_COUNT]:
+                buf.write(sep)
+                buf.write("Headline: ")
+                buf.write(s.get("headline", "N/A"))
+                buf.write("\nBody: ")
+                buf.write(s.get("body", "N/A"))
+                buf.write("\nCategory: ")
+                buf.write(s.get("category", "N/A"))
+                sep = "\n---\n"
         else:
-            articles = state.get("deduplicated_articles", [])[:CAROUSEL_STORY_COUNT]
-            context = "\n---\n".join(
-                f"Title: {a['title']}\nContent: {a['content'][:300]}" for a in articles
-            )
+            for a in articles[:CAROUSEL_STORY_COUNT]:
+                buf.write(sep)
+                buf.write("Title: ")
+                buf.write(a["title"])
+                buf.write("\nContent: ")
+                buf.write(a["content"][:300])
+                sep = "\n---\n"
+        context = buf.getvalue()
 
         system = LINKEDIN_SYSTEM_PROMPT
         if feedback:
@@ -60,7 +60,7 @@ class _BatchRanking(BaseModel):
     )
 
 
-def rank_papers_node(state: "PipelineState") -> dict:
+async def rank_papers_node(state: "PipelineState") -> dict:
     """Score all raw_articles; return sorted paper_rankings."""
     articles = state.get("raw_articles", [])
     if not articles:
@@ -90,20 +90,26 @@ def rank_papers_node(state: "PipelineState") -> dict:
 
     all_scores: list[dict] = []
 
-    for i in range(0, len(articles), _BATCH_SIZE):
-        batch = articles[i : i + _BATCH_SIZE]
-        papers_text = "\n\n---\n\n".join(
-            f"URL: {a['url']}\nTitle: {a['title']}\nAbstract:\n{a['content'][:600]}"
-            for a in batch
-        )
-        try:
-            result: _BatchRanking = (
-                prompt | llm.with_structured_output(_BatchRanking)
-            ).invoke({"papers": papers_text})
-            all_scores.extend(s.model_dump() for s in result.rankings)
-            logger.info("ranking_batch_done", batch_start=i, scored=len(result.rankings))
-        except Exception as e:
-            logger.warning("ranking_batch_failed", batch_start=i, error=str(e))
+    # Map phase: score the batches concurrently instead of serializing one
+    # LLM round-trip per batch — wall-clock becomes ~one batch latency.
+    chain = prompt | llm.with_structured_output(_BatchRanking)
+    batches = [articles[i : i + _BATCH_SIZE] for i in range(0, len(articles), _BATCH_SIZE)]
+    inputs = [
+        {
+            "papers": "\n\n---\n\n".join(
+                f"URL: {a['url']}\nTitle: {a['title']}\nAbstract:\n{a['content'][:600]}"
+                for a in batch
+            )
+        }
+        for batch in batches
+    ]
+    results = await chain.abatch(
+        inputs, config={"max_concurrency": 8}, return_exceptions=True
+    )
+
+    for i, (batch, result) in enumerate(zip(batches, results)):
+        if isinstance(result, BaseException):
+            logger.warning("ranking_batch_failed", batch_start=i * _BATCH_SIZE, error=str(result))
             # Neutral defaults so the batch still participates in sorting
             for a in batch:
                 all_scores.append({
@@ -112,6 +118,11 @@ def rank_papers_node(state: "PipelineState") -> dict:
                     "benchmark_quality": 5, "reproducibility": 5,
                     "reason": "Ranking unavailable — defaults applied.",
                 })
+            continue
+        all_scores.extend(s.model_dump() for s in result.rankings)
+        logger.info(
+            "ranking_batch_done", batch_start=i * _BATCH_SIZE, scored=len(result.rankings)
+        )
 
     # Identify manually curated papers for priority boost
     manual_urls = {a["url"] for a in articles if a.get("source") == "manual"}
@@ -12,8 +12,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import httpx
-
+from app.core.http import get_client
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -37,9 +36,10 @@ def fetch_pdf_bytes(
 
     pdf_url = paper_url.replace("/abs/", "/pdf/")
     try:
-        with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-            resp = client.get(pdf_url, headers={"User-Agent": "research-analyzer/1.0"})
-            resp.raise_for_status()
+        resp = get_client().get(
+            pdf_url, headers={"User-Agent": "research-analyzer/1.0"}, timeout=timeout
+        )
+        resp.raise_for_status()
     except Exception as e:
         logger.warning("pdf_download_failed", arxiv_id=arxiv_id, error=str(e))
         return None
@@ -24,7 +24,6 @@ logger = get_logger(__name__)
 settings = get_settings()
 
 OUTPUT_DIR = Path("./output/images")
-TEMPLATE_DIR = Path(__file__).parent.parent.parent / "templates"
 
 
 class ComparisonDimension(BaseModel):
@@ -131,16 +130,11 @@ def prior_art_node(state: "PipelineState") -> dict:
 
     # ── 2. Render comparison card ─────────────────────────────────────────
     try:
-        from jinja2 import Environment, FileSystemLoader, select_autoescape
-
+        from app.agents.nodes._templates import get_template
         from app.agents.nodes.screenshot_utils import capture_slide, make_hti
 
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-        env = Environment(
-            loader=FileSystemLoader(str(TEMPLATE_DIR)),
-            autoescape=select_autoescape(["html"]),
-        )
-        template = env.get_template("prior_art_card.html")
+        template = get_template("prior_art_card.html")
         html = template.render(
             paper_title=paper.get("title", "Research Paper"),
             comparison=comparison.model_dump(),
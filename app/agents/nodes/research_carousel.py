@@ -43,7 +43,6 @@ from app.core.logging import get_logger
 logger = get_logger(__name__)
 
 OUTPUT_DIR = Path("./output/images")
-TEMPLATE_DIR = Path(__file__).parent.parent.parent / "templates"
 
 
 _TOTAL_SLIDES = 10  # base slide count, excluding the optional figures slide
@@ -119,17 +118,12 @@ def research_carousel_node(state: "PipelineState") -> dict:
         }
 
     try:
-        from jinja2 import Environment, FileSystemLoader, select_autoescape
-
+        from app.agents.nodes._templates import get_template
         from app.agents.nodes.screenshot_utils import capture_slide, make_hti
 
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-        env = Environment(
-            loader=FileSystemLoader(str(TEMPLATE_DIR)),
-            autoescape=select_autoescape(["html"]),
-        )
-        template = env.get_template("research_carousel_slide.html")
+        template = get_template("research_carousel_slide.html")
         hti = make_hti(OUTPUT_DIR, (1080, 1080))
 
         # Strip section-header lines (─── LABEL ───) produced by the LinkedIn prompt
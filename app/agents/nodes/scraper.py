@@ -1,24 +1,135 @@
 """
-Scraper nodes — fan-out to 4 sources in parallel, then merge.
+Scraper nodes — 4 sources gathered concurrently from a single graph node.
 
-Each scraper returns {"raw_articles": [...]} which the Annotated reducer
-on PipelineState.raw_articles merges automatically.
+Each scraper returns {"raw_articles": [...]}; scrape_all_node runs all four
+concurrently and merges their results itself, so the graph pays one
+checkpointer write for the whole scrape phase instead of one per scraper.
+
+The HTTP scrapers (Tavily, RSS, Serper) are async: each fires its per-query
+or per-feed requests with asyncio.gather over the shared pooled AsyncClient,
+so within a scraper the wall clock is the slowest request, not the sum.
+ArXiv stays synchronous (the arxiv library is blocking) and runs on a worker
+thread.
 """
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
 from datetime import UTC, datetime, timedelta
-
-import httpx
-
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from urllib.parse import urlsplit, urlunsplit
+
+import orjson
+from bs4 import BeautifulSoup
+from ciso8601 import parse_datetime
+
+from app.agents.nodes._http import get_async_client
+from app.agents.nodes.feed_cache import (
+    conditional_headers,
+    load_feed_cache,
+    store_feed_cache,
+)
 from app.agents.state import NewsArticle, PipelineState
 from app.core.config import get_settings
+from app.core.dedup import filter_unseen_urls
 from app.core.logging import get_logger
+from app.core.security import hash_content
 
 logger = get_logger(__name__)
 settings = get_settings()
 
 
+# ═══════════════════════════════════════════════════════════════
+# Upstream protection — token bucket + circuit breaker
+# ═══════════════════════════════════════════════════════════════
+class _TokenBucket:
+    """
+    Token bucket shared across runs.
+
+    Spaces outbound search-API calls so a burst of queries doesn't trip the
+    upstream rate limit in the first place — retrying a 429 inside the same
+    run only amplifies the throttling. ``acquire`` awaits instead of
+    sleeping, so waiting queries don't stall the event loop the scrapers
+    gather on.
+    """
+
+    def __init__(self, rate: float, burst: float = 1.0):
+        self._rate = rate
+        self._capacity = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    async def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self._rate
+            await asyncio.sleep(wait)
+
+
+class _CircuitBreaker:
+    """
+    Per-scraper breaker: opens after `fail_max` consecutive query failures
+    and skips the scraper's remaining queries until `reset_timeout` elapses.
+    Saves wall-clock on doomed attempts when an upstream is down or
+    rate-limiting the whole run.
+    """
+
+    def __init__(self, name: str, fail_max: int, reset_timeout: float):
+        self._name = name
+        self._fail_max = fail_max
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._failures < self._fail_max:
+                return True
+            if time.monotonic() - self._opened_at >= self._reset_timeout:
+                # Half-open: let one attempt through to probe recovery
+                self._failures = self._fail_max - 1
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures == self._fail_max:
+                self._opened_at = time.monotonic()
+                logger.warning(
+                    "scraper_circuit_opened",
+                    scraper=self._name,
+                    reset_seconds=self._reset_timeout,
+                )
+
+
+_tavily_bucket = _TokenBucket(settings.scraper_rps)
+_serper_bucket = _TokenBucket(settings.scraper_rps)
+_tavily_breaker = _CircuitBreaker(
+    "tavily", settings.scraper_breaker_fail_max, settings.scraper_breaker_reset_seconds
+)
+_serper_breaker = _CircuitBreaker(
+    "serper", settings.scraper_breaker_fail_max, settings.scraper_breaker_reset_seconds
+)
+
+
 # ═══════════════════════════════════════════════════════════════
 # Tier 1: Tavily Search
 # ═══════════════════════════════════════════════════════════════
@@ -80,66 +191,79 @@ _TAVILY_QUERIES = [
 ]
 
 
-def scrape_tavily_node(state: PipelineState) -> dict:
-    """Search AI/ML news via Tavily REST API (direct httpx call)."""
+async def _tavily_query(query: str) -> dict | None:
+    """Run one rate-limited Tavily query; None on skip or failure."""
+    if not _tavily_breaker.allow():
+        logger.warning("tavily_circuit_open", query_skipped=query)
+        return None
+    await _tavily_bucket.acquire()
+    try:
+        resp = await get_async_client().post(
+            _TAVILY_API_URL,
+            json={
+                "api_key": settings.tavily_api_key,
+                "query": query,
+                "search_depth": "advanced",
+                "topic": "news",
+                "days": 7,
+                "max_results": 8,
+                "include_answer": False,
+            },
+        )
+        resp.raise_for_status()
+        # orjson takes the raw bytes directly — skips httpx's decode + stdlib parse
+        data = orjson.loads(resp.content)
+        _tavily_breaker.record_success()
+        return data
+    except Exception as e:
+        _tavily_breaker.record_failure()
+        # Debug, not warning: fires per query and the breaker already tracks
+        # failures — a filtered debug call costs one level check.
+        logger.debug("tavily_query_failed", query=query, error=str(e))
+        return None
+
+
+async def scrape_tavily_node(state: PipelineState) -> dict:
+    """Search AI/ML news via Tavily REST API, all queries in flight at once."""
     if not settings.tavily_api_key:
         logger.warning("tavily_skipped", reason="no API key configured")
         return {"raw_articles": [], "error_log": ["Tavily: no API key"]}
 
-    cutoff = datetime.now(UTC) - timedelta(days=7)
+    now = datetime.now(UTC)
+    now_iso = now.isoformat()
+    cutoff = now - timedelta(days=7)
     articles: list[NewsArticle] = []
     seen_urls: set[str] = set()
 
     try:
-        with httpx.Client(timeout=20) as client:
-            for query in _TAVILY_QUERIES:
-                try:
-                    resp = client.post(
-                        _TAVILY_API_URL,
-                        json={
-                            "api_key": settings.tavily_api_key,
-                            "query": query,
-                            "search_depth": "advanced",
-                            "topic": "news",
-                            "days": 7,
-                            "max_results": 8,
-                            "include_answer": False,
-                        },
-                    )
-                    resp.raise_for_status()
-                    data = resp.json()
-                except Exception as e:
-                    logger.warning("tavily_query_failed", query=query, error=str(e))
+        responses = await asyncio.gather(*(_tavily_query(q) for q in _TAVILY_QUERIES))
+        for data in responses:
+            if data is None:
+                continue
+            for r in data.get("results", []):
+                url = r.get("url", "")
+                if not url or url in seen_urls:
                     continue
 
-                for r in data.get("results", []):
-                    url = r.get("url", "")
-                    if not url or url in seen_urls:
+                # Date filter — keep only articles from the past 7 days
+                # (articles with unparseable dates are kept)
+                pub_raw = r.get("published_date", "")
+                if pub_raw:
+                    pub_dt = _parse_iso_date(pub_raw)
+                    if pub_dt and pub_dt < cutoff:
                         continue
 
-                    # Date filter — keep only articles from the past 7 days
-                    pub_raw = r.get("published_date", "")
-                    if pub_raw:
-                        try:
-                            pub_dt = datetime.fromisoformat(pub_raw.replace("Z", "+00:00"))
-                            if pub_dt.tzinfo is None:
-                                pub_dt = pub_dt.replace(tzinfo=UTC)
-                            if pub_dt < cutoff:
-                                continue
-                        except ValueError:
-                            pass  # keep article if date can't be parsed
-
-                    seen_urls.add(url)
-                    articles.append(
-                        NewsArticle(
-                            title=r.get("title", "Untitled"),
-                            url=url,
-                            source="tavily",
-                            content=r.get("content", r.get("snippet", "")),
-                            published_at=pub_raw or datetime.now(UTC).isoformat(),
-                            credibility_score=0.0,
-                        )
+                seen_urls.add(url)
+                articles.append(
+                    NewsArticle(
+                        title=r.get("title", "Untitled"),
+                        url=url,
+                        source="tavily",
+                        content=r.get("content", r.get("snippet", "")),
+                        published_at=pub_raw or now_iso,
+                        credibility_score=0.0,
                     )
+                )
 
         logger.info("tavily_scraped", article_count=len(articles))
         return {"raw_articles": articles}
@@ -282,37 +406,196 @@ RSS_FEEDS = [
     ),
 ]
 
-
-def scrape_rss_node(state: PipelineState) -> dict:
-    """Parse curated RSS feeds for AI/ML articles."""
+# Source slugs precomputed once — the per-entry loop used to lowercase and
+# re-replace the feed name for every article of every feed.
+_FEED_SLUGS = {name: f"rss:{name.lower().replace(' ', '_')}" for name, _ in RSS_FEEDS}
+
+
+async def _fetch_feed_entries(
+    feed_name: str, feed_url: str, cutoff: datetime | None = None
+) -> list[dict] | None:
+    """
+    Fetch and parse one feed over the shared client; None on failure.
+
+    Sends ETag / Last-Modified validators from the disk cache when available —
+    an unchanged feed answers 304 and the cached, already-parsed entries are
+    returned without downloading or re-parsing the body. For feeds with no
+    cache record yet, a HEAD probe first checks whether the feed's
+    Last-Modified predates `cutoff` — a blog dormant for weeks is skipped
+    without the full GET + parse.
+    """
+    cached = load_feed_cache(feed_url)
+    if cached is None and cutoff is not None:
+        try:
+            head = await get_async_client().head(feed_url, timeout=5)
+            last_modified = _parse_pub_date(head.headers.get("last-modified", ""))
+            if head.status_code == 200 and last_modified and last_modified < cutoff:
+                logger.debug("rss_feed_stale_skipped", feed=feed_name)
+                return []
+        except Exception:
+            pass  # many feed hosts reject HEAD (405) — fall through to GET
+    try:
+        resp = await get_async_client().get(
+            feed_url, headers=conditional_headers(cached) if cached else None
+        )
+        if resp.status_code == 304 and cached is not None:
+            logger.debug("rss_feed_not_modified", feed=feed_name)
+            return cached["entries"]
+        resp.raise_for_status()
+        entries = _parse_feed_entries(resp.content)
+    except Exception as e:
+        logger.warning("rss_feed_error", feed=feed_name, error=str(e))
+        return None
+
+    store_feed_cache(
+        feed_url,
+        etag=resp.headers.get("etag"),
+        last_modified=resp.headers.get("last-modified"),
+        entries=entries,
+    )
+    return entries
+
+
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_FEED_ENTRY_CAP = 10  # entries kept per feed
+_ENTRY_SUMMARY_CAP = 2000  # chars of cleaned description kept per entry
+
+# Chars of content kept as content_preview on merged articles — generous
+# headroom over the largest downstream consumer (the 200-token summarize
+# clip, ~800 chars of typical English)
+_CONTENT_PREVIEW_CHARS = 2048
+
+
+@lru_cache(maxsize=2048)
+def _clean_entry_html(raw: str) -> str:
+    """
+    Strip markup from a feed entry description, leaving plain text for the
+    LLM — shorter, cleaner inputs mean fewer wasted tokens downstream.
+    Cached because feeds repeat the same descriptions across the week's
+    fetches; uses lxml's C parser via BeautifulSoup.
+    """
+    if "<" not in raw:
+        return raw[:_ENTRY_SUMMARY_CAP].strip()
+    return BeautifulSoup(raw, "lxml").get_text(" ", strip=True)[:_ENTRY_SUMMARY_CAP]
+
+
+@lru_cache(maxsize=8192)
+def _parse_iso_date(raw: str) -> datetime | None:
+    """ISO-8601 date via ciso8601 (~5-10x faster than stdlib, handles the
+    trailing Z natively); None when unparseable. Cached — the same
+    published_at strings recur across queries within a run."""
+    try:
+        dt = parse_datetime(raw)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt
+
+
+def _parse_pub_date(raw: str) -> datetime | None:
+    """Parse an RFC-822 (RSS) or ISO-8601 (Atom) date; None when unparseable."""
+    if not raw:
+        return None
+    try:
+        dt = parsedate_to_datetime(raw)
+    except (TypeError, ValueError):
+        return _parse_iso_date(raw)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt
+
+
+def _parse_feed_entries(body: bytes) -> list[dict]:
+    """
+    Stream-parse a feed body with lxml.iterparse, stopping at the entry cap.
+
+    We only read title/link/summary/published per entry, so building
+    feedparser's full normalized dict (its dateparser pass dominates the
+    cost) is wasted work — iterparse visits each <item>/<entry> once and
+    frees it immediately, never holding the whole tree.
+    """
+    import io
+
+    from lxml import etree
+
+    entries: list[dict] = []
+    for _event, elem in etree.iterparse(
+        io.BytesIO(body), events=("end",), tag=("item", f"{_ATOM_NS}entry"), recover=True
+    ):
+        if elem.tag == "item":  # RSS 2.0
+            link = (elem.findtext("link") or "").strip()
+            entry = {
+                "title": (elem.findtext("title") or "Untitled").strip(),
+                "link": link,
+                "summary": _clean_entry_html(elem.findtext("description") or ""),
+                "published": (elem.findtext("pubDate") or "").strip(),
+            }
+        else:  # Atom
+            link = ""
+            for link_el in elem.iterfind(f"{_ATOM_NS}link"):
+                if link_el.get("rel", "alternate") == "alternate":
+                    link = link_el.get("href", "")
+                    break
+            entry = {
+                "title": (elem.findtext(f"{_ATOM_NS}title") or "Untitled").strip(),
+                "link": link,
+                "summary": _clean_entry_html(
+                    elem.findtext(f"{_ATOM_NS}summary")
+                    or elem.findtext(f"{_ATOM_NS}content")
+                    or ""
+                ),
+                "published": (
+                    elem.findtext(f"{_ATOM_NS}published")
+                    or elem.findtext(f"{_ATOM_NS}updated")
+                    or ""
+                ).strip(),
+            }
+        entries.append(entry)
+
+        # Free the processed element and its preceding siblings so memory
+        # stays flat regardless of feed size.
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+        if len(entries) >= _FEED_ENTRY_CAP:
+            break
+    return entries
+
+
+async def scrape_rss_node(state: PipelineState) -> dict:
+    """Parse curated RSS feeds for AI/ML articles, all feeds fetched at once."""
     try:
-        import feedparser
-
         articles: list[NewsArticle] = []
-        cutoff = datetime.now(UTC) - timedelta(days=7)
+        now = datetime.now(UTC)
+        now_iso = now.isoformat()
+        cutoff = now - timedelta(days=7)
+
+        # Fetch (or 304-revalidate) every feed concurrently over the pooled
+        # client; unchanged feeds come back as cached parsed entries.
+        entry_lists = await asyncio.gather(
+            *(_fetch_feed_entries(name, url, cutoff) for name, url in RSS_FEEDS)
+        )
+
+        for (feed_name, _feed_url), entries in zip(RSS_FEEDS, entry_lists):
+            if entries is None:
+                continue
+            for entry in entries:
+                pub_dt = _parse_pub_date(entry["published"])
+                if pub_dt and pub_dt < cutoff:
+                    continue
 
-        for feed_name, feed_url in RSS_FEEDS:
-            try:
-                feed = feedparser.parse(feed_url)
-                for entry in feed.entries[:10]:  # cap per feed
-                    published = entry.get("published_parsed")
-                    if published:
-                        pub_dt = datetime(*published[:6], tzinfo=UTC)
-                        if pub_dt < cutoff:
-                            continue
-
-                    articles.append(
-                        NewsArticle(
-                            title=entry.get("title", "Untitled"),
-                            url=entry.get("link", ""),
-                            source=f"rss:{feed_name.lower().replace(' ', '_')}",
-                            content=entry.get("summary", entry.get("description", "")),
-                            published_at=entry.get("published", datetime.now(UTC).isoformat()),
-                            credibility_score=0.0,
-                        )
+                articles.append(
+                    NewsArticle(
+                        title=entry["title"],
+                        url=entry["link"],
+                        source=_FEED_SLUGS[feed_name],
+                        content=entry["summary"],
+                        published_at=entry["published"] or now_iso,
+                        credibility_score=0.0,
                     )
-            except Exception as e:
-                logger.warning("rss_feed_error", feed=feed_name, error=str(e))
+                )
 
         logger.info("rss_scraped", article_count=len(articles), feeds_checked=len(RSS_FEEDS))
         return {"raw_articles": articles}
@@ -391,8 +674,31 @@ _SERPER_QUERIES = [
 ]
 
 
-def scrape_serper_node(state: PipelineState) -> dict:
-    """Search Google News via Serper across multiple diverse queries."""
+async def _serper_query(query: str) -> dict | None:
+    """Run one rate-limited Serper query; None on skip or failure."""
+    if not _serper_breaker.allow():
+        logger.warning("serper_circuit_open", query_skipped=query)
+        return None
+    await _serper_bucket.acquire()
+    try:
+        resp = await get_async_client().post(
+            "https://google.serper.dev/news",
+            headers={"X-API-KEY": settings.serper_api_key},
+            json={"q": query, "num": 10},
+        )
+        resp.raise_for_status()
+        # orjson takes the raw bytes directly — skips httpx's decode + stdlib parse
+        data = orjson.loads(resp.content)
+        _serper_breaker.record_success()
+        return data
+    except Exception as e:
+        _serper_breaker.record_failure()
+        logger.debug("serper_query_failed", query=query, error=str(e))
+        return None
+
+
+async def scrape_serper_node(state: PipelineState) -> dict:
+    """Search Google News via Serper, all queries in flight at once."""
     if not settings.serper_api_key or settings.serper_api_key.startswith("your-"):
         logger.info("serper_skipped", reason="no API key configured")
         return {"raw_articles": []}
@@ -400,33 +706,26 @@ def scrape_serper_node(state: PipelineState) -> dict:
     try:
         articles: list[NewsArticle] = []
         seen_urls: set[str] = set()
-        with httpx.Client(timeout=15) as client:
-            for query in _SERPER_QUERIES:
-                try:
-                    resp = client.post(
-                        "https://google.serper.dev/news",
-                        headers={"X-API-KEY": settings.serper_api_key},
-                        json={"q": query, "num": 10},
+        now_iso = datetime.now(UTC).isoformat()
+        responses = await asyncio.gather(*(_serper_query(q) for q in _SERPER_QUERIES))
+        for data in responses:
+            if data is None:
+                continue
+            for item in data.get("news", []):
+                url = item.get("link", "")
+                if not url or url in seen_urls:
+                    continue
+                seen_urls.add(url)
+                articles.append(
+                    NewsArticle(
+                        title=item.get("title", "Untitled"),
+                        url=url,
+                        source="serper",
+                        content=item.get("snippet", ""),
+                        published_at=item.get("date", now_iso),
+                        credibility_score=0.0,
                     )
-                    resp.raise_for_status()
-                    data = resp.json()
-                    for item in data.get("news", []):
-                        url = item.get("link", "")
-                        if not url or url in seen_urls:
-                            continue
-                        seen_urls.add(url)
-                        articles.append(
-                            NewsArticle(
-                                title=item.get("title", "Untitled"),
-                                url=url,
-                                source="serper",
-                                content=item.get("snippet", ""),
-                                published_at=item.get("date", datetime.now(UTC).isoformat()),
-                                credibility_score=0.0,
-                            )
-                        )
-                except Exception as e:
-                    logger.warning("serper_query_failed", query=query, error=str(e))
+                )
 
         logger.info("serper_scraped", article_count=len(articles))
         return {"raw_articles": articles}
@@ -437,11 +736,87 @@ def scrape_serper_node(state: PipelineState) -> dict:
 
 
 # ═══════════════════════════════════════════════════════════════
-# Merge node — no-op, the Annotated reducer handles merging
+# Combined scrape node — all 4 sources concurrently, merged in-node
 # ═══════════════════════════════════════════════════════════════
-def merge_results_node(state: PipelineState) -> dict:
-    """Log merge stats. Actual merging is handled by the state reducer."""
-    total = len(state.get("raw_articles", []))
-    sources = set(a["source"] for a in state.get("raw_articles", []))
-    logger.info("articles_merged", total=total, sources=list(sources))
-    return {"current_step": "merged"}
\ No newline at end of file
+_SCRAPER_NAMES = (
+    "scrape_tavily_node",
+    "scrape_rss_node",
+    "scrape_arxiv_node",
+    "scrape_serper_node",
+)
+
+
+def _canonical_url(url: str) -> str:
+    """
+    Normalise a URL for cross-source dedup: lowercase scheme/host, trailing
+    slash and fragment stripped, query params sorted. Tavily, Serper, and the
+    Google News feeds routinely return the same story with these cosmetic
+    differences, and every survivor costs real LLM tokens downstream.
+    """
+    try:
+        p = urlsplit(url)
+    except ValueError:
+        return url
+    query = "&".join(sorted(p.query.split("&"))) if p.query else ""
+    return urlunsplit((p.scheme.lower(), p.netloc.lower(), p.path.rstrip("/"), query, ""))
+
+
+async def scrape_all_node(state: PipelineState) -> dict:
+    """
+    Run all four scrapers concurrently and merge their results.
+
+    The HTTP scrapers are async and gather their requests directly on the
+    event loop; arXiv's blocking client runs on a worker thread. Collapsing
+    the LangGraph Send fan-out into one node avoids four checkpointer puts
+    and four reducer merges per run while keeping the same wall-clock
+    parallelism.
+    """
+    results = await asyncio.gather(
+        scrape_tavily_node(state),
+        scrape_rss_node(state),
+        asyncio.to_thread(scrape_arxiv_node, state),
+        scrape_serper_node(state),
+        return_exceptions=True,
+    )
+
+    # First-seen wins per canonical URL — scrapers keep their own ordering,
+    # and the sources most likely to carry full content run first.
+    by_url: dict[str, NewsArticle] = {}
+    total_scraped = 0
+    errors: list[str] = []
+    for name, result in zip(_SCRAPER_NAMES, results):
+        if isinstance(result, BaseException):
+            logger.error("scraper_failed", scraper=name, error=str(result))
+            errors.append(f"{name}: {result}")
+            continue
+        for article in result.get("raw_articles", []):
+            total_scraped += 1
+            by_url.setdefault(_canonical_url(article["url"]), article)
+        errors.extend(result.get("error_log", []))
+
+    # Cross-run pass: drop URLs already processed in a recent run so a
+    # frequent schedule doesn't re-summarize the same stories.
+    if settings.seen_urls_db_path and by_url:
+        try:
+            unseen = filter_unseen_urls(list(by_url), settings.seen_urls_db_path)
+            by_url = {k: a for k, a in by_url.items() if k in unseen}
+        except Exception as e:
+            logger.warning("seen_url_index_failed", error=str(e))
+
+    articles = list(by_url.values())
+    # Hash and slice once here, after URL dedup, so downstream consumers
+    # (dedup keys, prompt building, DB persistence) reuse these instead of
+    # re-hashing/re-copying multi-KB content per node.
+    for article in articles:
+        article["content_hash"] = hash_content(article["content"])
+        article["content_preview"] = article["content"][:_CONTENT_PREVIEW_CHARS]
+    logger.info(
+        "articles_merged",
+        total=len(articles),
+        url_duplicates_dropped=total_scraped - len(articles),
+        sources=sorted({a["source"] for a in articles}),
+    )
+    merged: dict = {"raw_articles": articles, "current_step": "merged"}
+    if errors:
+        merged["error_log"] = errors
+    return merged
\ No newline at end of file
@@ -8,6 +8,9 @@ prior-art card) stay in sync instead of drifting independently.
 
 from __future__ import annotations
 
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from app.core.logging import get_logger
@@ -25,16 +28,30 @@ CHROME_FLAGS = [
     "--disable-dev-shm-usage",
 ]
 
+# Html2Image pays browser discovery + temp-dir setup in its constructor, so
+# instances are cached per (output_dir, size) instead of rebuilt on every node
+# invocation. Lock-guarded because scraper fan-out means nodes can run from
+# worker threads.
+_HTI_CACHE: dict[tuple[str, tuple[int, int], tuple[str, ...]], object] = {}
+_HTI_LOCK = threading.Lock()
 
-def make_hti(output_dir: Path | str, size: tuple[int, int]):
-    """Construct an Html2Image instance with the shared container-safe flags."""
+
+def make_hti(output_dir: Path | str, size: tuple[int, int], extra_flags: list[str] | None = None):
+    """Return a cached Html2Image instance with the shared container-safe flags."""
     from html2image import Html2Image
 
-    return Html2Image(
-        output_path=str(output_dir),
-        size=size,
-        custom_flags=CHROME_FLAGS,
-    )
+    flags = tuple(extra_flags or ())
+    key = (str(output_dir), size, flags)
+    with _HTI_LOCK:
+        hti = _HTI_CACHE.get(key)
+        if hti is None:
+            hti = Html2Image(
+                output_path=str(output_dir),
+                size=size,
+                custom_flags=CHROME_FLAGS + list(flags),
+            )
+            _HTI_CACHE[key] = hti
+        return hti
 
 
 def capture_slide(hti, html: str, filename: str, label: str, output_dir: Path | str) -> str | None:
@@ -59,3 +76,42 @@ def capture_slide(hti, html: str, filename: str, label: str, output_dir: Path |
         logger.warning("slide_capture_failed", slide=label, attempt=attempt)
     logger.error("slide_capture_gave_up", slide=label)
     return None
+
+
+def capture_slides_parallel(
+    slides: list[tuple[str, str, str]],
+    output_dir: Path | str,
+    size: tuple[int, int],
+    max_workers: int = 5,
+) -> list[str | None]:
+    """
+    Render independent (html, filename, label) slides concurrently.
+
+    Chrome rendering is dominated by layout/paint wait, so fanning the
+    screenshots out over a small thread pool brings wall-clock close to a
+    single render instead of N sequential ones. Parallel headless-Chrome
+    launches sharing a profile directory race on Chrome's SingletonLock,
+    so each worker thread gets its own Html2Image instance pointed at a
+    distinct --user-data-dir.
+
+    Returns one entry per slide, in input order; failed captures are None.
+    """
+    if not slides:
+        return []
+
+    worker_ids = itertools.count()
+    local = threading.local()
+
+    def _capture(slide: tuple[str, str, str]) -> str | None:
+        html, filename, label = slide
+        hti = getattr(local, "hti", None)
+        if hti is None:
+            worker = next(worker_ids)
+            hti = make_hti(
+                output_dir, size, extra_flags=[f"--user-data-dir=/tmp/hti_worker_{worker}"]
+            )
+            local.hti = hti
+        return capture_slide(hti, html, filename, label, output_dir)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(slides))) as executor:
+        return list(executor.map(_capture, slides))
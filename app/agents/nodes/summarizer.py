@@ -9,11 +9,17 @@ Uses tiered model routing:
 
 from __future__ import annotations
 
+import heapq
+import html
 import json
 import re
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
+import msgspec
+import orjson
+from ciso8601 import parse_datetime
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_google_genai import ChatGoogleGenerativeAI
 
@@ -21,12 +27,96 @@ if TYPE_CHECKING:
     from app.agents.state import NewsArticle, PipelineState
 
 from app.core.config import get_settings
+from app.core.dedup import BloomFilter, MinHashIndex, ShingleFilter
 from app.core.logging import get_logger
-from app.core.security import hash_content
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Max characters of summary body shown on a 1200×627 news card (image_gen)
+_BODY_PREVIEW_CHARS = 180
+
+_WS_RE = re.compile(r"\s+")
+
+
+def _strip_fences(text: str) -> str:
+    """Drop the ```json ... ``` fences the LLM sometimes wraps output in.
+    Plain str methods — no regex engine on a hot path for a fixed prefix."""
+    text = text.strip().removeprefix("```json").removeprefix("```")
+    return text.removesuffix("```").strip()
+
+# Content token budgets per article in each prompt. Clipping by tokens
+# instead of characters keeps prompt size (and so cost + latency) predictable
+# regardless of how dense the text is.
+_ANALYZE_CONTENT_TOKENS = 60
+_SUMMARIZE_CONTENT_TOKENS = 200
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    """cl100k_base BPE — a close-enough proxy for Gemini's tokenizer when
+    budgeting prompt size; fetched once and reused."""
+    import tiktoken
+
+    return tiktoken.get_encoding("cl100k_base")
+
+
+@lru_cache(maxsize=4096)
+def _clip_tokens(text: str, max_tokens: int) -> str:
+    """Truncate text to a token budget; falls back to ~4 chars/token char
+    slicing if the encoder can't be loaded (e.g. no network for the BPE file)."""
+    try:
+        ids = _encoding().encode(text)
+    except Exception:
+        return text[: max_tokens * 4]
+    if len(ids) <= max_tokens:
+        return text
+    return _encoding().decode(ids[:max_tokens])
+
+
+# Response schemas enforced server-side via the Gemini response_schema
+# parameter — the model is constrained to this shape instead of us hoping the
+# prompt's prose description sticks. Keyed by name so the cached _llm factory
+# takes a hashable argument.
+_RESPONSE_SCHEMAS: dict[str, dict] = {
+    "summary_list": {
+        "type": "array",
+        "items": {
+            "type": "object",
+            "properties": {
+                "headline": {"type": "string"},
+                "body": {"type": "string"},
+                "category": {"type": "string"},
+                "source_urls": {"type": "array", "items": {"type": "string"}},
+                "outlet_names": {"type": "array", "items": {"type": "string"}},
+                "bias_notes": {"type": "string"},
+                "credibility_score": {"type": "number"},
+            },
+            "required": ["headline", "body", "category", "source_urls", "credibility_score"],
+        },
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def _llm(model: str, temperature: float, schema: str = "") -> ChatGoogleGenerativeAI:
+    """
+    One client per (model, temperature, schema), reused across node invocations.
+
+    Constructing ChatGoogleGenerativeAI per call rebuilt the underlying HTTP
+    client and paid a fresh TCP+TLS handshake to the Gemini endpoint each
+    time; a cached instance keeps its connection pool warm. All summarizer
+    nodes request JSON output, so the mime type is fixed here; `schema` names
+    an optional _RESPONSE_SCHEMAS entry the API enforces on the output.
+    """
+    return ChatGoogleGenerativeAI(
+        model=model,
+        temperature=temperature,
+        google_api_key=settings.google_api_key,
+        response_mime_type="application/json",
+        response_schema=_RESPONSE_SCHEMAS.get(schema),
+    )
+
 
 def _parse_json_tolerant(text: str) -> list[dict]:
     """
@@ -36,6 +126,14 @@ def _parse_json_tolerant(text: str) -> list[dict]:
     - Mid-document syntax errors: unescaped quotes/missing commas inside a
       story body break strict parsing even though the array is complete.
     """
+    # Happy path: orjson parses well-formed output 3-5× faster than stdlib.
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        pass
+
+    # Recovery paths stay on stdlib json — they rely on its positional error
+    # reporting (e.pos, "Extra data") that orjson doesn't provide.
     try:
         return json.loads(text)
     except json.JSONDecodeError as e:
@@ -83,38 +181,139 @@ def _parse_json_tolerant(text: str) -> list[dict]:
 
 
 # ═══════════════════════════════════════════════════════════════
-# Deduplication — content-hash based + title similarity
+# LLM output schemas — msgspec Structs decode + validate in one pass
+# ═══════════════════════════════════════════════════════════════
+class _ClassificationItem(msgspec.Struct):
+    """One element of analyze_node's classification array."""
+
+    index: int = -1
+    category: str = "Other"
+    relevance_score: float = 0.5
+
+
+class _SummaryItem(msgspec.Struct):
+    """One element of summarize_node's summary array; unknown keys ignored."""
+
+    headline: str = ""
+    body: str = ""
+    category: str = "Industry"
+    source_urls: list[str] = []
+    source_url: str = ""  # legacy single-url key older prompts produced
+    outlet_names: list[str] = []
+    bias_notes: str = ""
+    credibility_score: float = 0.5
+
+
+def _decode_items(raw_text: str, item_type: type) -> list:
+    """
+    Decode an LLM JSON array into typed structs. msgspec validates and
+    type-coerces in one C-level pass, so malformed fields surface here
+    instead of deeper in the pipeline. Malformed payloads fall back to the
+    tolerant parser with per-item conversion, dropping unconvertible items.
+    """
+    try:
+        return msgspec.json.decode(
+            raw_text.encode("utf-8"), type=list[item_type], strict=False
+        )
+    except msgspec.DecodeError:
+        pass
+
+    items = []
+    for obj in _parse_json_tolerant(raw_text):
+        try:
+            items.append(msgspec.convert(obj, type=item_type, strict=False))
+        except Exception:
+            continue
+    return items
+
+
+# ═══════════════════════════════════════════════════════════════
+# Deduplication — Bloom filter over content + title keys, plus an
+# optional cross-run shingle filter for near-duplicates
 # ═══════════════════════════════════════════════════════════════
+_shingle_filter: ShingleFilter | None = None
+
+
+def _cross_run_filter() -> ShingleFilter | None:
+    """Lazily load the persistent shingle filter; None when not configured."""
+    global _shingle_filter
+    if not settings.dedup_bloom_path:
+        return None
+    if _shingle_filter is None:
+        _shingle_filter = ShingleFilter(settings.dedup_bloom_path)
+    return _shingle_filter
+
+
 def deduplicate_node(state: PipelineState) -> dict:
-    """Remove duplicate articles using content hashing and title overlap."""
+    """Remove duplicate articles using content hashing and MinHash similarity."""
     raw = state.get("raw_articles", [])
-    seen_hashes: set[str] = set()
-    seen_titles: set[str] = set()
+    bloom = BloomFilter(capacity=max(10_000, 2 * len(raw)))
+    minhash = MinHashIndex(threshold=0.85)
+    cross_run = _cross_run_filter()
     unique: list[NewsArticle] = []
+    seen_urls: set[str] = set()
+    near_dups = 0
 
     for article in raw:
-        content_hash = hash_content(article["content"])
-        title_lower = article["title"].lower().strip()
-
-        # Skip exact content duplicates
-        if content_hash in seen_hashes:
+        # Cheapest gate first: the same URL collected twice (RSS + Tavily
+        # overlap) is dropped on a set probe before any content
+        # normalisation, MinHash or shingling runs.
+        url = article["url"]
+        if url in seen_urls:
             continue
+        seen_urls.add(url)
 
-        # Skip near-identical titles (simple approach; upgrade to fuzzy matching later)
-        if title_lower in seen_titles:
+        # Fast path: exact content duplicates, normalized so a copy that
+        # differs only in case or whitespace doesn't slip past the hash
+        normalized = _WS_RE.sub(" ", article["content"]).casefold().strip()
+        content_key = b"c:" + normalized.encode("utf-8")
+        if content_key in bloom:
             continue
+        bloom.add(content_key)
+
+        # MinHash over title + content head catches near-duplicates within
+        # the run — title variants and lightly reworded syndicated copies
+        # that exact title matching used to miss.
+        sig = MinHashIndex.signature(
+            article["title"].lower().strip()
+            + " "
+            + (article.get("content_preview") or article["content"])[:500].lower()
+        )
+        if sig is not None:
+            if minhash.query(sig):
+                near_dups += 1
+                continue
+            minhash.add(sig)
+
+        # Cross-run pass: 13-token shingles against the persistent filter
+        # catch rewrites of stories already published in earlier runs.
+        if cross_run is not None:
+            shingles = ShingleFilter.shingles(article["content"])
+            if cross_run.is_duplicate(shingles):
+                near_dups += 1
+                continue
+            cross_run.add(shingles)
 
-        seen_hashes.add(content_hash)
-        seen_titles.add(title_lower)
         unique.append(article)
 
+    if cross_run is not None:
+        cross_run.save()
+
     logger.info(
         "deduplication_complete",
         raw_count=len(raw),
         unique_count=len(unique),
         removed=len(raw) - len(unique),
+        near_dups=near_dups,
     )
-    return {"deduplicated_articles": unique, "current_step": "deduplicated"}
+    # Prune the raw pool now that the deduplicated list supersedes it —
+    # nothing downstream reads raw_articles, and every later checkpoint
+    # would otherwise re-pickle it. The reducer treats None as clear.
+    return {
+        "deduplicated_articles": unique,
+        "raw_articles": None,
+        "current_step": "deduplicated",
+    }
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -126,73 +325,150 @@ _VALID_CATEGORIES = frozenset(
 )
 
 
-def analyze_node(state: PipelineState) -> dict:
+_ANALYZE_SYSTEM_PROMPT = (
+    "You are a news analyst. For each article below, output a JSON array "
+    "where each element has: index (int), category (one of: LLM, Computer Vision, "
+    "Robotics, AI Policy, AI Startup, Research Paper, Industry News, Other), "
+    "and relevance_score (0.0-1.0, how significant this is for the general public). "
+    "Prioritise stories with broad real-world impact over niche technical updates. "
+    "Output ONLY valid JSON, no markdown fences."
+)
+
+# Articles per classification call — small enough that each response parses
+# fast and a truncated/malformed reply loses one chunk, not the whole batch
+_ANALYZE_CHUNK_SIZE = 8
+
+# Rule-based pre-classification — articles these catch never reach the LLM.
+# Kept deliberately narrow: a wrong cheap label is worse than a billed one.
+_SOURCE_CATEGORIES = {"arxiv": "Research Paper"}
+_TITLE_RULES: list[tuple[re.Pattern, str]] = [
+    (re.compile(r"\braises?\s+\$|\bseries\s+[a-e]\b|\bfunding\s+round\b|\bvaluation\b", re.I),
+     "AI Startup"),
+    (re.compile(r"\barxiv\b|\bresearch\s+paper\b|\bpreprint\b", re.I), "Research Paper"),
+    (re.compile(r"\brobots?\b|\brobotics\b|\bhumanoid\b", re.I), "Robotics"),
+    (re.compile(r"\bai\s+act\b|\bregulators?\b|\bregulation\b|\bexecutive\s+order\b", re.I),
+     "AI Policy"),
+]
+
+
+def _rule_category(article: dict) -> str | None:
+    """Cheap classification for unambiguous articles; None when the LLM
+    should decide."""
+    cat = _SOURCE_CATEGORIES.get(article.get("source", ""))
+    if cat is not None:
+        return cat
+    title = article.get("title", "")
+    for pattern, rule_cat in _TITLE_RULES:
+        if pattern.search(title):
+            return rule_cat
+    return None
+
+
+def _analyze_chunk_prompt(chunk: list[dict]) -> str:
+    """Build one chunk's article listing as appended parts + a single join —
+    skips the per-line intermediate string a joined f-string generator pays."""
+    parts: list[str] = []
+    append = parts.append
+    for i, a in enumerate(chunk):
+        append(f"[{i}] ")
+        append(a["title"])
+        append(" — ")
+        append(_clip_tokens(a.get("content_preview") or a["content"], _ANALYZE_CONTENT_TOKENS))
+        append("\n")
+    return "".join(parts)
+
+
+def _response_text(response) -> str:
+    """Flatten an LLM response into fence-stripped text ready for parsing."""
+    content = response.content
+    if isinstance(content, list):
+        raw_text = "".join(
+            p.get("text", "") if isinstance(p, dict) else str(p) for p in content
+        ).strip()
+    else:
+        raw_text = content.strip()
+    return _strip_fences(raw_text)
+
+
+async def analyze_node(state: PipelineState) -> dict:
     """
     Categorise articles into topics and rank by significance.
-    Uses Gemini Flash (mid tier) for classification. Enriches each article
-    in-place with 'category' and 'relevance_score' fields.
+    Uses Gemini Flash (mid tier) for classification, batched over chunks of
+    articles in flight concurrently. Enriches each article in-place with
+    'category' and 'relevance_score' fields.
     """
     articles = state.get("deduplicated_articles", [])
     if not articles:
         return {"error_log": ["Analyze: no articles to process"]}
 
     try:
-        llm = ChatGoogleGenerativeAI(
-            model=settings.model_classifier,
-            temperature=0,
-            google_api_key=settings.google_api_key,
-            response_mime_type="application/json",
-        )
+        llm = _llm(settings.model_classifier, temperature=0)
 
         batch = articles[:50]
-        article_list = "\n".join(
-            f"[{i}] {a['title']} — {a['content'][:200]}" for i, a in enumerate(batch)
-        )
 
-        messages = [
-            SystemMessage(
-                content=(
-                    "You are a news analyst. For each article below, output a JSON array "
-                    "where each element has: index (int), category (one of: LLM, Computer Vision, "
-                    "Robotics, AI Policy, AI Startup, Research Paper, Industry News, Other), "
-                    "and relevance_score (0.0-1.0, how significant this is for the general public). "
-                    "Prioritise stories with broad real-world impact over niche technical updates. "
-                    "Output ONLY valid JSON, no markdown fences."
-                )
-            ),
-            HumanMessage(content=article_list),
+        # Rule pass first — arXiv papers, funding announcements etc. are
+        # categorised in Python and never billed; only ambiguous articles
+        # go to the LLM. Rule-labelled articles keep the neutral 0.5
+        # relevance default that _rank_score falls back to.
+        todo: list[dict] = []
+        for a in batch:
+            cat = _rule_category(a)
+            if cat is not None:
+                a["category"] = cat
+            else:
+                todo.append(a)
+
+        if not todo:
+            logger.info(
+                "analysis_complete",
+                articles_analysed=len(batch),
+                rule_classified=len(batch),
+                llm_classified=0,
+            )
+            return {"deduplicated_articles": articles, "current_step": "analyzed"}
+
+        chunks = [
+            todo[i : i + _ANALYZE_CHUNK_SIZE]
+            for i in range(0, len(todo), _ANALYZE_CHUNK_SIZE)
+        ]
+        message_lists = [
+            [
+                SystemMessage(content=_ANALYZE_SYSTEM_PROMPT),
+                HumanMessage(content=_analyze_chunk_prompt(chunk)),
+            ]
+            for chunk in chunks
         ]
 
-        response = llm.invoke(messages)
-        content = response.content
-        if isinstance(content, list):
-            raw_text = "".join(
-                p.get("text", "") if isinstance(p, dict) else str(p) for p in content
-            ).strip()
-        else:
-            raw_text = content.strip()
-        raw_text = re.sub(r"^```(?:json)?\s*", "", raw_text)
-        raw_text = re.sub(r"\s*```$", "", raw_text).strip()
+        responses = await llm.abatch(
+            message_lists, config={"max_concurrency": settings.max_concurrent_classifier}
+        )
 
-        parsed: list[dict] = _parse_json_tolerant(raw_text)
-        enriched = list(articles)  # shallow copy so we don't mutate state directly
-        for item in parsed:
-            idx = item.get("index")
-            if not isinstance(idx, int) or idx >= len(enriched):
+        # Enrich article dicts in place — a {**article, ...} spread per item
+        # would copy every key (including multi-KB content) just to add two.
+        # Chunk entries alias the state dicts, so indices stay chunk-local.
+        enriched_count = 0
+        for chunk, response in zip(chunks, responses):
+            try:
+                parsed = _decode_items(_response_text(response), _ClassificationItem)
+            except Exception as e:
+                logger.warning("analyze_chunk_parse_failed", error=str(e))
                 continue
-            cat = item.get("category", "Other")
-            enriched[idx] = {
-                **enriched[idx],
-                "category": cat if cat in _VALID_CATEGORIES else "Other",
-                "relevance_score": float(item.get("relevance_score", 0.5)),
-            }
+            for item in parsed:
+                if not 0 <= item.index < len(chunk):
+                    continue
+                cat = item.category
+                chunk[item.index]["category"] = cat if cat in _VALID_CATEGORIES else "Other"
+                chunk[item.index]["relevance_score"] = float(item.relevance_score)
+                enriched_count += 1
 
         logger.info(
             "analysis_complete",
             articles_analysed=len(batch),
-            enriched=len(parsed),
+            rule_classified=len(batch) - len(todo),
+            chunks=len(chunks),
+            enriched=enriched_count,
         )
-        return {"deduplicated_articles": enriched, "current_step": "analyzed"}
+        return {"deduplicated_articles": articles, "current_step": "analyzed"}
 
     except Exception as e:
         logger.error("analyze_error", error=str(e))
@@ -202,11 +478,26 @@ def analyze_node(state: PipelineState) -> dict:
 # ═══════════════════════════════════════════════════════════════
 # Ranking — composite score for article prioritisation
 # ═══════════════════════════════════════════════════════════════
-def _rank_score(article: dict) -> float:
+@lru_cache(maxsize=8192)
+def _published_ts(raw: str) -> float | None:
+    """Epoch timestamp for an ISO-8601 date; cached — the same timestamps
+    recur across articles and across re-rank passes within a run. ciso8601
+    handles the trailing Z natively and parses ~5-10x faster than stdlib."""
+    try:
+        dt = parse_datetime(raw)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt.timestamp()
+
+
+def _rank_score(article: dict, now_ts: float) -> float:
     """
     Composite ranking: 35% credibility + 40% relevance + 25% recency.
 
-    Recency decays linearly from 1.0 (today) to 0.0 (7+ days old).
+    Recency decays linearly from 1.0 (today) to 0.0 (7+ days old), measured
+    against `now_ts` — computed once by the caller rather than per article.
     Falls back gracefully when optional fields are absent.
     """
     credibility = float(article.get("credibility_score", 0.5))
@@ -215,14 +506,10 @@ def _rank_score(article: dict) -> float:
     recency = 0.5  # neutral default
     pub_raw = article.get("published_at", "")
     if pub_raw:
-        try:
-            pub_dt = datetime.fromisoformat(pub_raw.replace("Z", "+00:00"))
-            if pub_dt.tzinfo is None:
-                pub_dt = pub_dt.replace(tzinfo=UTC)
-            age_days = (datetime.now(UTC) - pub_dt).total_seconds() / 86400
+        pub_ts = _published_ts(pub_raw)
+        if pub_ts is not None:
+            age_days = (now_ts - pub_ts) / 86400
             recency = max(0.0, 1.0 - age_days / 7.0)
-        except ValueError:
-            pass
 
     return 0.35 * credibility + 0.40 * relevance + 0.25 * recency
 
@@ -248,7 +535,45 @@ Rank by public significance — lead with the story that affects the most people
 Output ONLY valid JSON, no markdown."""
 
 
-def summarize_node(state: PipelineState) -> dict:
+def _outlet_label(article: dict) -> str:
+    """Return a human-readable outlet name from the article URL."""
+    from urllib.parse import urlparse
+    try:
+        domain = urlparse(article.get("url", "")).netloc.lower().replace("www.", "")
+        # Use feed name embedded in rss source tag when available
+        src = article.get("source", "")
+        if src.startswith("rss:"):
+            return src.replace("rss:", "").replace("_", " ").title()
+        parts = domain.split(".")
+        if len(parts) >= 2:
+            return parts[-2].title()
+        return domain or "Unknown"
+    except Exception:
+        return "Unknown"
+
+
+def _article_context(top_articles: list[dict]) -> str:
+    """Format the top-k articles into the prompt context block."""
+    # Appended parts + single join, same idiom as _analyze_chunk_prompt
+    parts: list[str] = []
+    append = parts.append
+    for a in top_articles:
+        if parts:
+            append("\n---\n")
+        append("Title: ")
+        append(a["title"])
+        append("\nOutlet: ")
+        append(_outlet_label(a))
+        append("\nURL: ")
+        append(a["url"])
+        append("\nContent: ")
+        append(
+            _clip_tokens(a.get("content_preview") or a["content"], _SUMMARIZE_CONTENT_TOKENS)
+        )
+    return "".join(parts)
+
+
+async def summarize_node(state: PipelineState) -> dict:
     """Generate polished summaries from deduplicated, scored articles."""
     articles = state.get("deduplicated_articles", [])
     feedback = state.get("feedback", "")
@@ -256,87 +581,84 @@ def summarize_node(state: PipelineState) -> dict:
         return {"error_log": ["Summarize: no articles to process"]}
 
     try:
-        llm = ChatGoogleGenerativeAI(
-            model=settings.model_summarizer,
-            temperature=0.3,
-            google_api_key=settings.google_api_key,
-            response_mime_type="application/json",
+        llm = _llm(settings.model_summarizer, temperature=0.3, schema="summary_list")
+
+        # Top-k by composite score (credibility + relevance + recency) —
+        # nlargest is O(N log k) for k << N vs sorting everything
+        now_ts = datetime.now(UTC).timestamp()
+        top_articles = heapq.nlargest(
+            settings.max_articles_per_run,
+            articles,
+            key=lambda a: _rank_score(a, now_ts),
         )
 
-        # Sort by composite score: credibility + relevance + recency
-        sorted_articles = sorted(articles, key=_rank_score, reverse=True)
-        top_articles = sorted_articles[: settings.max_articles_per_run]
+        # The top-k set doesn't change between revise rounds (scores are
+        # fixed after analysis), so the context string built on the first
+        # pass is reused verbatim on revisions instead of re-formatting
+        # ~10KB of article text per loop.
+        article_context = state.get("article_context") or _article_context(top_articles)
 
-        def _outlet_label(article: dict) -> str:
-            """Return a human-readable outlet name from the article URL."""
-            from urllib.parse import urlparse
-            try:
-                domain = urlparse(article.get("url", "")).netloc.lower().replace("www.", "")
-                # Use feed name embedded in rss source tag when available
-                src = article.get("source", "")
-                if src.startswith("rss:"):
-                    return src.replace("rss:", "").replace("_", " ").title()
-                parts = domain.split(".")
-                if len(parts) >= 2:
-                    return parts[-2].title()
-                return domain or "Unknown"
-            except Exception:
-                return "Unknown"
-
-        article_context = "\n---\n".join(
-            f"Title: {a['title']}\nOutlet: {_outlet_label(a)}\nURL: {a['url']}\n"
-            f"Content: {a['content'][:800]}"
-            for a in top_articles
-        )
-
-        system_prompt = SUMMARIZE_SYSTEM_PROMPT
+        # The system prompt is sent verbatim every call so Gemini's implicit
+        # prompt cache can reuse its prefill across runs; anything per-run
+        # (feedback, articles) goes in the human message after it.
+        user_parts = []
         if feedback:
-            system_prompt += f"\n\nHuman feedback from previous draft: {feedback}"
+            user_parts.append(f"Human feedback from previous draft: {feedback}\n\n")
+        user_parts.append(f"Here are today's articles:\n\n{article_context}")
 
         messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=f"Here are today's articles:\n\n{article_context}"),
+            SystemMessage(content=SUMMARIZE_SYSTEM_PROMPT),
+            HumanMessage(content="".join(user_parts)),
         ]
 
-        response = llm.invoke(messages)
-        content = response.content
-        if isinstance(content, list):
-            raw_text = "".join(
-                p.get("text", "") if isinstance(p, dict) else str(p) for p in content
-            ).strip()
-        else:
-            raw_text = content.strip()
+        response = await llm.ainvoke(messages)
+        raw_text = _response_text(response)
 
+        usage = getattr(response, "usage_metadata", None) or {}
         logger.info(
             "summarization_complete",
             articles_input=len(top_articles),
             response_length=len(raw_text),
+            # Non-zero confirms the implicit prompt cache hit on the prefix
+            cached_input_tokens=(usage.get("input_token_details") or {}).get("cache_read", 0),
         )
 
-        # Strip markdown fences if the model wraps in ```json ... ```
-        raw_text = re.sub(r"^```(?:json)?\s*", "", raw_text)
-        raw_text = re.sub(r"\s*```$", "", raw_text).strip()
-
-        parsed: list[dict] = _parse_json_tolerant(raw_text)
-        summaries = [
-            {
-                "headline": item.get("headline", ""),
-                "body": item.get("body", ""),
-                "category": item.get("category", "Industry"),
-                # Accept both old single-url and new array format
-                "source_urls": (
-                    item["source_urls"] if isinstance(item.get("source_urls"), list)
-                    else [item.get("source_url") or item.get("source_urls") or ""]
-                ),
-                "outlet_names": item.get("outlet_names") or [],
-                "bias_notes": item.get("bias_notes") or "",
-                "credibility_score": float(item.get("credibility_score", 0.5)),
-            }
-            for item in parsed
-            if isinstance(item, dict)
-        ]
+        summaries = []
+        for item in _decode_items(raw_text, _SummaryItem):
+            headline = item.headline
+            body = item.body
+            cred = float(item.credibility_score)
+            # Clipped once here so card rendering doesn't re-slice the full
+            # body on every downstream pass
+            body_preview = body[:_BODY_PREVIEW_CHARS]
+            summaries.append(
+                {
+                    "headline": headline,
+                    "body": body,
+                    "body_preview": body_preview,
+                    # HTML-escaped once here; both the newsletter and the news
+                    # card templates render these with |safe instead of each
+                    # re-escaping the same strings per render
+                    "headline_html": html.escape(headline),
+                    "body_html": html.escape(body),
+                    "body_preview_html": html.escape(body_preview),
+                    "category": item.category,
+                    # Accept both old single-url and new array format
+                    "source_urls": item.source_urls or [item.source_url],
+                    "outlet_names": item.outlet_names,
+                    "bias_notes": item.bias_notes,
+                    "credibility_score": cred,
+                    # Int basis points (0-1000) — card rendering formats this
+                    # with integer division instead of float percent-formatting
+                    "credibility_bp": int(cred * 1000),
+                }
+            )
         logger.info("summaries_parsed", count=len(summaries))
-        return {"summaries": summaries, "current_step": "summarized"}
+        return {
+            "summaries": summaries,
+            "article_context": article_context,
+            "current_step": "summarized",
+        }
 
     except Exception as e:
         logger.error("summarize_error", error=str(e))
@@ -368,12 +690,7 @@ def cluster_stories_node(state) -> dict:
         return {}
 
     try:
-        llm = ChatGoogleGenerativeAI(
-            model=settings.model_classifier,
-            temperature=0,
-            google_api_key=settings.google_api_key,
-            response_mime_type="application/json",
-        )
+        llm = _llm(settings.model_classifier, temperature=0)
 
         batch = articles[:60]
         article_list = "\n".join(
@@ -386,19 +703,14 @@ def cluster_stories_node(state) -> dict:
         ]
 
         response = llm.invoke(messages)
-        content = response.content
-        raw_text = content if isinstance(content, str) else "".join(
-            p.get("text", "") if isinstance(p, dict) else str(p) for p in content
-        )
-        raw_text = re.sub(r"^```(?:json)?\s*", "", raw_text.strip())
-        raw_text = re.sub(r"\s*```$", "", raw_text).strip()
+        raw_text = _response_text(response)
 
         parsed: list[dict] = _parse_json_tolerant(raw_text)
-        enriched = list(articles)
+        enriched = articles
         for item in parsed:
             idx = item.get("index")
             if isinstance(idx, int) and idx < len(enriched):
-                enriched[idx] = {**enriched[idx], "story_cluster_id": item.get("cluster_id", "")}
+                enriched[idx]["story_cluster_id"] = item.get("cluster_id", "")
 
         logger.info("clustering_complete", clusters=len({a.get("story_cluster_id") for a in enriched}))
         return {"deduplicated_articles": enriched, "current_step": "clustered"}
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import base64
+import hashlib
+import time
 from pathlib import Path
 from typing import Literal
 
@@ -10,6 +13,7 @@ from langgraph.checkpoint.memory import InMemorySaver
 from langgraph.graph import END, START, StateGraph
 from pydantic import BaseModel, Field
 
+from app.agents.nodes._templates import get_template
 from app.agents.nodes.ablation_spec import extract_ablation_spec_node
 from app.agents.nodes.approval import human_approval_node
 from app.agents.nodes.architecture_diagram import architecture_diagram_node
@@ -29,6 +33,7 @@ from app.agents.nodes.prior_art import prior_art_node
 from app.agents.nodes.relevance import relevance_gate_node
 from app.agents.nodes.research_carousel import research_carousel_node
 from app.agents.nodes.scraper import scrape_arxiv_node
+from app.agents.nodes.screenshot_utils import capture_slide, make_hti
 from app.agents.nodes.svg_gauge import ACCENT_CONTRIBUTION, render_bar_strip_svg, render_gauge_svg
 from app.agents.nodes.text_budget import enforce_char_budgets
 from app.agents.nodes.text_utils import normalize_model_strings, normalize_text, normalize_title
@@ -36,10 +41,19 @@ from app.agents.nodes.verdict import calibrate_verdict
 from app.agents.state import PipelineState
 from app.core.config import get_settings
 from app.core.logging import get_logger
+from app.services.email_service import EmailService
+from app.services.linkedin_service import LinkedInService
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Optional premium diagram renderer — resolved once at import instead of a
+# try/except ImportError on every visual-node invocation
+try:
+    import paperbanana as pb  # type: ignore[import]
+except ImportError:
+    pb = None
+
 
 # ── Pydantic Schemas ─────────────────────────────────────────────────────────
 
@@ -173,7 +187,62 @@ _render_bar_strip_svg = render_bar_strip_svg
 
 # ── 1. Intelligence Nodes ────────────────────────────────────────────────────
 
-def select_paper_node(state: PipelineState) -> dict:
+_SELECT_PAPER_SYSTEM = (
+    "You are the Principal Investigator of an elite AI lab. Read these recent ArXiv paper abstracts. "
+    "Select the SINGLE most groundbreaking, highly-novel paper that engineers and researchers absolutely "
+    "must know about. Favor novel architectures and major benchmark breakthroughs over minor optimizations."
+)
+
+# Explicit Gemini context caches already created this process, keyed by a hash
+# of the abstracts block: key -> (cache resource name, monotonic create time).
+# Retries and revise loops within the TTL resend identical abstracts, so the
+# prefill for the block that dominates the request is paid once.
+_CONTEXT_CACHE: dict[str, tuple[str, float]] = {}
+_CONTEXT_CACHE_TTL_SECONDS = 600
+# Explicit caching has a ~1024-token minimum on Flash; don't bother below it
+_CONTEXT_CACHE_MIN_CHARS = 4096
+
+
+def _cached_abstracts(papers_text: str) -> str | None:
+    """Return a Gemini explicit-cache resource name covering the selection
+    system prompt plus the abstracts block, creating it on first sight.
+    Returns None (caller sends the full prompt inline) when the block is too
+    small to qualify or cache creation fails — selection still works, it just
+    pays full prefill."""
+    if len(papers_text) < _CONTEXT_CACHE_MIN_CHARS:
+        return None
+
+    key = hashlib.blake2b(papers_text.encode(), digest_size=16).hexdigest()
+    hit = _CONTEXT_CACHE.get(key)
+    now = time.monotonic()
+    if hit and now - hit[1] < _CONTEXT_CACHE_TTL_SECONDS:
+        return hit[0]
+
+    try:
+        from google import genai
+        from google.genai import types
+
+        client = genai.Client(api_key=settings.google_api_key)
+        cache = client.caches.create(
+            model="gemini-2.5-flash",
+            config=types.CreateCachedContentConfig(
+                system_instruction=_SELECT_PAPER_SYSTEM,
+                contents=[
+                    types.Content(role="user", parts=[types.Part.from_text(text=papers_text)])
+                ],
+                ttl=f"{_CONTEXT_CACHE_TTL_SECONDS}s",
+            ),
+        )
+    except Exception as e:
+        logger.warning("context_cache_create_failed", error=str(e))
+        return None
+
+    _CONTEXT_CACHE[key] = (cache.name, now)
+    logger.info("context_cache_created", cache=cache.name, chars=len(papers_text))
+    return cache.name
+
+
+async def select_paper_node(state: PipelineState) -> dict:
     """
     Select the single best paper to deep-dive into.
 
@@ -210,26 +279,36 @@ def select_paper_node(state: PipelineState) -> dict:
     # ── Fallback: LLM selection ────────────────────────────────────────
     logger.info("using_llm_fallback_selection", reason="no_rankings_available")
     papers_text = "\n\n".join([
-        f"URL: {a['url']}\nTitle: {a['title']}\nAbstract: {a['content'][:1000]}"
+        f"URL: {a['url']}\nTitle: {a['title']}\n"
+        f"Abstract: {(a.get('content_preview') or a['content'])[:1000]}"
         for a in articles[:30]
     ])
 
+    cache_name = _cached_abstracts(papers_text)
     llm = ChatGoogleGenerativeAI(
         model="gemini-2.5-flash",
         temperature=0.2,
         api_key=settings.google_api_key,
+        cached_content=cache_name,
     ).with_structured_output(PaperSelection)
 
-    prompt = ChatPromptTemplate.from_messages([
-        ("system",
-         "You are the Principal Investigator of an elite AI lab. Read these recent ArXiv paper abstracts. "
-         "Select the SINGLE most groundbreaking, highly-novel paper that engineers and researchers absolutely "
-         "must know about. Favor novel architectures and major benchmark breakthroughs over minor optimizations."),
-        ("user", "{papers}"),
-    ])
+    if cache_name:
+        # System prompt and abstracts live server-side in the cache; the
+        # request itself only carries the short instruction below.
+        prompt = ChatPromptTemplate.from_messages([
+            ("user", "{papers}"),
+        ])
+        prompt_input = "Select the single best paper from the cached abstracts above."
+    else:
+        prompt = ChatPromptTemplate.from_messages([
+            ("system", _SELECT_PAPER_SYSTEM),
+            ("user", "{papers}"),
+        ])
+        prompt_input = papers_text
 
-    result = (prompt | llm).invoke({"papers": papers_text})
-    chosen_paper = next((a for a in articles if a["url"] == result.chosen_url), articles[0])
+    result = await (prompt | llm).ainvoke({"papers": prompt_input})
+    url_index = {a["url"]: a for a in articles}
+    chosen_paper = url_index.get(result.chosen_url, articles[0])
     logger.info("paper_selected_by_llm", title=chosen_paper["title"])
     clean_paper = {**chosen_paper, "title": normalize_title(chosen_paper["title"])}
     return {"chosen_research_paper": clean_paper, "current_step": "paper_selected"}
@@ -454,7 +533,20 @@ def _build_research_article_html(paper: dict, analysis: "RichDeepAnalysis") -> s
 """
 
 
-def deep_analysis_node(state: PipelineState) -> dict:
+_DEEP_ANALYSIS_SYSTEM = (
+    "You are a senior AI research analyst reviewing and explaining a paper written by others. "
+    "You are NOT the author — you are breaking down their work for a technical audience "
+    "(PhDs, ML Engineers, Staff Engineers). "
+    "ALWAYS describe findings in third person: 'the authors propose', 'the researchers show', "
+    "'the paper demonstrates', 'the team finds', 'the study reports'. "
+    "NEVER use 'we', 'our', or 'I' to refer to the paper's contributions or methods. "
+    "Be specific, calibrated, and honest. Avoid marketing speak or generic praise. "
+    "If the content is only an abstract, extract what you can and clearly note where "
+    "full-paper details are needed."
+)
+
+
+async def deep_analysis_node(state: PipelineState) -> dict:
     """Deep analysis with Gemini Pro: extracts 16-field rich analysis, LLM LinkedIn draft, full article HTML."""
     logger.info("research_node_running", step="deep_analysis")
     paper = state.get("chosen_research_paper")
@@ -473,6 +565,8 @@ def deep_analysis_node(state: PipelineState) -> dict:
         )
         content = f"{content}\n\n{extra_sections}"
 
+    # Kept out of the system message so the static prefix stays byte-identical
+    # across runs and Gemini's implicit prompt cache can reuse its prefill
     low_confidence_note = (
         ""
         if full_text_available
@@ -492,21 +586,12 @@ def deep_analysis_node(state: PipelineState) -> dict:
     ).with_structured_output(RichDeepAnalysis)
 
     analysis_prompt = ChatPromptTemplate.from_messages([
-        ("system",
-         "You are a senior AI research analyst reviewing and explaining a paper written by others. "
-         "You are NOT the author — you are breaking down their work for a technical audience "
-         "(PhDs, ML Engineers, Staff Engineers). "
-         "ALWAYS describe findings in third person: 'the authors propose', 'the researchers show', "
-         "'the paper demonstrates', 'the team finds', 'the study reports'. "
-         "NEVER use 'we', 'our', or 'I' to refer to the paper's contributions or methods. "
-         "Be specific, calibrated, and honest. Avoid marketing speak or generic praise. "
-         "If the content is only an abstract, extract what you can and clearly note where "
-         "full-paper details are needed." + low_confidence_note),
-        ("user", "Title: {title}\n\nPaper Content:\n{content}"),
+        ("system", _DEEP_ANALYSIS_SYSTEM),
+        ("user", "Title: {title}\n\nPaper Content:\n{content}" + low_confidence_note),
     ])
 
     try:
-        analysis: RichDeepAnalysis = (analysis_prompt | analysis_llm).invoke({
+        analysis: RichDeepAnalysis = await (analysis_prompt | analysis_llm).ainvoke({
             "title": paper["title"],
             "content": content,
         })
@@ -545,7 +630,7 @@ def deep_analysis_node(state: PipelineState) -> dict:
     results_text = "\n".join(f"• {r}" for r in analysis.quantitative_results)
 
     try:
-        linkedin_response = (linkedin_prompt | flash_llm).invoke({
+        linkedin_response = await (linkedin_prompt | flash_llm).ainvoke({
             "title": paper["title"],
             "core_problem": analysis.core_problem,
             "methodology": analysis.methodology,
@@ -758,35 +843,30 @@ def paperbanana_visual_node(state: PipelineState) -> dict:
     if comparison_card and Path(comparison_card).exists():
         image_paths.append(comparison_card)
 
-    try:
-        # 1. Try PaperBanana (premium path)
-        import paperbanana as pb  # type: ignore[import]
-        from pathlib import Path as _Path
-
-        output_dir = _Path("./output/images")
-        output_dir.mkdir(parents=True, exist_ok=True)
-        filename = str(output_dir / f"diagram_{run_id}.png")
-
-        agent = pb.PaperBananaAgent(api_key=settings.google_api_key)
-        diagram_path = agent.generate_architecture_diagram(
-            title=paper.get("title", ""),
-            methodology_text=analysis.get("methodology", ""),
-            output_path=filename,
-            style="cyberpunk_dark",
-        )
-        image_paths.insert(0, diagram_path)
-        logger.info("paperbanana_success", path=diagram_path)
+    if pb is not None:
+        # 1. PaperBanana (premium path)
+        try:
+            output_dir = Path("./output/images")
+            output_dir.mkdir(parents=True, exist_ok=True)
+            filename = str(output_dir / f"diagram_{run_id}.png")
+
+            agent = pb.PaperBananaAgent(api_key=settings.google_api_key)
+            diagram_path = agent.generate_architecture_diagram(
+                title=paper.get("title", ""),
+                methodology_text=analysis.get("methodology", ""),
+                output_path=filename,
+                style="cyberpunk_dark",
+            )
+            image_paths.insert(0, diagram_path)
+            logger.info("paperbanana_success", path=diagram_path)
+        except Exception as e:
+            logger.error("visual_generation_failed", error=str(e))
 
-    except ImportError:
+    else:
         # 2. Fallback: html2image + enhanced Jinja2 template
         logger.warning("paperbanana_sdk_missing", hint="Falling back to html2image cyberpunk card.")
 
         try:
-            from jinja2 import Environment, FileSystemLoader, select_autoescape
-
-            from app.agents.nodes.screenshot_utils import capture_slide, make_hti
-
-            TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
             OUTPUT_DIR = Path("./output/images")
             OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -815,11 +895,7 @@ def paperbanana_visual_node(state: PipelineState) -> dict:
 
             # ── Render enhanced card ────────────────────────────────
             hti = make_hti(OUTPUT_DIR, (1200, 800))
-            env = Environment(
-                loader=FileSystemLoader(str(TEMPLATE_DIR)),
-                autoescape=select_autoescape(["html"]),
-            )
-            template = env.get_template("research_card.html")
+            template = get_template("research_card.html")
             html = template.render(
                 title=paper.get("title", "Deep Tech Research Update"),
                 core_problem=analysis.get("core_problem", ""),
@@ -842,18 +918,13 @@ def paperbanana_visual_node(state: PipelineState) -> dict:
         except Exception as fallback_error:
             logger.error("fallback_image_gen_failed", error=str(fallback_error))
 
-    except Exception as e:
-        logger.error("visual_generation_failed", error=str(e))
-
     return {"image_paths": image_paths, "current_step": "visuals_generated"}
 
 
 # ── 2. Publishing Nodes ──────────────────────────────────────────────────────
 
-def _publish_research_node(state: PipelineState) -> dict:
+async def _publish_research_node(state: PipelineState) -> dict:
     """Send email newsletter + publish LinkedIn carousel (document post)."""
-    from app.services.email_service import EmailService
-
     run_id = state["run_id"]
     image_paths = state.get("image_paths", [])
 
@@ -870,28 +941,27 @@ def _publish_research_node(state: PipelineState) -> dict:
         p for p in research_slides if Path(p).exists()
     ] or None
 
-    try:
-        EmailService().send_newsletter(
-            html_content=state.get("newsletter_html", ""),
-            subject="🔬 AI Research Analyst: Deep Dive",
-            image_paths=newsletter_attachments,
-        )
-        logger.info("research_newsletter_sent", run_id=run_id)
-    except Exception as e:
-        logger.error("research_newsletter_send_failed", run_id=run_id, error=str(e))
+    async def _send_email() -> None:
+        try:
+            await EmailService.get().asend_newsletter(
+                html_content=state.get("newsletter_html", ""),
+                subject="🔬 AI Research Analyst: Deep Dive",
+                image_paths=newsletter_attachments,
+            )
+            logger.info("research_newsletter_sent", run_id=run_id)
+        except Exception as e:
+            logger.error("research_newsletter_send_failed", run_id=run_id, error=str(e))
 
     # ── LinkedIn PDF carousel (Feature 2) ─────────────────────────────────
     carousel_pdf = state.get("research_carousel_pdf_path", "")
     linkedin_draft = state.get("linkedin_draft", "")
     paper = state.get("chosen_research_paper", {})
 
-    if carousel_pdf and Path(carousel_pdf).exists() and linkedin_draft:
+    async def _publish_linkedin() -> None:
         try:
-            from app.services.linkedin_service import LinkedInService
-
             # Strip hashtags from commentary (links in first comment strategy)
             commentary = linkedin_draft
-            LinkedInService().publish_document_post(
+            await LinkedInService().apublish_document_post(
                 text=commentary,
                 pdf_path=carousel_pdf,
                 title=paper.get("title", "AI Research Deep Dive")[:100],
@@ -900,6 +970,13 @@ def _publish_research_node(state: PipelineState) -> dict:
         except Exception as e:
             logger.error("research_linkedin_publish_failed", run_id=run_id, error=str(e))
 
+    # The two side-effects are independent, so overlap them; each task logs
+    # its own outcome, so one failing never masks the other's success.
+    tasks = [_send_email()]
+    if carousel_pdf and Path(carousel_pdf).exists() and linkedin_draft:
+        tasks.append(_publish_linkedin())
+    await asyncio.gather(*tasks)
+
     return {"current_step": "published"}
 
 
@@ -919,7 +996,25 @@ def _route_after_relevance(state: PipelineState) -> Literal["deep_dive", "digest
 
 # ── 3. Build the Graph ───────────────────────────────────────────────────────
 
+# Compiled graphs keyed by checkpointer identity — same caching as
+# app/agents/graph.build_graph. The topology is static, so recompiling per
+# call only re-walks nodes for an identical result, and a fresh default
+# InMemorySaver per call would break interrupt/resume across requests.
+_compiled_research_graphs: dict[int, object] = {}
+_default_research_checkpointer = None
+
+
 def build_research_graph(checkpointer=None) -> StateGraph:
+    global _default_research_checkpointer
+    if checkpointer is None:
+        if _default_research_checkpointer is None:
+            _default_research_checkpointer = InMemorySaver()
+        checkpointer = _default_research_checkpointer
+
+    cached = _compiled_research_graphs.get(id(checkpointer))
+    if cached is not None:
+        return cached
+
     workflow = StateGraph(PipelineState)
 
     # ── Paper sourcing (fan-out; both feed raw_articles via Annotated reducer) ──
@@ -992,9 +1087,7 @@ def build_research_graph(checkpointer=None) -> StateGraph:
     workflow.add_edge("publish", END)
     workflow.add_edge("revise", "deep_analysis")
 
-    if checkpointer is None:
-        checkpointer = InMemorySaver()
-
     app = workflow.compile(checkpointer=checkpointer)
+    _compiled_research_graphs[id(checkpointer)] = app
     logger.info("research_graph_compiled", node_count=len(workflow.nodes))
     return app
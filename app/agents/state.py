@@ -10,25 +10,63 @@ from __future__ import annotations
 import operator
 from typing import Annotated, Literal, NotRequired, TypedDict
 
+from app.core.security import hash_content
+
 
 class NewsArticle(TypedDict):
     title: str
     url: str
     source: str  # e.g. "tavily", "rss:techcrunch", "arxiv", "serper"
     content: str  # full text or abstract
+    content_hash: NotRequired[str]  # hash_content(content), computed once at merge time
+    content_preview: NotRequired[str]  # content head sliced once at merge time — prompt
+    # building and similarity keys read this instead of re-slicing the full text
     published_at: str  # ISO-8601
     credibility_score: float  # 0.0-1.0, populated by credibility node
+    credibility_bp: NotRequired[int]  # same score in basis points (0-1000) for int render paths
     category: NotRequired[str]  # populated by analyze_node
     relevance_score: NotRequired[float]  # 0.0-1.0, populated by analyze_node
     story_cluster_id: NotRequired[str]  # populated by cluster_stories_node
 
 
+def _dedup_add(existing: list[NewsArticle], new: list[NewsArticle]) -> list[NewsArticle]:
+    """Reducer for raw_articles: concatenate like operator.add, but drop
+    incoming articles whose content already arrived from a parallel branch.
+
+    Exact duplicates die at the merge instead of being carried (and
+    checkpointed) until deduplicate_node runs. Keyed by content_hash when
+    the scraper stamped one, hashing on the fly otherwise.
+
+    A ``None`` update clears the list — deduplicate_node prunes raw_articles
+    once deduplicated_articles exists, so every later checkpoint stops
+    pickling the full scraped pool.
+    """
+    if new is None:
+        return []
+    if not new:
+        return existing
+    seen = {a.get("content_hash") or hash_content(a["content"]) for a in existing}
+    merged = list(existing)
+    for article in new:
+        key = article.get("content_hash") or hash_content(article["content"])
+        if key in seen:
+            continue
+        seen.add(key)
+        merged.append(article)
+    return merged
+
+
 class Summary(TypedDict):
     headline: str
     body: str  # 2-3 paragraph summary
+    body_preview: NotRequired[str]  # body clipped for card rendering — set once by summarize_node
+    headline_html: NotRequired[str]  # HTML-escaped once by summarize_node, rendered |safe downstream
+    body_html: NotRequired[str]
+    body_preview_html: NotRequired[str]
     category: str  # e.g. "LLM", "Computer Vision", "Robotics", "Policy"
     source_urls: list[str]
     credibility_score: float
+    credibility_bp: NotRequired[int]  # set by summarize_node alongside the float
     outlet_names: NotRequired[list[str]]  # e.g. ["NYT", "Bloomberg"] — shown in carousel
     bias_notes: NotRequired[str]  # cross-outlet angle differences
     story_cluster_id: NotRequired[str]  # links back to article cluster
@@ -42,8 +80,10 @@ class PipelineState(TypedDict):
     trigger_type: Literal["scheduled", "manual"]
 
     # ── Data pipeline ───────────────────────────────────────
-    raw_articles: Annotated[list[NewsArticle], operator.add]
+    raw_articles: Annotated[list[NewsArticle], _dedup_add]
     deduplicated_articles: list[NewsArticle]
+    article_context: NotRequired[str]  # formatted top-k prompt block — built once by
+    # summarize_node and reused verbatim across revise loops
     summaries: list[Summary]
 
     # ── Content generation ──────────────────────────────────
@@ -107,3 +147,31 @@ class PipelineState(TypedDict):
     comparison_card_path: NotRequired[str]                 # F7: prior art card PNG path
     research_carousel_pdf_path: NotRequired[str]           # F2: 5-slide carousel PDF
     research_carousel_slide_paths: NotRequired[list[str]]  # F2: individual 1080x1080 PNGs
+
+
+def make_initial_state(
+    run_id: str, trigger_type: Literal["scheduled", "manual"] = "scheduled"
+) -> PipelineState:
+    """Fresh initial state for a pipeline run.
+
+    Every entry point (API route, both cron triggers) needs the same 14-key
+    starting dict; building it in one place keeps them in sync. A factory
+    rather than a module-level template: the list values are mutable, so a
+    shared constant would leak articles between runs in-process.
+    """
+    return PipelineState(
+        run_id=run_id,
+        trigger_type=trigger_type,
+        raw_articles=[],
+        deduplicated_articles=[],
+        summaries=[],
+        newsletter_html="",
+        linkedin_draft="",
+        image_paths=[],
+        approval_status="pending",
+        feedback="",
+        error_log=[],
+        total_tokens=0,
+        total_cost=0.0,
+        current_step="starting",
+    )
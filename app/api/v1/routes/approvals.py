@@ -7,16 +7,41 @@ GET  /api/v1/approvals/via-token   — one-click approve/reject from email link
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, Query
+from typing import Literal
+
+from fastapi import APIRouter, HTTPException, Query, status
+from redis.exceptions import RedisError
 
 from app.api.v1.deps import AppSettings, AuthenticatedUser  # noqa: TC001
 from app.core.logging import get_logger
+from app.core.redis import get_redis
 from app.core.security import verify_approval_token
 from app.schemas.schemas import ApprovalRequest, ApprovalResponse
 
 router = APIRouter(prefix="/approvals", tags=["approvals"])
 logger = get_logger(__name__)
 
+# In-memory fallback when Redis is unreachable (single-process dev, tests) —
+# same degradation pattern as the run-status tracker in routes/runs.py
+_consumed_jtis: set[str] = set()
+
+
+async def _consume_jti(jti: str, ttl_seconds: int) -> bool:
+    """Reserve a token's JTI atomically; False means it was already used.
+
+    SET NX EX keeps the reservation O(1) and self-expiring — the key only
+    needs to outlive the token itself.
+    """
+    try:
+        reserved = await get_redis().set(f"jti:{jti}", "1", nx=True, ex=ttl_seconds)
+        return bool(reserved)
+    except (RedisError, OSError) as e:
+        logger.warning("jti_redis_unavailable", error=str(e))
+        if jti in _consumed_jtis:
+            return False
+        _consumed_jtis.add(jti)
+        return True
+
 
 @router.post("/{run_id}", response_model=ApprovalResponse)
 async def approve_or_reject(
@@ -41,6 +66,7 @@ async def approve_or_reject(
         await graph.ainvoke(
             Command(resume={"action": body.action, "feedback": body.feedback}),
             config,
+            durability="sync",
         )
 
         logger.info(
@@ -65,18 +91,27 @@ async def approve_or_reject(
 @router.get("/via-token")
 async def approve_via_email_token(
     token: str = Query(..., description="HMAC-signed JWT from approval email"),
+    action: Literal["approve", "reject"] = Query(..., description="Decision for the run"),
     settings: AppSettings = None,
 ) -> ApprovalResponse:
     """
     One-click approval from email link (GET request with signed token).
 
-    The token encodes run_id, action, and expiry.
+    The token authorises decisions on run_id (plus expiry); the decision
+    itself comes from the validated ``action`` query arg, so one token
+    backs both email links.
     """
     payload = verify_approval_token(token, settings)
     run_id = payload["run_id"]
-    action = payload["action"]
 
-    # TODO: Enforce one-time-use by storing token JTI in DB and checking here
+    # One-time-use: the first request consumes the JTI, so a forwarded email
+    # or a mail client prefetching the link can't re-trigger the decision
+    jti = payload.get("jti", "")
+    if jti and not await _consume_jti(jti, settings.approval_token_expiry_hours * 3600):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Approval token already used",
+        )
 
     logger.info("email_approval_received", run_id=run_id, action=action)
 
@@ -7,76 +7,131 @@ GET  /api/v1/runs/{run_id} — poll run status
 
 from __future__ import annotations
 
+import asyncio
 import uuid
-from typing import TYPE_CHECKING
+import weakref
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from kombu.exceptions import OperationalError
+from redis.exceptions import RedisError
 
 from app.agents.graph import build_graph
+from app.agents.state import make_initial_state
 from app.api.v1.deps import AuthenticatedUser  # noqa: TC001
-
-if TYPE_CHECKING:
-    from app.agents.state import PipelineState
+from app.core.config import get_settings
 from app.core.logging import get_logger
+from app.core.redis import get_redis
+from app.core.security import limiter
 from app.schemas.schemas import TriggerResponse
+from app.workers.tasks import execute_pipeline_task
 
 router = APIRouter(prefix="/runs", tags=["runs"])
 logger = get_logger(__name__)
-limiter = Limiter(key_func=get_remote_address)
+settings = get_settings()
+
+# One semaphore per event loop: asyncio primitives bind to the loop that
+# first awaits them, and Celery tasks each asyncio.run() a fresh loop.
+_pipeline_sems: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _pipeline_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    sem = _pipeline_sems.get(loop)
+    if sem is None:
+        sem = _pipeline_sems[loop] = asyncio.Semaphore(settings.max_concurrent_runs)
+    return sem
+
+# Status rows expire on their own instead of accumulating forever
+_RUN_STATUS_TTL_SECONDS = 86400
 
-# In-memory run status tracker (replace with DB queries in production)
+# In-memory fallback for when Redis is unreachable (single-process dev, tests).
+# Production status lives in a Redis hash so every gunicorn worker sees it.
 _run_status: dict[str, dict] = {}
 
 
-async def execute_pipeline(run_id: str, trigger_type: str = "manual") -> None:
-    """Background task: execute the full pipeline graph."""
+async def _set_status(run_id: str, mapping: dict[str, str]) -> None:
+    """Write run status where all workers can see it; fall back to memory."""
+    try:
+        key = f"run:{run_id}"
+        # HSET + EXPIRE in one pipelined round-trip instead of two
+        async with get_redis().pipeline(transaction=False) as pipe:
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, _RUN_STATUS_TTL_SECONDS)
+            await pipe.execute()
+    except (RedisError, OSError) as e:
+        logger.warning("run_status_redis_unavailable", run_id=run_id, error=str(e))
+        _run_status.setdefault(run_id, {}).update(mapping)
+
+
+async def _get_status(run_id: str) -> dict | None:
+    """Read run status, preferring Redis over the in-memory fallback."""
     try:
-        _run_status[run_id] = {"status": "running", "current_step": "starting"}
-        graph = build_graph()
-
-        initial_state: PipelineState = {
-            "run_id": run_id,
-            "trigger_type": trigger_type,
-            "raw_articles": [],
-            "deduplicated_articles": [],
-            "summaries": [],
-            "newsletter_html": "",
-            "linkedin_draft": "",
-            "image_paths": [],
-            "approval_status": "pending",
-            "feedback": "",
-            "error_log": [],
-            "total_tokens": 0,
-            "total_cost": 0.0,
-            "current_step": "starting",
-        }
-
-        config = {"configurable": {"thread_id": run_id}}
-        result = await graph.ainvoke(initial_state, config)
-
-        _run_status[run_id] = {
-            "status": result.get("approval_status", "completed"),
-            "current_step": result.get("current_step", "finished"),
-        }
-        logger.info("pipeline_completed", run_id=run_id)
+        data = await get_redis().hgetall(f"run:{run_id}")
+        if data:
+            return data
+    except (RedisError, OSError):
+        pass
+    return _run_status.get(run_id)
+
+
+async def execute_pipeline(run_id: str, trigger_type: str = "manual") -> None:
+    """Background task: execute the full pipeline graph.
 
+    Gated by a bounded semaphore so a trigger storm queues runs instead of
+    launching them all at once — each run holds LLM sockets and article
+    buffers, and unbounded concurrency blows up RSS. Queued runs report
+    status "queued" until a slot frees up.
+    """
+    try:
+        await _set_status(run_id, {"status": "queued", "current_step": "waiting_for_slot"})
+        async with _pipeline_semaphore():
+            await _run_pipeline(run_id, trigger_type)
     except Exception as e:
         logger.error("pipeline_failed", run_id=run_id, error=str(e))
-        _run_status[run_id] = {"status": "failed", "error": str(e)}
+        await _set_status(run_id, {"status": "failed", "error": str(e)})
+
+
+async def _run_pipeline(run_id: str, trigger_type: str) -> None:
+    await _set_status(run_id, {"status": "running", "current_step": "starting"})
+    graph = build_graph()
+
+    initial_state = make_initial_state(run_id, trigger_type)
+
+    config = {"configurable": {"thread_id": run_id}}
+    # durability="sync" flushes each checkpoint before the next superstep,
+    # avoiding the unbounded pending-write coroutine chain of async mode.
+    result = await graph.ainvoke(initial_state, config, durability="sync")
+
+    await _set_status(run_id, {
+        "status": result.get("approval_status", "completed"),
+        "current_step": result.get("current_step", "finished"),
+    })
+    logger.info("pipeline_completed", run_id=run_id)
 
 
 @router.post("/trigger", response_model=TriggerResponse)
+@limiter.limit("10/minute")  # a trigger is minutes of pipeline work — cap it well below the default
 async def trigger_run(
     request: Request,
     background_tasks: BackgroundTasks,
     _api_key: AuthenticatedUser,
 ) -> TriggerResponse:
-    """Trigger a new pipeline run. Returns immediately with a run_id for polling."""
+    """Trigger a new pipeline run. Returns immediately with a run_id for polling.
+
+    The run itself executes on a Celery worker so a minutes-long pipeline
+    never occupies the API event loop; without a reachable broker (dev,
+    tests) it degrades to an in-process background task.
+    """
     run_id = str(uuid.uuid4())
-    background_tasks.add_task(execute_pipeline, run_id, "manual")
-    logger.info("pipeline_triggered", run_id=run_id, trigger="manual")
+    try:
+        execute_pipeline_task.delay(run_id, "manual")
+        logger.info("pipeline_triggered", run_id=run_id, trigger="manual", via="celery")
+    except (OperationalError, OSError) as e:
+        logger.warning("celery_broker_unavailable", run_id=run_id, error=str(e))
+        background_tasks.add_task(execute_pipeline, run_id, "manual")
+        logger.info("pipeline_triggered", run_id=run_id, trigger="manual", via="background_task")
 
     return TriggerResponse(run_id=run_id, status="started")
 
@@ -84,6 +139,7 @@ async def trigger_run(
 @router.get("/{run_id}", response_model=dict)
 async def get_run_status(run_id: str, _api_key: AuthenticatedUser) -> dict:
     """Get the current status of a pipeline run."""
-    if run_id not in _run_status:
+    status_row = await _get_status(run_id)
+    if not status_row:
         raise HTTPException(status_code=404, detail=f"Run {run_id} not found")
-    return {"run_id": run_id, **_run_status[run_id]}
+    return {"run_id": run_id, **status_row}
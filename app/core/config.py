@@ -7,7 +7,7 @@ PyCharm users: install the "EnvFile" plugin and point it at .env for run configs
 
 from __future__ import annotations
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Literal
 
 from pydantic import Field, field_validator
@@ -30,6 +30,8 @@ class Settings(BaseSettings):
 
     # ── Database ────────────────────────────────────────────
     database_url: str = "sqlite+aiosqlite:///./dev.db"
+    pg_pool_size: int = 5  # max connections in the LangGraph checkpointer pool
+    sql_echo: bool = False  # echo every SQL statement — opt-in, very noisy
 
     @field_validator("database_url", mode="before")
     @classmethod
@@ -41,18 +43,21 @@ class Settings(BaseSettings):
             v = v.replace("postgresql://", "postgresql+asyncpg://", 1)
         return v
 
-    @property
+    # Derived values are cached_property, not property — settings are frozen
+    # after construction (get_settings is lru_cached), so the split/replace
+    # work happens once per process instead of on every access.
+    @cached_property
     def is_sqlite(self) -> bool:
         return "sqlite" in self.database_url
 
-    @property
+    @cached_property
     def sync_database_url(self) -> str:
         """For Alembic migrations (sync driver)."""
         return self.database_url.replace("postgresql+asyncpg://", "postgresql://").replace(
             "sqlite+aiosqlite://", "sqlite://"
         )
 
-    @property
+    @cached_property
     def langgraph_pg_uri(self) -> str:
         """For langgraph-checkpoint-postgres (uses raw psycopg)."""
         return self.database_url.replace("postgresql+asyncpg://", "postgres://").replace(
@@ -79,7 +84,7 @@ class Settings(BaseSettings):
     email_from: str = ""  # Defaults to smtp_user if empty
     email_to: str = "you@example.com"
 
-    @property
+    @cached_property
     def email_recipients(self) -> list[str]:
         return [e.strip() for e in self.email_to.split(",")]
 
@@ -111,9 +116,19 @@ class Settings(BaseSettings):
 
     # ── Pipeline tunables ───────────────────────────────────
     max_articles_per_run: int = 200
+    max_concurrent_runs: int = 2  # pipelines in flight per process — excess triggers queue
     credibility_threshold: float = 0.4
     scraper_max_retries: int = 3
     scraper_backoff_base: float = 2.0
+    scraper_rps: float = 3.0  # token-bucket rate per search API (Tavily/Serper)
+    scraper_breaker_fail_max: int = 5  # consecutive failures before a scraper's breaker opens
+    scraper_breaker_reset_seconds: float = 60.0  # how long an open breaker skips queries
+    dedup_bloom_path: str = ""  # e.g. data/dedup.bloom — persists the shingle dedup filter
+    # across runs; empty keeps dedup per-run only (the default for dev/tests)
+    seen_urls_db_path: str = ""  # e.g. data/seen_urls.db — drops article URLs already
+    # processed within the last 7 days; empty disables cross-run URL dedup
+    max_concurrent_classifier: int = 6  # classification chunks in flight at once
+    # (abatch max_concurrency) — bounded to stay under Gemini rate limits
 
     # ── Research carousel: figure quality gate ───────────────
     figure_min_luminance: float = Field(
@@ -0,0 +1,253 @@
+"""
+Constant-memory deduplication primitives.
+
+`BloomFilter` is the probabilistic set used by `deduplicate_node` for exact
+content/title matching within a run. `ShingleFilter` layers near-duplicate
+detection on top: articles are broken into 13-token shingles, and an article
+whose shingles mostly already exist in the filter is treated as a rewrite of
+something already published (syndicated copy, boilerplate-only edit). Its bit
+array can be persisted to disk between runs, so the corpus-wide memory cost
+stays flat — a few megabytes of bits instead of an ever-growing set of digests.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import sqlite3
+import time
+from pathlib import Path
+
+import numpy as np
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Tokens per shingle — long enough that shared phrases don't collide, short
+# enough that trimmed/reordered copies still share most shingles.
+SHINGLE_TOKENS = 13
+
+# Cap shingles per article so very long pieces don't dominate hashing cost;
+# the lead paragraphs carry the identifying text anyway.
+_MAX_SHINGLES = 64
+
+# Fraction of an article's shingles already present before it counts as a
+# near-duplicate, and the minimum shingle count for the ratio to be meaningful
+# (below it a single false positive could swing the verdict).
+_NEAR_DUP_RATIO = 0.5
+_MIN_SHINGLES = 4
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter with blake2b-derived double-hashing probes.
+
+    Membership is O(1) per key with constant memory regardless of article
+    size — unlike a set-of-hex-digests approach there are no per-key string
+    allocations retained for the whole run. At the default 20 bits/key and
+    7 probes the false-positive (wrongly-dropped article) rate stays well
+    under 1e-4 at capacity.
+    """
+
+    def __init__(self, capacity: int = 10_000, bits_per_key: int = 20, probes: int = 7):
+        self._size = capacity * bits_per_key
+        self._bits = bytearray((self._size >> 3) + 1)
+        self._probes = probes
+
+    def _positions(self, key: bytes) -> list[int]:
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1  # odd → full-period stride
+        return [(h1 + i * h2) % self._size for i in range(self._probes)]
+
+    def __contains__(self, key: bytes) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def add(self, key: bytes) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    # ── Persistence ─────────────────────────────────────────
+    def save(self, path: Path) -> None:
+        """Write probes + size + bit array; atomic via rename."""
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(self._probes.to_bytes(1, "little"))
+            f.write(self._size.to_bytes(8, "little"))
+            f.write(self._bits)
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> BloomFilter:
+        data = path.read_bytes()
+        bf = cls.__new__(cls)
+        bf._probes = data[0]
+        bf._size = int.from_bytes(data[1:9], "little")
+        bf._bits = bytearray(data[9:])
+        return bf
+
+
+# ── Cross-run seen-URL index ────────────────────────────────────
+_SEEN_URL_RETENTION_DAYS = 7
+
+
+def filter_unseen_urls(
+    urls: list[str], path: str | Path, retention_days: int = _SEEN_URL_RETENTION_DAYS
+) -> set[str]:
+    """
+    Record `urls` in the sqlite seen-index at `path` and return only the ones
+    not already recorded within the retention window.
+
+    Lets a frequently-scheduled pipeline drop articles it already processed
+    in an earlier run instead of re-spending LLM tokens on them. A fresh
+    connection per call keeps this safe regardless of which worker thread
+    the scrape node lands on; one open/insert/close per run is noise next to
+    the network time around it.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS seen(url TEXT PRIMARY KEY, ts REAL)")
+        now = time.time()
+        conn.execute("DELETE FROM seen WHERE ts < ?", (now - retention_days * 86400,))
+        unseen: set[str] = set()
+        for url in urls:
+            # rowcount is 0 when INSERT OR IGNORE hit an existing row
+            if conn.execute(
+                "INSERT OR IGNORE INTO seen VALUES (?, ?)", (url, now)
+            ).rowcount:
+                unseen.add(url)
+        return unseen
+    finally:
+        conn.close()
+
+
+# ── MinHash near-duplicate index ────────────────────────────────
+# 64 permutations banded 16×4 for LSH lookup; the band collision threshold
+# (1/16)^(1/4) = 0.5 over-generates candidates, which are then verified
+# against the real similarity threshold by comparing full signatures.
+_NUM_PERM = 64
+_LSH_BANDS = 16
+_LSH_ROWS = _NUM_PERM // _LSH_BANDS
+_CHAR_NGRAM = 5
+
+# Fixed-seed permutation parameters so signatures are stable across runs
+_rng = random.Random(0x5EED)
+_PERM_A = np.array(
+    [_rng.randrange(1, 1 << 61) | 1 for _ in range(_NUM_PERM)], dtype=np.uint64
+)
+_PERM_B = np.array([_rng.randrange(1 << 61) for _ in range(_NUM_PERM)], dtype=np.uint64)
+
+
+class MinHashIndex:
+    """
+    Near-duplicate index over character 5-gram MinHash signatures.
+
+    Signatures are bucketed into LSH bands, so a lookup touches only articles
+    that collide on at least one band — O(1) amortized instead of comparing
+    against everything seen. Catches title variants and lightly reworded
+    copies ("OpenAI unveils GPT-5" vs "OpenAI Unveils GPT-5 today") that
+    exact matching misses.
+    """
+
+    def __init__(self, threshold: float = 0.85):
+        self._threshold = threshold
+        self._signatures: list[np.ndarray] = []
+        self._buckets: dict[tuple, list[int]] = {}
+
+    @staticmethod
+    def signature(text: str) -> np.ndarray | None:
+        """64-permutation MinHash signature of the text's character 5-grams."""
+        if len(text) < _CHAR_NGRAM:
+            return None
+        grams = {text[i : i + _CHAR_NGRAM] for i in range(len(text) - _CHAR_NGRAM + 1)}
+        hashes = np.fromiter(
+            (
+                int.from_bytes(
+                    hashlib.blake2b(g.encode("utf-8"), digest_size=8).digest(), "little"
+                )
+                for g in grams
+            ),
+            dtype=np.uint64,
+            count=len(grams),
+        )
+        # uint64 wraparound on the affine transform is fine — it's a hash
+        return (_PERM_A[:, None] * hashes[None, :] + _PERM_B[:, None]).min(axis=1)
+
+    @staticmethod
+    def _band_keys(sig: np.ndarray) -> list[tuple]:
+        return [
+            (band, bytes(sig[band * _LSH_ROWS : (band + 1) * _LSH_ROWS].data))
+            for band in range(_LSH_BANDS)
+        ]
+
+    def query(self, sig: np.ndarray) -> bool:
+        """True when a stored signature is at least `threshold` similar."""
+        checked: set[int] = set()
+        for key in self._band_keys(sig):
+            for idx in self._buckets.get(key, ()):
+                if idx in checked:
+                    continue
+                checked.add(idx)
+                jaccard = float((self._signatures[idx] == sig).mean())
+                if jaccard >= self._threshold:
+                    return True
+        return False
+
+    def add(self, sig: np.ndarray) -> None:
+        idx = len(self._signatures)
+        self._signatures.append(sig)
+        for key in self._band_keys(sig):
+            self._buckets.setdefault(key, []).append(idx)
+
+
+class ShingleFilter:
+    """
+    Near-duplicate detector over 13-token content shingles.
+
+    Sized for ~1M shingles by default (≈2.5 MB of bits). When constructed
+    with a path, the bit array is loaded from disk if present and `save()`
+    writes it back — dedup state then survives across runs.
+    """
+
+    def __init__(self, path: str | Path | None = None, capacity: int = 1_000_000):
+        self._path = Path(path) if path else None
+        self._bloom: BloomFilter | None = None
+        if self._path is not None and self._path.exists():
+            try:
+                self._bloom = BloomFilter.load(self._path)
+                logger.info("dedup_bloom_loaded", path=str(self._path))
+            except Exception as e:
+                logger.warning("dedup_bloom_load_failed", path=str(self._path), error=str(e))
+        if self._bloom is None:
+            self._bloom = BloomFilter(capacity=capacity)
+
+    @staticmethod
+    def shingles(content: str) -> list[bytes]:
+        """Overlapping 13-token shingles of `content`, capped per article."""
+        tokens = content.lower().split()
+        n = min(len(tokens) - SHINGLE_TOKENS + 1, _MAX_SHINGLES)
+        return [
+            " ".join(tokens[i : i + SHINGLE_TOKENS]).encode("utf-8") for i in range(max(n, 0))
+        ]
+
+    def is_duplicate(self, shingles: list[bytes]) -> bool:
+        """True when most of the article's shingles were already seen."""
+        if len(shingles) < _MIN_SHINGLES:
+            return False
+        hits = sum(1 for s in shingles if s in self._bloom)
+        return hits / len(shingles) >= _NEAR_DUP_RATIO
+
+    def add(self, shingles: list[bytes]) -> None:
+        for s in shingles:
+            self._bloom.add(s)
+
+    def save(self) -> None:
+        """Persist the bit array if a path was configured; no-op otherwise."""
+        if self._path is None:
+            return
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._bloom.save(self._path)
@@ -0,0 +1,35 @@
+"""
+Shared pooled HTTP client for synchronous call sites.
+
+Every `with httpx.Client(...)` block pays a fresh TCP+TLS handshake per use;
+for code that hits the same hosts repeatedly (article pages, arXiv, Serper
+images, Wikipedia) the handshake dominates the request. One process-wide
+client with keep-alive reuses connections across all of them. Per-call
+timeouts are passed at request time, so callers keep their own budgets.
+
+The scraper nodes have their own async twin in ``app.agents.nodes._http``;
+this one serves the blocking paths (image fetching, PDF download, figure
+extraction).
+"""
+
+from __future__ import annotations
+
+import httpx
+
+_client: httpx.Client | None = None
+
+
+def get_client() -> httpx.Client:
+    """Process-wide pooled Client, created lazily on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.Client(
+            timeout=httpx.Timeout(connect=5.0, read=20.0, write=10.0, pool=5.0),
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=40,
+                keepalive_expiry=30,
+            ),
+            follow_redirects=True,
+        )
+    return _client
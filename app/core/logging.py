@@ -24,7 +24,11 @@ def setup_logging() -> None:
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
+        # No StackInfoRenderer: it inspects the call stack on every event
+        # just to check stack_info, a per-call cost nothing here uses.
+        # format_exc_info stays dormant until exc_info is actually passed
+        # (logger.exception), which is the only place tracebacks are wanted.
+        structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
     ]
 
@@ -33,13 +37,18 @@ def setup_logging() -> None:
     else:
         renderer = structlog.dev.ConsoleRenderer(colors=True)
 
+    # Filtering bound logger makes below-threshold calls (debug in prod)
+    # no-ops before any processor or kwarg serialization runs — hot-path
+    # logger.debug lines in the scrapers cost a single level check.
+    level = getattr(logging, settings.log_level.upper(), logging.INFO)
+
     structlog.configure(
         processors=[
             *shared_processors,
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         cache_logger_on_first_use=True,
     )
 
@@ -63,5 +72,5 @@ def setup_logging() -> None:
         logging.getLogger(name).setLevel(logging.WARNING)
 
 
-def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
+def get_logger(name: str | None = None) -> structlog.types.FilteringBoundLogger:
     return structlog.get_logger(name)
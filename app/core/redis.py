@@ -0,0 +1,29 @@
+"""
+Shared Redis connection for cross-worker state.
+
+Under gunicorn each worker is its own process, so anything kept in module
+dicts is invisible to the worker answering the next request. Run status
+(and anything else that must survive a worker hop) lives in Redis instead.
+One lazily-created async client per process reuses a single connection
+pool, mirroring the pooled-client pattern in ``app.core.http``.
+"""
+
+from __future__ import annotations
+
+from redis import asyncio as aioredis
+
+from app.core.config import get_settings
+
+_client: aioredis.Redis | None = None
+
+
+def get_redis() -> aioredis.Redis:
+    """Process-wide pooled async Redis client, created lazily on first use."""
+    global _client
+    if _client is None:
+        _client = aioredis.from_url(
+            get_settings().redis_url,
+            decode_responses=True,
+            socket_connect_timeout=5,
+        )
+    return _client
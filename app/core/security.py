@@ -6,21 +6,40 @@ Aligned with OWASP LLM Top 10 (2025) — see Section 9 of the design doc.
 
 from __future__ import annotations
 
-import hashlib
+import re
 import secrets
+from functools import lru_cache
 from datetime import UTC, datetime, timedelta
 from typing import Annotated
 
+import jwt
+from blake3 import blake3
 from fastapi import Depends, HTTPException, Security, status
 from fastapi.security import APIKeyHeader
-from jose import JWTError, jwt
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
 from app.core.config import Settings, get_settings
 
 # ── Rate limiter (attached to FastAPI app in main.py) ───────
-limiter = Limiter(key_func=get_remote_address)
+def _rate_limit_key(request) -> str:  # noqa: ANN001 — slowapi passes a Request
+    """Key limits by API key + client IP.
+
+    IP alone collapses everyone behind one load-balancer address into a
+    single bucket (and lets rotating IPs dodge limits); the API key keeps
+    buckets per caller even there.
+    """
+    return f"{request.headers.get('X-API-Key', 'anon')}:{get_remote_address(request)}"
+
+
+limiter = Limiter(
+    key_func=_rate_limit_key,
+    # Counters live in Redis so all gunicorn workers share one budget —
+    # per-process counters quietly multiplied every limit by the worker count
+    storage_uri=get_settings().redis_url,
+    in_memory_fallback_enabled=True,  # dev/tests keep working without Redis
+    default_limits=["60/minute"],
+)
 
 # ── API Key authentication ──────────────────────────────────
 _api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
@@ -39,11 +58,16 @@ async def verify_api_key(
 
 
 # ── HMAC-signed approval tokens (for email approve/reject links) ─
-def create_approval_token(run_id: str, action: str, settings: Settings) -> str:
-    """Create a short-lived JWT for one-click approve/reject from email."""
+def create_approval_token(run_id: str, settings: Settings) -> str:
+    """Create a short-lived JWT for one-click approve/reject from email.
+
+    The token authorises decisions on a run without carrying the decision
+    itself — the approve/reject choice travels as an ``action`` query arg on
+    the via-token URL, so one signature covers both email links instead of
+    signing two near-identical payloads per approval email.
+    """
     payload = {
         "run_id": run_id,
-        "action": action,  # "approve" or "reject"
         "exp": datetime.now(UTC) + timedelta(hours=settings.approval_token_expiry_hours),
         "jti": secrets.token_hex(16),  # unique token ID for one-time-use
     }
@@ -54,7 +78,7 @@ def verify_approval_token(token: str, settings: Settings) -> dict:
     """Verify and decode an approval token. Raises on expiry / tampering."""
     try:
         payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
-    except JWTError as e:
+    except jwt.PyJWTError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Invalid or expired approval token: {e}",
@@ -63,24 +87,39 @@ def verify_approval_token(token: str, settings: Settings) -> dict:
 
 
 # ── Content sanitisation (OWASP LLM02 - Information Disclosure) ─
+# One alternation compiled once — a single pass over the text instead of
+# one full scan-and-reallocate per pattern
+_DANGEROUS_RE = re.compile(
+    "|".join(
+        re.escape(p)
+        for p in (
+            "SYSTEM:",
+            "ASSISTANT:",
+            "USER:",
+            "```system",
+            "<|im_start|>",
+            "<|im_end|>",
+            "<<SYS>>",
+            "<</SYS>>",
+        )
+    )
+)
+
+
 def sanitize_for_display(text: str) -> str:
     """Strip potential prompt injection patterns and sensitive markers from output."""
-    dangerous_patterns = [
-        "SYSTEM:",
-        "ASSISTANT:",
-        "USER:",
-        "```system",
-        "<|im_start|>",
-        "<|im_end|>",
-        "<<SYS>>",
-        "<</SYS>>",
-    ]
-    sanitized = text
-    for pattern in dangerous_patterns:
-        sanitized = sanitized.replace(pattern, "[REDACTED]")
-    return sanitized
+    return _DANGEROUS_RE.sub("[REDACTED]", text)
 
 
+@lru_cache(maxsize=4096)
 def hash_content(content: str) -> str:
-    """Deterministic content hash for deduplication & cache keys."""
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+    """Deterministic content hash for deduplication & cache keys.
+
+    BLAKE3 rather than SHA-256: content identity is not adversarial, and
+    BLAKE3's SIMD implementation hashes full article bodies several times
+    faster. An 8-byte digest (16 hex chars) matches the stored column width.
+    Memoised because the same bodies are re-hashed on every state-reducer
+    merge for articles that predate the stored ``content_hash`` field; the
+    cache holds references to strings already alive in pipeline state.
+    """
+    return blake3(content.encode("utf-8")).hexdigest(length=8)
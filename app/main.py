@@ -3,7 +3,7 @@ FastAPI application entry point.
 
 Configures middleware, lifespan events, and mounts all routers.
 Run locally: uvicorn app.main:app --reload
-Production:  gunicorn app.main:app -w 4 -k uvicorn.workers.UvicornWorker
+Production:  gunicorn app.main:app -c gunicorn.conf.py  (uvloop + httptools workers)
 """
 
 from __future__ import annotations
@@ -14,6 +14,7 @@ from pathlib import Path
 from asgi_correlation_id import CorrelationIdMiddleware
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
@@ -37,9 +38,6 @@ async def lifespan(app: FastAPI):
         database=settings.database_url[:30] + "...",
     )
 
-    # Create output directories
-    Path("./output/images").mkdir(parents=True, exist_ok=True)
-
     yield
 
     logger.info("app_shutting_down")
@@ -50,6 +48,9 @@ app = FastAPI(
     description="LangGraph multi-agent pipeline for AI/ML news curation and publishing",
     version="0.1.0",
     lifespan=lifespan,
+    # orjson serializes responses (datetimes/UUIDs included) several times
+    # faster than stdlib json — and it's already a core dependency
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.app_env != "production" else None,
     redoc_url="/redoc" if settings.app_env != "production" else None,
 )
@@ -69,8 +70,19 @@ app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 # ── Static files (for serving generated images locally) ─────
+# Dev/staging only: every PNG fetched through StaticFiles costs a Python
+# ASGI round-trip per chunk. In production /static/images is expected to
+# be served by the front proxy (nginx location on output/images, or a
+# CDN), which uses sendfile and never touches a worker.
 Path("output/images").mkdir(parents=True, exist_ok=True)
-app.mount("/static/images", StaticFiles(directory="output/images"), name="images")
+if settings.app_env != "production":
+    # check_dir=False: the directory was just created above — skip the
+    # existence stat StaticFiles would otherwise do at mount time
+    app.mount(
+        "/static/images",
+        StaticFiles(directory="output/images", check_dir=False),
+        name="images",
+    )
 
 # ── Routes ─────────────────────────────────────────────────
 app.include_router(health.router)
@@ -14,21 +14,29 @@ from app.core.config import get_settings
 
 settings = get_settings()
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=(settings.app_env == "development"),
-    pool_pre_ping=True,
-)
+_engine_kwargs: dict = {
+    # SQL logging is opt-in via SQL_ECHO even in dev — echoing every
+    # statement during a 200-article persist drowns the logs
+    "echo": settings.sql_echo,
+    "pool_pre_ping": True,
+}
+if not settings.is_sqlite:
+    # Default pool (5+10) starves concurrent agent writes; recycle idle
+    # connections before the server/proxy drops them
+    _engine_kwargs.update(pool_size=20, max_overflow=10, pool_recycle=1800)
+
+engine = create_async_engine(settings.database_url, **_engine_kwargs)
 
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """FastAPI dependency — yields an async DB session."""
+    """FastAPI dependency — yields an async DB session.
+
+    No blanket commit: read endpoints shouldn't pay a commit round-trip,
+    so writers commit explicitly (``async with session.begin():`` keeps
+    the commit/rollback pairing atomic). The context manager still rolls
+    back anything left open when the request errors out.
+    """
     async with async_session() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
+        yield session
@@ -16,6 +16,7 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -68,6 +69,11 @@ class AgentRun(Base):
 
 class NewsArticleModel(Base):
     __tablename__ = "news_articles"
+    __table_args__ = (
+        # Dedup asks "was this hash seen in this run / recent runs?" — the
+        # composite index answers that with an index-only scan
+        Index("ix_articles_run_hash", "run_id", "content_hash"),
+    )
 
     id: Mapped[str] = mapped_column(String(64), primary_key=True)
     run_id: Mapped[str] = mapped_column(ForeignKey("agent_runs.id"))
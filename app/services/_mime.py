@@ -0,0 +1,124 @@
+"""
+Byte-level MIME assembly for outgoing mail.
+
+``email.mime`` builds a Python object tree and ``Generator.flatten`` walks
+it back out at send time, re-folding every header and re-encoding every
+payload in pure Python. The messages this app sends all have one fixed
+shape — an HTML body plus zero or more base64 attachments — so the
+envelope is written out directly as text instead.
+
+Addresses are assumed ASCII (the configured sender/recipients are), and
+subjects are RFC-2047-encoded when they aren't — the digest and research
+newsletters ship emoji subjects. The result is an ASCII string ready for
+``smtplib.sendmail`` / ``aiosmtplib.SMTP.sendmail``, which ascii-encode a
+str message and normalise line endings on the wire.
+"""
+
+from __future__ import annotations
+
+from base64 import encodebytes
+from concurrent.futures import ThreadPoolExecutor
+from email.header import Header
+from pathlib import Path
+from uuid import uuid4
+
+try:  # SIMD base64 — optional, stdlib encodebytes covers its absence
+    import pybase64  # type: ignore[import]
+except ImportError:
+    pybase64 = None
+
+# 57 raw bytes encode to exactly one 76-char base64 line, so chunks that
+# are a multiple of 57 concatenate into a valid wrapped body
+_B64_CHUNK_BYTES = 57 * 1024
+
+
+def _encode_chunk(chunk: bytes) -> bytes:
+    """Base64-encode one aligned chunk, wrapped to 76-char lines.
+
+    pybase64's SIMD kernel encodes at near-memcpy speed; the stdlib
+    encodebytes path (which b2a_base64's 57 bytes at a time from Python)
+    is the fallback when it isn't installed.
+    """
+    if pybase64 is None:
+        return encodebytes(chunk)
+    encoded = memoryview(pybase64.b64encode(chunk))
+    return b"\n".join(encoded[i:i + 76] for i in range(0, len(encoded), 76)) + b"\n"
+
+
+def _encode_bytes(data: bytes) -> str:
+    """Base64-wrap an in-memory buffer (aligned chunks → whole lines)."""
+    encoded = [
+        _encode_chunk(data[i:i + _B64_CHUNK_BYTES])
+        for i in range(0, len(data), _B64_CHUNK_BYTES)
+    ]
+    return b"".join(encoded).decode("ascii")
+
+
+def _attachment_part(path: Path) -> str:
+    """Serialise one file as a complete base64 attachment part (headers + body)."""
+    subtype = "pdf" if path.suffix.lower() == ".pdf" else "octet-stream"
+    encoded: list[bytes] = []
+    with open(path, "rb", buffering=128 * 1024) as f:
+        while chunk := f.read(_B64_CHUNK_BYTES):
+            encoded.append(_encode_chunk(chunk))
+    return (
+        f"Content-Type: application/{subtype}\n"
+        "Content-Transfer-Encoding: base64\n"
+        f'Content-Disposition: attachment; filename="{path.name}"\n'
+        "\n" + b"".join(encoded).decode("ascii")
+    )
+
+
+def _attachment_parts(attachment_paths: list[str]) -> list[str]:
+    """Serialise every existing file, reading/encoding multiple in parallel.
+
+    Serial reads pay each file's disk latency back-to-back; a small thread
+    pool lets the OS service them concurrently. One attachment (the common
+    case) is built inline to skip pool setup.
+    """
+    paths = [p for p in map(Path, attachment_paths) if p.exists()]
+    if len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            return list(pool.map(_attachment_part, paths))
+    return [_attachment_part(p) for p in paths]
+
+
+def build_mixed(
+    *,
+    sender: str,
+    recipients: list[str],
+    subject: str,
+    html: str,
+    attachment_paths: list[str] | None = None,
+) -> str:
+    """Assemble a complete multipart/mixed message as an ASCII string.
+
+    The HTML body is base64-encoded (it may contain arbitrary UTF-8), and
+    attachment paths that don't exist on disk are silently skipped — same
+    contract the ``email.mime`` assembly had.
+    """
+    if not subject.isascii():  # e.g. "🗞️ AI Research Digest — …"
+        subject = Header(subject, "utf-8").encode()
+
+    boundary = f"=={uuid4().hex}=="
+    parts = [
+        'Content-Type: text/html; charset="utf-8"\n'
+        "Content-Transfer-Encoding: base64\n"
+        "\n" + _encode_bytes(html.encode("utf-8"))
+    ]
+    if attachment_paths:
+        parts.extend(_attachment_parts(attachment_paths))
+
+    pieces = [
+        f'Content-Type: multipart/mixed; boundary="{boundary}"\n'
+        "MIME-Version: 1.0\n"
+        f"Subject: {subject}\n"
+        f"From: {sender}\n"
+        f"To: {', '.join(recipients)}\n"
+        "\n"
+    ]
+    for part in parts:  # every part's base64 body already ends with "\n"
+        pieces.append(f"--{boundary}\n")
+        pieces.append(part)
+    pieces.append(f"--{boundary}--\n")
+    return "".join(pieces)
@@ -12,13 +12,15 @@ Gmail setup:
 
 from __future__ import annotations
 
+import asyncio
 import smtplib
-from email import encoders
-from email.mime.base import MIMEBase
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from pathlib import Path
+import threading
+from typing import IO
 
+import aiosmtplib
+
+from app.agents.nodes._templates import get_template
+from app.services._mime import build_mixed
 from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.services.image_service import ImageService
@@ -92,44 +94,154 @@ def _build_slide_thumbnail_grid(
 
 
 class EmailService:
-    def _send(self, msg: MIMEMultipart, recipients: list[str]) -> None:
-        """Open SMTP connection, send, close. Raises on failure."""
-        with smtplib.SMTP(settings.smtp_host, settings.smtp_port, timeout=30) as smtp:
-            smtp.ehlo()
-            smtp.starttls()
-            smtp.ehlo()
-            if settings.smtp_user and settings.smtp_password:
-                smtp.login(settings.smtp_user, settings.smtp_password)
-            smtp.sendmail(settings.email_sender, recipients, msg.as_string())
+    _instance: EmailService | None = None
+
+    # Recycle a pooled session after this many messages — long-lived SMTP
+    # connections accumulate server-side state and some providers start
+    # refusing mail on them well before dropping the socket
+    _MAX_MESSAGES_PER_CONN = 100
+
+    @classmethod
+    def get(cls) -> EmailService:
+        """Process-wide shared instance — keeps one SMTP session alive across
+        sends instead of paying a TCP+TLS+login handshake per email."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self) -> None:
+        # Recipient lists are env-derived and constant for the process —
+        # resolve the newsletter list and the single-reviewer slice once
+        # instead of on every send.
+        self._recipients: list[str] = list(settings.email_recipients)
+        self._approval_recipients: list[str] = self._recipients[:1]
+        self._smtp: smtplib.SMTP | None = None
+        self._lock = threading.Lock()
+        self._sent_on_conn = 0
+        # Async counterparts, used by asend_newsletter from async nodes.
+        # The lock is created lazily so __init__ stays loop-agnostic.
+        self._asmtp: aiosmtplib.SMTP | None = None
+        self._alock: asyncio.Lock | None = None
+        self._asent_on_conn = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        smtp = smtplib.SMTP(settings.smtp_host, settings.smtp_port, timeout=30)
+        smtp.ehlo()
+        smtp.starttls()
+        smtp.ehlo()
+        if settings.smtp_user and settings.smtp_password:
+            smtp.login(settings.smtp_user, settings.smtp_password)
+        return smtp
+
+    def _send(self, msg: str, recipients: list[str]) -> None:
+        """Send over the pooled connection. Raises on failure.
+
+        Reconnects once when the server has dropped the idle session —
+        Gmail closes connections after a few minutes, and SMTP delivery is
+        not attempted until the full message is transmitted, so the single
+        retry cannot double-send.
+        """
+        with self._lock:
+            if self._sent_on_conn >= self._MAX_MESSAGES_PER_CONN and self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except Exception:  # noqa: S110 — recycling anyway
+                    pass
+                self._smtp = None
+                self._sent_on_conn = 0
+            if self._smtp is None:
+                self._smtp = self._connect()
+                self._sent_on_conn = 0
+            try:
+                self._smtp.sendmail(settings.email_sender, recipients, msg)
+            except (smtplib.SMTPServerDisconnected, OSError):
+                try:
+                    self._smtp.close()
+                except Exception:  # noqa: S110 — already reconnecting
+                    pass
+                self._smtp = self._connect()
+                self._sent_on_conn = 0
+                self._smtp.sendmail(settings.email_sender, recipients, msg)
+            self._sent_on_conn += 1
+
+    async def _aconnect(self) -> aiosmtplib.SMTP:
+        smtp = aiosmtplib.SMTP(
+            hostname=settings.smtp_host,
+            port=settings.smtp_port,
+            timeout=30,
+            start_tls=True,
+        )
+        await smtp.connect()
+        if settings.smtp_user and settings.smtp_password:
+            await smtp.login(settings.smtp_user, settings.smtp_password)
+        return smtp
+
+    async def _asend(self, msg: str, recipients: list[str]) -> None:
+        """Async twin of ``_send`` — same pooled-connection and
+        reconnect-once semantics, over aiosmtplib so the event loop stays
+        free during the SMTP round-trip."""
+        if self._alock is None:
+            self._alock = asyncio.Lock()
+        async with self._alock:
+            if self._asent_on_conn >= self._MAX_MESSAGES_PER_CONN and self._asmtp is not None:
+                try:
+                    await self._asmtp.quit()
+                except Exception:  # noqa: S110 — recycling anyway
+                    pass
+                self._asmtp = None
+                self._asent_on_conn = 0
+            if self._asmtp is None:
+                self._asmtp = await self._aconnect()
+                self._asent_on_conn = 0
+            try:
+                await self._asmtp.sendmail(settings.email_sender, recipients, msg)
+            except (aiosmtplib.SMTPServerDisconnected, OSError):
+                try:
+                    self._asmtp.close()
+                except Exception:  # noqa: S110 — already reconnecting
+                    pass
+                self._asmtp = await self._aconnect()
+                self._asent_on_conn = 0
+                await self._asmtp.sendmail(settings.email_sender, recipients, msg)
+            self._asent_on_conn += 1
+
+    @staticmethod
+    def _build_newsletter_msg(
+        html_content: str,
+        subject: str,
+        image_paths: list[str] | None,
+        html_stream: IO[str] | None,
+        recipients: list[str],
+    ) -> str:
+        if html_stream is not None:
+            html_content = html_stream.read()
+        return build_mixed(
+            sender=settings.email_sender,
+            recipients=recipients,
+            subject=subject,
+            html=html_content,
+            attachment_paths=image_paths,
+        )
 
     def send_newsletter(
         self,
-        html_content: str,
+        html_content: str = "",
         subject: str = "Your AI/ML Weekly Digest",
         image_paths: list[str] | None = None,
+        html_stream: IO[str] | None = None,
     ) -> None:
-        """Send the newsletter to all configured recipients."""
-        recipients = settings.email_recipients
-        msg = MIMEMultipart("mixed")
-        msg["Subject"] = subject
-        msg["From"] = settings.email_sender
-        msg["To"] = ", ".join(recipients)
-
-        msg.attach(MIMEText(html_content, "html", "utf-8"))
-
-        if image_paths:
-            for path_str in image_paths:
-                path = Path(path_str)
-                if path.exists():
-                    with open(path, "rb") as f:
-                        part = MIMEBase("application", "octet-stream")
-                        part.set_payload(f.read())
-                    encoders.encode_base64(part)
-                    part.add_header(
-                        "Content-Disposition",
-                        f'attachment; filename="{path.name}"',
-                    )
-                    msg.attach(part)
+        """Send the newsletter to all configured recipients.
+
+        ``html_stream`` accepts a file-backed body (e.g. a
+        SpooledTemporaryFile the caller streamed the render into) so large
+        digests aren't held as a second in-memory copy before this point;
+        the MIME payload itself is read in only here, where smtplib needs
+        the full transcript anyway.
+        """
+        recipients = self._recipients
+        msg = self._build_newsletter_msg(
+            html_content, subject, image_paths, html_stream, recipients
+        )
 
         try:
             self._send(msg, recipients)
@@ -138,6 +250,31 @@ class EmailService:
             logger.error("email_send_error", error=str(e))
             raise
 
+    async def asend_newsletter(
+        self,
+        html_content: str = "",
+        subject: str = "Your AI/ML Weekly Digest",
+        image_paths: list[str] | None = None,
+        html_stream: IO[str] | None = None,
+    ) -> None:
+        """Async ``send_newsletter`` for callers already on the event loop —
+        the publish nodes — so the full SMTP round-trip no longer blocks
+        other runs on the same worker."""
+        recipients = self._recipients
+        # Message assembly reads every attachment from disk and base64-encodes
+        # it — blocking work that belongs off the event loop
+        msg = await asyncio.to_thread(
+            self._build_newsletter_msg, html_content, subject, image_paths,
+            html_stream, recipients,
+        )
+
+        try:
+            await self._asend(msg, recipients)
+            logger.info("newsletter_sent", recipients=len(recipients))
+        except Exception as e:
+            logger.error("email_send_error", error=str(e))
+            raise
+
     def send_approval_email(
             self,
             run_id: str,
@@ -160,7 +297,7 @@ class EmailService:
         ``_build_slide_thumbnail_grid`` for why this stays run-level rather
         than per-slide.
         """
-        recipients = settings.email_recipients[:1]
+        recipients = self._approval_recipients
 
         slide_grid_section = _build_slide_thumbnail_grid(
             slide_image_paths or [], approve_url, reject_url
@@ -182,61 +319,27 @@ class EmailService:
             if research_article_html else ""
         )
 
-        html = f"""
-        <div style="font-family: -apple-system, BlinkMacSystemFont, sans-serif;
-                    max-width: 700px; margin: 0 auto;">
-            <h2>AI Pipeline - Review Required</h2>
-            <p>Run <code>{run_id[:8]}</code> has generated content ready for publishing.</p>
-
-            {slide_grid_section}
-
-            <h3>LinkedIn Post Preview:</h3>
-            <div style="background: #f5f5f5; padding: 16px; border-radius: 8px;
-                        white-space: pre-wrap; font-size: 14px; line-height: 1.6;">
-                {linkedin_preview}
-            </div>
-
-            {article_section}
-
-            <div style="margin-top: 28px; text-align: center;">
-                <a href="{approve_url}"
-                   style="background: #0a66c2; color: white; padding: 12px 32px;
-                          border-radius: 6px; text-decoration: none; margin-right: 12px;">
-                    Approve &amp; Publish
-                </a>
-                <a href="{reject_url}"
-                   style="background: #dc3545; color: white; padding: 12px 32px;
-                          border-radius: 6px; text-decoration: none;">
-                    Reject &amp; Revise
-                </a>
-            </div>
-        </div>
-        """
+        # Compiled once via the shared environment (and autoescaped — the
+        # LLM-written preview text no longer lands in the email unescaped);
+        # the pre-built HTML fragments pass through |safe in the template.
+        html = get_template("approval_email.html").render(
+            run_short=run_id[:8],
+            slide_grid_section=slide_grid_section,
+            linkedin_preview=linkedin_preview,
+            article_section=article_section,
+            approve_url=approve_url,
+            reject_url=reject_url,
+        )
 
-        # "mixed" is required to allow file attachments
-        msg = MIMEMultipart("mixed")
-        msg["Subject"] = f"Approve AI Content - Run {run_id[:8]}"
-        msg["From"] = settings.email_sender
-        msg["To"] = ", ".join(recipients)
-        msg.attach(MIMEText(html, "html", "utf-8"))
-
-        # THIS ATTACHES THE IMAGE FILE TO THE EMAIL
-        if image_paths:
-            for path_str in image_paths:
-                path = Path(path_str)
-                if path.exists():
-                    with open(path, "rb") as f:
-                        if path.suffix.lower() == ".pdf":
-                            part = MIMEBase("application", "pdf")
-                        else:
-                            part = MIMEBase("application", "octet-stream")
-                        part.set_payload(f.read())
-                    encoders.encode_base64(part)
-                    part.add_header(
-                        "Content-Disposition",
-                        f'attachment; filename="{path.name}"',
-                    )
-                    msg.attach(part)
+        # multipart/mixed is required to allow file attachments; build_mixed
+        # serialises the envelope straight to text, skipping email.generator
+        msg = build_mixed(
+            sender=settings.email_sender,
+            recipients=recipients,
+            subject=f"Approve AI Content - Run {run_id[:8]}",
+            html=html,
+            attachment_paths=image_paths,
+        )
 
         try:
             self._send(msg, recipients)
@@ -7,6 +7,7 @@ For production, upload to S3/CloudFront and return public URLs.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 from app.core.logging import get_logger
@@ -16,6 +17,14 @@ logger = get_logger(__name__)
 OUTPUT_DIR = Path("./output/images")
 
 
+@lru_cache(maxsize=64)
+def _public_url(base_url: str, filename: str) -> str:
+    """Memoised URL join — the same card paths are resolved repeatedly per
+    run (approval email, newsletter, previews), so later lookups are free."""
+    # MVP: serve from FastAPI static mount
+    return f"{base_url}/static/images/{filename}"
+
+
 class ImageService:
     def __init__(self, base_url: str = "http://localhost:8000") -> None:
         self.base_url = base_url.rstrip("/")
@@ -23,9 +32,9 @@ class ImageService:
 
     def get_public_url(self, local_path: str) -> str:
         """Convert a local image path to a publicly accessible URL."""
-        filename = Path(local_path).name
-        # MVP: serve from FastAPI static mount
-        return f"{self.base_url}/static/images/{filename}"
+        # rsplit handles both separators without a Path allocation per call
+        filename = local_path.rsplit("/", 1)[-1].rsplit("\\", 1)[-1]
+        return _public_url(self.base_url, filename)
 
     def get_all_card_urls(self, image_paths: list[str]) -> list[str]:
         """Convert all local paths to public URLs."""
@@ -9,11 +9,15 @@ Handles:
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
 from pathlib import Path
 
-import httpx
+import orjson
 
+from app.agents.nodes._http import get_async_client
 from app.core.config import get_settings
+from app.core.http import get_client
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -30,6 +34,8 @@ class LinkedInService:
 
     @property
     def _headers(self) -> dict[str, str]:
+        # Content-Type is set here once — request bodies are pre-serialised
+        # with orjson and passed as content=, bypassing httpx's stdlib-json path
         return {
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": "application/json",
@@ -51,48 +57,57 @@ class LinkedInService:
             "lifecycleState": "PUBLISHED",
         }
 
-        with httpx.Client(timeout=30) as client:
-            resp = client.post(
-                f"{LINKEDIN_API_BASE}/rest/posts",
-                headers=self._headers,
-                json=payload,
-            )
-            resp.raise_for_status()
+        # Shared pooled client (app.core.http) — keep-alive spares the
+        # DNS+TCP+TLS handshake each per-call Client used to pay
+        resp = get_client().post(
+            f"{LINKEDIN_API_BASE}/rest/posts",
+            headers=self._headers,
+            content=orjson.dumps(payload),
+            timeout=30,
+        )
+        resp.raise_for_status()
 
         post_id = resp.headers.get("x-restli-id", "unknown")
         logger.info("linkedin_post_published", post_id=post_id, char_count=len(text))
         return {"post_id": post_id, "status": "published"}
 
-    def upload_image(self, image_path: str) -> str:
-        """Upload an image and return its URN for use in a post."""
-        # Step 1: Initialize upload
+    def _initialize_image_upload(self) -> tuple[str, str]:
+        """Register an image upload; returns (upload_url, image_urn)."""
         init_payload = {
             "initializeUploadRequest": {
                 "owner": self.person_urn,
             }
         }
 
-        with httpx.Client(timeout=60) as client:
-            init_resp = client.post(
-                f"{LINKEDIN_API_BASE}/rest/images?action=initializeUpload",
-                headers=self._headers,
-                json=init_payload,
+        init_resp = get_client().post(
+            f"{LINKEDIN_API_BASE}/rest/images?action=initializeUpload",
+            headers=self._headers,
+            content=orjson.dumps(init_payload),
+            timeout=60,
+        )
+        init_resp.raise_for_status()
+        init_data = orjson.loads(init_resp.content)["value"]
+        return init_data["uploadUrl"], init_data["image"]
+
+    def _put_image_binary(self, upload_url: str, image_path: str) -> None:
+        """PUT the binary image — file object as body, so httpx streams it
+        in chunks instead of holding a second full copy."""
+        with open(image_path, "rb", buffering=131072) as f:
+            upload_resp = get_client().put(
+                upload_url,
+                headers={
+                    "Authorization": f"Bearer {self.access_token}",
+                    "Content-Length": str(Path(image_path).stat().st_size),
+                },
+                content=f,
+                timeout=60,
             )
-            init_resp.raise_for_status()
-            init_data = init_resp.json()["value"]
-
-            upload_url = init_data["uploadUrl"]
-            image_urn = init_data["image"]
-
-            # Step 2: PUT the binary image
-            with open(image_path, "rb") as f:
-                upload_resp = client.put(
-                    upload_url,
-                    headers={"Authorization": f"Bearer {self.access_token}"},
-                    content=f.read(),
-                )
-                upload_resp.raise_for_status()
+            upload_resp.raise_for_status()
 
+    def upload_image(self, image_path: str) -> str:
+        """Upload an image and return its URN for use in a post."""
+        upload_url, image_urn = self._initialize_image_upload()
+        self._put_image_binary(upload_url, image_path)
         logger.info("linkedin_image_uploaded", image_urn=image_urn)
         return image_urn
 
@@ -118,13 +133,13 @@ class LinkedInService:
             "lifecycleState": "PUBLISHED",
         }
 
-        with httpx.Client(timeout=30) as client:
-            resp = client.post(
-                f"{LINKEDIN_API_BASE}/rest/posts",
-                headers=self._headers,
-                json=payload,
-            )
-            resp.raise_for_status()
+        resp = get_client().post(
+            f"{LINKEDIN_API_BASE}/rest/posts",
+            headers=self._headers,
+            content=orjson.dumps(payload),
+            timeout=30,
+        )
+        resp.raise_for_status()
 
         post_id = resp.headers.get("x-restli-id", "unknown")
         logger.info("linkedin_image_post_published", post_id=post_id)
@@ -147,25 +162,30 @@ class LinkedInService:
             }
         }
 
-        with httpx.Client(timeout=120) as client:
-            init_resp = client.post(
-                f"{LINKEDIN_API_BASE}/rest/documents?action=initializeUpload",
-                headers=self._headers,
-                json=init_payload,
+        client = get_client()
+        init_resp = client.post(
+            f"{LINKEDIN_API_BASE}/rest/documents?action=initializeUpload",
+            headers=self._headers,
+            content=orjson.dumps(init_payload),
+            timeout=120,
+        )
+        init_resp.raise_for_status()
+        init_data = orjson.loads(init_resp.content)["value"]
+
+        upload_url = init_data["uploadUrl"]
+        document_urn = init_data["document"]
+
+        with open(pdf_path, "rb", buffering=131072) as f:
+            upload_resp = client.put(
+                upload_url,
+                headers={
+                    "Authorization": f"Bearer {self.access_token}",
+                    "Content-Length": str(file_size),
+                },
+                content=f,
+                timeout=120,
             )
-            init_resp.raise_for_status()
-            init_data = init_resp.json()["value"]
-
-            upload_url = init_data["uploadUrl"]
-            document_urn = init_data["document"]
-
-            with open(pdf_path, "rb") as f:
-                upload_resp = client.put(
-                    upload_url,
-                    headers={"Authorization": f"Bearer {self.access_token}"},
-                    content=f.read(),
-                )
-                upload_resp.raise_for_status()
+            upload_resp.raise_for_status()
 
         logger.info("linkedin_document_uploaded", document_urn=document_urn, size_bytes=file_size)
         return document_urn
@@ -197,13 +217,153 @@ class LinkedInService:
             "lifecycleState": "PUBLISHED",
         }
 
-        with httpx.Client(timeout=30) as client:
-            resp = client.post(
-                f"{LINKEDIN_API_BASE}/rest/posts",
-                headers=self._headers,
-                json=payload,
+        resp = get_client().post(
+            f"{LINKEDIN_API_BASE}/rest/posts",
+            headers=self._headers,
+            content=orjson.dumps(payload),
+            timeout=30,
+        )
+        resp.raise_for_status()
+
+        post_id = resp.headers.get("x-restli-id", "unknown")
+        logger.info("linkedin_carousel_published", post_id=post_id, document_urn=document_urn)
+        return {"post_id": post_id, "document_urn": document_urn, "status": "published"}
+
+    # ── Async twins — for callers already on the event loop ──────────────
+    # Mirrors the EmailService pattern: the sync methods stay for the cron /
+    # sync-node paths, while async nodes await these instead of parking a
+    # worker thread on asyncio.to_thread for a multi-second upload.
+
+    @staticmethod
+    async def _afile_chunks(path: str, chunk_size: int = 131072) -> AsyncIterator[bytes]:
+        """Stream a file as an async byte iterator (reads offloaded per chunk)."""
+        with open(path, "rb") as f:
+            while chunk := await asyncio.to_thread(f.read, chunk_size):
+                yield chunk
+
+    async def apublish_image_post(self, text: str, image_path: str) -> dict:
+        """Async twin of ``publish_image_post``.
+
+        The binary PUT runs as a task while the post payload is assembled —
+        the payload only needs the URN from the initialize step, not the
+        completed upload, so the two overlap for free.
+        """
+        upload_url, image_urn = await asyncio.to_thread(self._initialize_image_upload)
+
+        client = get_async_client()
+        put_task = asyncio.ensure_future(
+            client.put(
+                upload_url,
+                headers={
+                    "Authorization": f"Bearer {self.access_token}",
+                    "Content-Length": str(Path(image_path).stat().st_size),
+                },
+                content=self._afile_chunks(image_path),
+                timeout=60,
             )
-            resp.raise_for_status()
+        )
+
+        payload = {
+            "author": self.person_urn,
+            "commentary": text,
+            "visibility": "PUBLIC",
+            "distribution": {
+                "feedDistribution": "MAIN_FEED",
+                "targetEntities": [],
+                "thirdPartyDistributionChannels": [],
+            },
+            "content": {
+                "media": {
+                    "title": "AI/ML Weekly Digest",
+                    "id": image_urn,
+                }
+            },
+            "lifecycleState": "PUBLISHED",
+        }
+
+        (await put_task).raise_for_status()
+        logger.info("linkedin_image_uploaded", image_urn=image_urn)
+
+        resp = await client.post(
+            f"{LINKEDIN_API_BASE}/rest/posts",
+            headers=self._headers,
+            content=orjson.dumps(payload),
+            timeout=30,
+        )
+        resp.raise_for_status()
+
+        post_id = resp.headers.get("x-restli-id", "unknown")
+        logger.info("linkedin_image_post_published", post_id=post_id)
+        return {"post_id": post_id, "image_urn": image_urn, "status": "published"}
+
+    async def aupload_document(self, pdf_path: str) -> str:
+        """Async twin of ``upload_document`` over the shared AsyncClient."""
+        file_size = Path(pdf_path).stat().st_size
+
+        init_payload = {
+            "initializeUploadRequest": {
+                "owner": self.person_urn,
+                "fileSizeBytes": file_size,
+                "uploadedByMember": self.person_urn,
+            }
+        }
+
+        client = get_async_client()
+        init_resp = await client.post(
+            f"{LINKEDIN_API_BASE}/rest/documents?action=initializeUpload",
+            headers=self._headers,
+            content=orjson.dumps(init_payload),
+            timeout=120,
+        )
+        init_resp.raise_for_status()
+        init_data = orjson.loads(init_resp.content)["value"]
+
+        upload_resp = await client.put(
+            init_data["uploadUrl"],
+            headers={
+                "Authorization": f"Bearer {self.access_token}",
+                "Content-Length": str(file_size),
+            },
+            content=self._afile_chunks(pdf_path),
+            timeout=120,
+        )
+        upload_resp.raise_for_status()
+
+        document_urn = init_data["document"]
+        logger.info("linkedin_document_uploaded", document_urn=document_urn, size_bytes=file_size)
+        return document_urn
+
+    async def apublish_document_post(
+        self, text: str, pdf_path: str, title: str = "AI/ML Weekly Digest"
+    ) -> dict:
+        """Async twin of ``publish_document_post``."""
+        document_urn = await self.aupload_document(pdf_path)
+
+        payload = {
+            "author": self.person_urn,
+            "commentary": text,
+            "visibility": "PUBLIC",
+            "distribution": {
+                "feedDistribution": "MAIN_FEED",
+                "targetEntities": [],
+                "thirdPartyDistributionChannels": [],
+            },
+            "content": {
+                "media": {
+                    "title": title,
+                    "id": document_urn,
+                }
+            },
+            "lifecycleState": "PUBLISHED",
+        }
+
+        resp = await get_async_client().post(
+            f"{LINKEDIN_API_BASE}/rest/posts",
+            headers=self._headers,
+            content=orjson.dumps(payload),
+            timeout=30,
+        )
+        resp.raise_for_status()
 
         post_id = resp.headers.get("x-restli-id", "unknown")
         logger.info("linkedin_carousel_published", post_id=post_id, document_urn=document_urn)
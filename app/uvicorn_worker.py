@@ -0,0 +1,11 @@
+"""Uvicorn worker with uvloop + httptools pinned (referenced by gunicorn.conf.py)."""
+
+from __future__ import annotations
+
+from uvicorn.workers import UvicornWorker
+
+
+class TunedUvicornWorker(UvicornWorker):
+    # Pinned rather than "auto" so a missing extra fails at boot instead of
+    # silently falling back to the stdlib selector loop / h11 parser
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools"}  # noqa: RUF012
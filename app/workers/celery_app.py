@@ -0,0 +1,38 @@
+"""
+Celery application — out-of-process execution for pipeline runs.
+
+A full pipeline run holds the API event loop for minutes and dies with the
+web worker on every deploy. Runs are therefore enqueued to Celery workers
+(Redis broker, same instance as run-status tracking) that scale and restart
+independently of the API:
+
+    celery -A app.workers.celery_app worker --loglevel=info
+"""
+
+from __future__ import annotations
+
+from celery import Celery
+
+from app.core.config import get_settings
+
+_settings = get_settings()
+
+celery_app = Celery(
+    "ai_news",
+    broker=_settings.redis_url,
+    backend=_settings.redis_url,
+    include=["app.workers.tasks"],
+)
+
+celery_app.conf.update(
+    # A worker crash mid-pipeline requeues the run instead of losing it
+    task_acks_late=True,
+    worker_prefetch_multiplier=1,
+    broker_connection_retry_on_startup=True,
+    # Run status flows through the run:{run_id} Redis hash, not the result
+    # backend, so results are dead weight
+    task_ignore_result=True,
+    # Surface a dead broker to the API immediately — trigger_run falls back
+    # to an in-process background task instead of blocking on retries
+    task_publish_retry=False,
+)
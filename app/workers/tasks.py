@@ -0,0 +1,20 @@
+"""Celery task definitions. Kept thin — the real logic stays in the app."""
+
+from __future__ import annotations
+
+import asyncio
+
+from app.workers.celery_app import celery_app
+
+
+@celery_app.task(name="pipeline.execute")
+def execute_pipeline_task(run_id: str, trigger_type: str = "manual") -> None:
+    """Run the full news pipeline on a worker.
+
+    Status flows through the run:{run_id} Redis hash, so the API can keep
+    answering polls regardless of which process executes the graph.
+    """
+    # Imported lazily: tasks -> runs -> tasks would otherwise be circular
+    from app.api.v1.routes.runs import execute_pipeline
+
+    asyncio.run(execute_pipeline(run_id, trigger_type))
@@ -2,37 +2,25 @@ import asyncio
 import sys
 import uuid
 
-from app.core.config import get_settings
-from app.core.logging import get_logger, setup_logging
+async def main() -> int:
+    # App imports stay inside main() — same cold-start rationale as
+    # cron/trigger.py: bootstrap on stdlib only.
+    from app.core.config import get_settings
+    from app.core.logging import get_logger, setup_logging
 
-setup_logging()
-logger = get_logger("research_cron")
-settings = get_settings()
+    setup_logging()
+    logger = get_logger("research_cron")
+    settings = get_settings()
 
-async def main() -> int:
     run_id = str(uuid.uuid4())
     logger.info("research_cron_triggered", run_id=run_id, schedule="Thursday Deep Tech")
 
     try:
         # IMPORT THE NEW GRAPH HERE
         from app.agents.research_graph import build_research_graph
+        from app.agents.state import make_initial_state
 
-        initial_state = {
-            "run_id": run_id,
-            "trigger_type": "scheduled",
-            "raw_articles": [],
-            "deduplicated_articles": [],
-            "summaries": [],
-            "newsletter_html": "",
-            "linkedin_draft": "",
-            "image_paths": [],
-            "approval_status": "pending",
-            "feedback": "",
-            "error_log": [],
-            "total_tokens": 0,
-            "total_cost": 0.0,
-            "current_step": "starting",
-        }
+        initial_state = make_initial_state(run_id, "scheduled")
         config = {"configurable": {"thread_id": run_id}}
 
         if settings.is_sqlite:
@@ -14,38 +14,27 @@ import asyncio
 import sys
 import uuid
 
-from app.core.config import get_settings
-from app.core.logging import get_logger, setup_logging
-
-setup_logging()
-logger = get_logger("cron")
-settings = get_settings()
-
 
 async def main() -> int:
     """Trigger the pipeline and wait for completion."""
+    # App imports stay inside main(): structlog/pydantic/langgraph cost
+    # hundreds of ms at cron cold-start, so the process bootstraps on
+    # stdlib only and pays for the stack once it is actually running.
+    from app.core.config import get_settings
+    from app.core.logging import get_logger, setup_logging
+
+    setup_logging()
+    logger = get_logger("cron")
+    settings = get_settings()
+
     run_id = str(uuid.uuid4())
     logger.info("cron_triggered", run_id=run_id, schedule="Tue/Thu 9AM UTC")
 
     try:
         from app.agents.graph import build_graph
+        from app.agents.state import make_initial_state
 
-        initial_state = {
-            "run_id": run_id,
-            "trigger_type": "scheduled",
-            "raw_articles": [],
-            "deduplicated_articles": [],
-            "summaries": [],
-            "newsletter_html": "",
-            "linkedin_draft": "",
-            "image_paths": [],
-            "approval_status": "pending",
-            "feedback": "",
-            "error_log": [],
-            "total_tokens": 0,
-            "total_cost": 0.0,
-            "current_step": "starting",
-        }
+        initial_state = make_initial_state(run_id, "scheduled")
         config = {"configurable": {"thread_id": run_id}}
 
         if settings.is_sqlite:
@@ -53,7 +42,7 @@ async def main() -> int:
 
             checkpointer = InMemorySaver()
             graph = build_graph(checkpointer=checkpointer)
-            result = await graph.ainvoke(initial_state, config)
+            result = await graph.ainvoke(initial_state, config, durability="sync")
 
         else:
             from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
@@ -64,7 +53,7 @@ async def main() -> int:
 
                 # The graph compilation and execution MUST be indented inside the async with block
                 graph = build_graph(checkpointer=checkpointer)
-                result = await graph.ainvoke(initial_state, config)
+                result = await graph.ainvoke(initial_state, config, durability="sync")
 
         logger.info(
             "cron_completed",
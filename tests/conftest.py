@@ -6,10 +6,24 @@ Uses FakeListChatModel for deterministic LLM mocking — no API keys needed.
 
 from __future__ import annotations
 
+from copy import deepcopy
+
 import pytest
 from langchain_core.language_models.fake_chat_models import FakeListChatModel
 
-from app.agents.state import NewsArticle, PipelineState
+from app.agents.state import NewsArticle, PipelineState, make_initial_state
+
+
+@pytest.fixture(autouse=True)
+def _reset_llm_cache():
+    """The summarizer caches one LLM client per (model, temperature); clear
+    it between tests so a client built under one test's patch doesn't leak
+    into the next."""
+    from app.agents.nodes.summarizer import _llm
+
+    _llm.cache_clear()
+    yield
+    _llm.cache_clear()
 
 
 @pytest.fixture
@@ -23,65 +37,61 @@ def mock_llm() -> FakeListChatModel:
     )
 
 
+# Article templates built once at collection time; the fixtures hand out
+# deep copies because several nodes (credibility, dedup) write back into
+# the article dicts in place — sharing one instance across tests would
+# leak those mutations between them.
+_SAMPLE_ARTICLE = NewsArticle(
+    title="OpenAI Releases GPT-5 with Reasoning Capabilities",
+    url="https://techcrunch.com/2025/01/15/openai-gpt5",
+    source="rss:techcrunch",
+    content=(
+        "OpenAI has announced GPT-5, its latest large language model featuring "
+        "advanced reasoning capabilities. The model demonstrates significant "
+        "improvements in mathematical problem-solving, code generation, and "
+        "multi-step logical reasoning. Early benchmarks show a 40% improvement "
+        "over GPT-4o on complex reasoning tasks."
+    ),
+    published_at="2025-01-15T10:00:00Z",
+    credibility_score=0.0,
+)
+
+_SAMPLE_ARTICLES = [
+    _SAMPLE_ARTICLE,
+    NewsArticle(
+        title="Google DeepMind Achieves Protein Folding Breakthrough",
+        url="https://www.nature.com/articles/deepmind-protein",
+        source="rss:nature",
+        content="DeepMind's AlphaFold 3 can now predict protein interactions...",
+        published_at="2025-01-14T08:00:00Z",
+        credibility_score=0.0,
+    ),
+    NewsArticle(
+        title="EU AI Act Enforcement Begins",
+        url="https://reuters.com/eu-ai-act",
+        source="tavily",
+        content="The European Union's AI Act officially entered enforcement...",
+        published_at="2025-01-13T14:00:00Z",
+        credibility_score=0.0,
+    ),
+]
+
+
 @pytest.fixture
 def sample_article() -> NewsArticle:
     """A realistic sample article for testing."""
-    return NewsArticle(
-        title="OpenAI Releases GPT-5 with Reasoning Capabilities",
-        url="https://techcrunch.com/2025/01/15/openai-gpt5",
-        source="rss:techcrunch",
-        content=(
-            "OpenAI has announced GPT-5, its latest large language model featuring "
-            "advanced reasoning capabilities. The model demonstrates significant "
-            "improvements in mathematical problem-solving, code generation, and "
-            "multi-step logical reasoning. Early benchmarks show a 40% improvement "
-            "over GPT-4o on complex reasoning tasks."
-        ),
-        published_at="2025-01-15T10:00:00Z",
-        credibility_score=0.0,
-    )
+    return deepcopy(_SAMPLE_ARTICLE)
 
 
 @pytest.fixture
-def sample_articles(sample_article: NewsArticle) -> list[NewsArticle]:
+def sample_articles() -> list[NewsArticle]:
     """Multiple sample articles for pipeline testing."""
-    return [
-        sample_article,
-        NewsArticle(
-            title="Google DeepMind Achieves Protein Folding Breakthrough",
-            url="https://www.nature.com/articles/deepmind-protein",
-            source="rss:nature",
-            content="DeepMind's AlphaFold 3 can now predict protein interactions...",
-            published_at="2025-01-14T08:00:00Z",
-            credibility_score=0.0,
-        ),
-        NewsArticle(
-            title="EU AI Act Enforcement Begins",
-            url="https://reuters.com/eu-ai-act",
-            source="tavily",
-            content="The European Union's AI Act officially entered enforcement...",
-            published_at="2025-01-13T14:00:00Z",
-            credibility_score=0.0,
-        ),
-    ]
+    return deepcopy(_SAMPLE_ARTICLES)
 
 
 @pytest.fixture
 def initial_state(sample_articles: list[NewsArticle]) -> PipelineState:
     """A fully populated initial pipeline state for testing."""
-    return PipelineState(
-        run_id="test-run-001",
-        trigger_type="manual",
-        raw_articles=sample_articles,
-        deduplicated_articles=[],
-        summaries=[],
-        newsletter_html="",
-        linkedin_draft="",
-        image_paths=[],
-        approval_status="pending",
-        feedback="",
-        error_log=[],
-        total_tokens=0,
-        total_cost=0.0,
-        current_step="starting",
-    )
+    state = make_initial_state("test-run-001", "manual")
+    state["raw_articles"] = sample_articles
+    return state
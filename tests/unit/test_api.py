@@ -11,10 +11,12 @@ from app.main import app
 settings = get_settings()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Test client with API key auth header."""
-    return TestClient(app)
+    """Test client shared across the module — the context-manager form runs
+    the app lifespan once instead of booting it per test."""
+    with TestClient(app) as c:
+        yield c
 
 
 @pytest.fixture
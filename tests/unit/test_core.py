@@ -48,6 +48,87 @@ class TestDeduplication:
         assert result["deduplicated_articles"] == []
 
 
+# ── Seen-URL index tests ────────────────────────────────────
+class TestSeenUrlIndex:
+    def test_second_run_drops_known_urls(self, tmp_path):
+        from app.core.dedup import filter_unseen_urls
+
+        db = tmp_path / "seen.db"
+        first = filter_unseen_urls(["https://a.com/x", "https://b.com/y"], db)
+        assert first == {"https://a.com/x", "https://b.com/y"}
+
+        second = filter_unseen_urls(["https://a.com/x", "https://c.com/z"], db)
+        assert second == {"https://c.com/z"}
+
+
+# ── MinHash index tests ─────────────────────────────────────
+class TestMinHashIndex:
+    def test_flags_title_variant(self):
+        from app.core.dedup import MinHashIndex
+
+        idx = MinHashIndex(threshold=0.85)
+        base = "openai unveils gpt-5 with advanced reasoning capabilities " * 3
+        idx.add(MinHashIndex.signature(base))
+        variant = base + " today"
+        assert idx.query(MinHashIndex.signature(variant))
+
+    def test_distinct_stories_not_flagged(self):
+        from app.core.dedup import MinHashIndex
+
+        idx = MinHashIndex(threshold=0.85)
+        idx.add(MinHashIndex.signature("openai unveils gpt-5 with advanced reasoning"))
+        other = MinHashIndex.signature("eu ai act enforcement begins across member states")
+        assert not idx.query(other)
+
+    def test_short_text_has_no_signature(self):
+        from app.core.dedup import MinHashIndex
+
+        assert MinHashIndex.signature("abc") is None
+
+
+# ── Shingle filter tests ────────────────────────────────────
+class TestShingleFilter:
+    _CONTENT = (
+        "OpenAI has announced GPT-5, its latest large language model featuring "
+        "advanced reasoning capabilities with significant improvements in "
+        "mathematical problem-solving, code generation, and logical reasoning."
+    )
+
+    def test_detects_near_duplicate_across_instances(self, tmp_path):
+        from app.core.dedup import ShingleFilter
+
+        path = tmp_path / "dedup.bloom"
+        first = ShingleFilter(path, capacity=10_000)
+        first.add(ShingleFilter.shingles(self._CONTENT))
+        first.save()
+
+        # A fresh instance (new "run") loads the persisted bits and flags a
+        # lightly edited copy of the same article.
+        second = ShingleFilter(path, capacity=10_000)
+        edited = self._CONTENT + " Early benchmarks show strong results."
+        assert second.is_duplicate(ShingleFilter.shingles(edited))
+
+    def test_unrelated_content_not_flagged(self):
+        from app.core.dedup import ShingleFilter
+
+        sf = ShingleFilter(capacity=10_000)
+        sf.add(ShingleFilter.shingles(self._CONTENT))
+        other = (
+            "The European Union's AI Act officially entered enforcement this "
+            "week, with regulators across member states beginning compliance "
+            "audits of high-risk artificial intelligence systems."
+        )
+        assert not sf.is_duplicate(ShingleFilter.shingles(other))
+
+    def test_short_content_never_flagged(self):
+        from app.core.dedup import ShingleFilter
+
+        sf = ShingleFilter(capacity=10_000)
+        shingles = ShingleFilter.shingles("too short to shingle")
+        sf.add(shingles)
+        assert not sf.is_duplicate(shingles)
+
+
 # ── Credibility tests ───────────────────────────────────────
 class TestCredibility:
     def test_known_source_scores(self):
@@ -108,7 +108,7 @@ class TestPersistAndMaybePublishDigestNode:
              patch("app.services.email_service.EmailService") as MockEmailService:
             result = _persist_and_maybe_publish_digest_node(_make_state("run-1"))
 
-        MockEmailService.assert_not_called()
+        MockEmailService.get.assert_not_called()
         assert result["current_step"] == "digest_queued"
 
         with in_memory_session_factory() as session:
@@ -128,7 +128,7 @@ class TestPersistAndMaybePublishDigestNode:
             _persist_and_maybe_publish_digest_node(_make_state("run-2", "Paper Two"))
 
             with patch("app.services.email_service.EmailService") as MockEmailService:
-                MockEmailService.return_value = mock_instance
+                MockEmailService.get.return_value = mock_instance
                 result = _persist_and_maybe_publish_digest_node(_make_state("run-3", "Paper Three"))
 
         mock_instance.send_newsletter.assert_called_once()
@@ -150,7 +150,7 @@ class TestPersistAndMaybePublishDigestNode:
         with patch("app.agents.nodes.db_persist._get_sync_session", in_memory_session_factory), \
              patch("app.agents.nodes.digest.settings.digest_batch_size", 1), \
              patch("app.services.email_service.EmailService") as MockEmailService:
-            MockEmailService.return_value.send_newsletter.side_effect = RuntimeError("SMTP down")
+            MockEmailService.get.return_value.send_newsletter.side_effect = RuntimeError("SMTP down")
             result = _persist_and_maybe_publish_digest_node(_make_state("run-1"))
 
         assert result["current_step"] == "digest_published"
@@ -14,6 +14,7 @@ disturbing the existing LinkedIn preview / article / approve-reject sections.
 from __future__ import annotations
 
 import email as stdlib_email
+from email.header import decode_header, make_header
 from unittest.mock import MagicMock, patch
 
 from app.services.email_service import EmailService
@@ -48,9 +49,7 @@ def _run_send(**kwargs) -> tuple[str, str]:
 
     with patch("app.services.email_service.settings", mock_settings), \
          patch("app.services.email_service.smtplib.SMTP") as MockSMTP:
-        mock_smtp = MagicMock()
-        MockSMTP.return_value.__enter__ = MagicMock(return_value=mock_smtp)
-        MockSMTP.return_value.__exit__ = MagicMock(return_value=False)
+        mock_smtp = MockSMTP.return_value
         mock_smtp.sendmail.side_effect = lambda s, r, msg: captured.append(msg)
 
         defaults = dict(
@@ -152,3 +151,50 @@ class TestResearchPipelineThumbnailGrid:
         """Defensive: an empty input list produces no grid section at all."""
         _, html = _run_send(slide_image_paths=[])
         assert "Slide Preview" not in html
+
+
+# ── Non-ASCII headers ─────────────────────────────────────────────────────────
+
+class TestNonAsciiHeaders:
+    """smtplib/aiosmtplib ascii-encode a str message, so the byte-level MIME
+    builder must RFC-2047-encode non-ASCII subjects (the digest and research
+    newsletters use emoji subjects)."""
+
+    SUBJECT = "🗞️ AI Research Digest — Batch 7"
+
+    def _send_newsletter(self) -> str:
+        mock_settings = _mock_settings()
+        captured: list[str] = []
+
+        with patch("app.services.email_service.settings", mock_settings), \
+             patch("app.services.email_service.smtplib.SMTP") as MockSMTP:
+            mock_smtp = MockSMTP.return_value
+            mock_smtp.sendmail.side_effect = lambda s, r, msg: captured.append(msg)
+
+            EmailService().send_newsletter(
+                html_content="<p>digest</p>", subject=self.SUBJECT
+            )
+        return captured[0]
+
+    def test_message_is_pure_ascii(self):
+        assert self._send_newsletter().isascii()
+
+    def test_subject_round_trips_through_rfc2047(self):
+        raw = self._send_newsletter()
+        msg = stdlib_email.message_from_string(raw)
+        decoded = str(make_header(decode_header(msg["Subject"])))
+        assert decoded == self.SUBJECT
+
+    def test_ascii_subject_left_unencoded(self):
+        mock_settings = _mock_settings()
+        captured: list[str] = []
+
+        with patch("app.services.email_service.settings", mock_settings), \
+             patch("app.services.email_service.smtplib.SMTP") as MockSMTP:
+            mock_smtp = MockSMTP.return_value
+            mock_smtp.sendmail.side_effect = lambda s, r, msg: captured.append(msg)
+
+            EmailService().send_newsletter(
+                html_content="<p>ok</p>", subject="Weekly AI Digest"
+            )
+        assert "Subject: Weekly AI Digest\n" in captured[0]
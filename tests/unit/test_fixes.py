@@ -81,9 +81,9 @@ class TestResponseContentListHandling:
     instead of a plain string. Verify the node handles both cases.
     """
 
-    def test_summarize_node_handles_list_content(self, sample_articles):
+    async def test_summarize_node_handles_list_content(self, sample_articles):
         """summarize_node must not crash when response.content is a list."""
-        from unittest.mock import MagicMock, patch
+        from unittest.mock import AsyncMock, MagicMock, patch
 
         fake_content = [{"text": '[{"headline": "H", "body": "B", "category": "LLM", "source_url": "https://x.com", "credibility_score": 0.8}]'}]
         fake_response = MagicMock()
@@ -93,16 +93,16 @@ class TestResponseContentListHandling:
         state = {"deduplicated_articles": scored, "feedback": ""}
 
         with patch("app.agents.nodes.summarizer.ChatGoogleGenerativeAI") as MockLLM:
-            MockLLM.return_value.invoke.return_value = fake_response
-            result = summarize_node(state)
+            MockLLM.return_value.ainvoke = AsyncMock(return_value=fake_response)
+            result = await summarize_node(state)
 
         assert "error_log" not in result or not result.get("error_log")
         assert len(result.get("summaries", [])) == 1
         assert result["summaries"][0]["headline"] == "H"
 
-    def test_summarize_node_handles_string_content(self, sample_articles):
+    async def test_summarize_node_handles_string_content(self, sample_articles):
         """summarize_node must still work when response.content is a plain string."""
-        from unittest.mock import MagicMock, patch
+        from unittest.mock import AsyncMock, MagicMock, patch
 
         fake_response = MagicMock()
         fake_response.content = '[{"headline": "H", "body": "B", "category": "LLM", "source_url": "https://x.com", "credibility_score": 0.8}]'
@@ -111,14 +111,14 @@ class TestResponseContentListHandling:
         state = {"deduplicated_articles": scored, "feedback": ""}
 
         with patch("app.agents.nodes.summarizer.ChatGoogleGenerativeAI") as MockLLM:
-            MockLLM.return_value.invoke.return_value = fake_response
-            result = summarize_node(state)
+            MockLLM.return_value.ainvoke = AsyncMock(return_value=fake_response)
+            result = await summarize_node(state)
 
         assert len(result.get("summaries", [])) == 1
 
-    def test_summarize_node_recovers_truncated_response(self, sample_articles):
+    async def test_summarize_node_recovers_truncated_response(self, sample_articles):
         """summarize_node must recover partial summaries from truncated JSON."""
-        from unittest.mock import MagicMock, patch
+        from unittest.mock import AsyncMock, MagicMock, patch
 
         truncated = '[{"headline": "H1", "body": "B1", "category": "LLM", "source_url": "https://x.com", "credibility_score": 0.8}, {"headline": "Cut'
         fake_response = MagicMock()
@@ -128,8 +128,8 @@ class TestResponseContentListHandling:
         state = {"deduplicated_articles": scored, "feedback": ""}
 
         with patch("app.agents.nodes.summarizer.ChatGoogleGenerativeAI") as MockLLM:
-            MockLLM.return_value.invoke.return_value = fake_response
-            result = summarize_node(state)
+            MockLLM.return_value.ainvoke = AsyncMock(return_value=fake_response)
+            result = await summarize_node(state)
 
         # Should recover the 1 complete object instead of returning 0
         assert len(result.get("summaries", [])) == 1
@@ -234,9 +234,10 @@ class TestDeepAnalysisNode:
         Return (mock_pro, mock_flash) configured for deep_analysis_node.
 
         LangChain wraps non-Runnable callables via RunnableLambda, so when
-        (prompt | mock).invoke() runs it calls mock(input) — not mock.invoke(input).
-        We therefore set both .return_value (callable path) and .invoke.return_value
-        (direct-invoke path) so the test is robust to either call convention.
+        (prompt | mock).ainvoke() runs it calls mock(input) in an executor —
+        not mock.invoke(input). We therefore set both .return_value (callable
+        path) and .invoke.return_value (direct-invoke path) so the test is
+        robust to either call convention.
         """
         # Pro path: constructor → .with_structured_output() → (prompt | chain).invoke()
         mock_structured_chain = MagicMock()
@@ -254,56 +255,56 @@ class TestDeepAnalysisNode:
 
         return mock_pro, mock_flash
 
-    def test_returns_error_when_no_paper(self):
-        result = deep_analysis_node({"chosen_research_paper": None})
+    async def test_returns_error_when_no_paper(self):
+        result = await deep_analysis_node({"chosen_research_paper": None})
         assert result["current_step"] == "error_no_paper"
 
-    def test_returns_analysis_dict(self):
+    async def test_returns_analysis_dict(self):
         analysis = make_rich_analysis()
         mock_pro, mock_flash = self._mock_llm(analysis, "Test LinkedIn draft " * 30)
 
         with patch("app.agents.research_graph.ChatGoogleGenerativeAI") as MockLLM:
             MockLLM.side_effect = [mock_pro, mock_flash]
-            result = deep_analysis_node({"chosen_research_paper": make_paper()})
+            result = await deep_analysis_node({"chosen_research_paper": make_paper()})
 
         assert "deep_analysis" in result
         assert result["deep_analysis"]["core_problem"] == analysis.core_problem
         assert result["deep_analysis"]["significance_verdict"] == "Major Contribution"
 
-    def test_linkedin_draft_populated(self):
+    async def test_linkedin_draft_populated(self):
         analysis = make_rich_analysis()
         mock_pro, mock_flash = self._mock_llm(analysis, "This is the LinkedIn draft content.")
 
         with patch("app.agents.research_graph.ChatGoogleGenerativeAI") as MockLLM:
             MockLLM.side_effect = [mock_pro, mock_flash]
-            result = deep_analysis_node({"chosen_research_paper": make_paper()})
+            result = await deep_analysis_node({"chosen_research_paper": make_paper()})
 
         assert result["linkedin_draft"] == "This is the LinkedIn draft content."
 
-    def test_newsletter_html_is_full_article(self):
+    async def test_newsletter_html_is_full_article(self):
         analysis = make_rich_analysis()
         mock_pro, mock_flash = self._mock_llm(analysis, "LinkedIn content")
 
         with patch("app.agents.research_graph.ChatGoogleGenerativeAI") as MockLLM:
             MockLLM.side_effect = [mock_pro, mock_flash]
-            result = deep_analysis_node({"chosen_research_paper": make_paper()})
+            result = await deep_analysis_node({"chosen_research_paper": make_paper()})
 
         html = result["newsletter_html"]
         assert "Executive Summary" in html
         assert "Technical Deep Dive" in html
         assert len(html) > 1000
 
-    def test_current_step_on_success(self):
+    async def test_current_step_on_success(self):
         analysis = make_rich_analysis()
         mock_pro, mock_flash = self._mock_llm(analysis, "Draft")
 
         with patch("app.agents.research_graph.ChatGoogleGenerativeAI") as MockLLM:
             MockLLM.side_effect = [mock_pro, mock_flash]
-            result = deep_analysis_node({"chosen_research_paper": make_paper()})
+            result = await deep_analysis_node({"chosen_research_paper": make_paper()})
 
         assert result["current_step"] == "analysis_complete"
 
-    def test_fallback_linkedin_draft_on_flash_error(self):
+    async def test_fallback_linkedin_draft_on_flash_error(self):
         """If the Flash LinkedIn call fails, a template draft is returned instead of crashing."""
         analysis = make_rich_analysis()
         mock_structured_chain = MagicMock()
@@ -318,13 +319,13 @@ class TestDeepAnalysisNode:
 
         with patch("app.agents.research_graph.ChatGoogleGenerativeAI") as MockLLM:
             MockLLM.side_effect = [mock_pro, mock_flash]
-            result = deep_analysis_node({"chosen_research_paper": make_paper()})
+            result = await deep_analysis_node({"chosen_research_paper": make_paper()})
 
         assert result["linkedin_draft"]  # non-empty fallback
         assert isinstance(result["linkedin_draft"], str)
         assert result["current_step"] == "analysis_complete"
 
-    def test_analysis_node_error_propagates_on_pro_failure(self):
+    async def test_analysis_node_error_propagates_on_pro_failure(self):
         """If the Pro analysis call fails, return the error step."""
         mock_structured_chain = MagicMock()
         # Set side_effect on the mock itself so calling it as a callable also raises.
@@ -336,7 +337,7 @@ class TestDeepAnalysisNode:
 
         with patch("app.agents.research_graph.ChatGoogleGenerativeAI") as MockLLM:
             MockLLM.return_value = mock_pro
-            result = deep_analysis_node({"chosen_research_paper": make_paper()})
+            result = await deep_analysis_node({"chosen_research_paper": make_paper()})
 
         assert result["current_step"] == "error_analysis_failed"
 
@@ -621,9 +622,7 @@ class TestSendApprovalEmailResearchPreview:
 
         with patch("app.services.email_service.settings", mock_settings), \
              patch("app.services.email_service.smtplib.SMTP") as MockSMTP:
-            mock_smtp = MagicMock()
-            MockSMTP.return_value.__enter__ = MagicMock(return_value=mock_smtp)
-            MockSMTP.return_value.__exit__ = MagicMock(return_value=False)
+            mock_smtp = MockSMTP.return_value
             mock_smtp.sendmail.side_effect = lambda s, r, msg: captured.append(msg)
 
             EmailService().send_approval_email(
@@ -681,9 +680,7 @@ class TestSendApprovalEmailResearchPreview:
         mock_settings = self._mock_settings()
         with patch("app.services.email_service.settings", mock_settings), \
              patch("app.services.email_service.smtplib.SMTP") as MockSMTP:
-            mock_smtp = MagicMock()
-            MockSMTP.return_value.__enter__ = MagicMock(return_value=mock_smtp)
-            MockSMTP.return_value.__exit__ = MagicMock(return_value=False)
+            mock_smtp = MockSMTP.return_value
 
             EmailService().send_approval_email(
                 run_id="run-xyz",
@@ -725,38 +722,38 @@ class TestLinkedInResearchPromptConstant:
 # ── 7. select_paper_node ──────────────────────────────────────────────────────
 
 class TestSelectPaperNode:
-    def test_returns_no_papers_found_when_empty(self):
-        result = select_paper_node({"raw_articles": [], "paper_rankings": []})
+    async def test_returns_no_papers_found_when_empty(self):
+        result = await select_paper_node({"raw_articles": [], "paper_rankings": []})
         assert result["current_step"] == "no_papers_found"
 
-    def test_selects_by_ranking_primary_path(self):
+    async def test_selects_by_ranking_primary_path(self):
         paper_a = make_paper(url="https://arxiv.org/abs/111")
         paper_b = make_paper(url="https://arxiv.org/abs/222")
         rankings = [
             {"paper_url": paper_a["url"], "composite_score": 9.5, "is_manual": False},
             {"paper_url": paper_b["url"], "composite_score": 7.0, "is_manual": False},
         ]
-        result = select_paper_node({
+        result = await select_paper_node({
             "raw_articles": [paper_a, paper_b],
             "paper_rankings": rankings,
         })
         assert result["current_step"] == "paper_selected"
         assert result["chosen_research_paper"]["url"] == paper_a["url"]
 
-    def test_selects_ranked_paper_that_exists_in_articles(self):
+    async def test_selects_ranked_paper_that_exists_in_articles(self):
         """Ranking may reference a URL not in articles — must skip to next valid entry."""
         real_paper = make_paper(url="https://arxiv.org/abs/real")
         rankings = [
             {"paper_url": "https://arxiv.org/abs/ghost", "composite_score": 9.9},  # not in articles
             {"paper_url": real_paper["url"], "composite_score": 8.0},
         ]
-        result = select_paper_node({
+        result = await select_paper_node({
             "raw_articles": [real_paper],
             "paper_rankings": rankings,
         })
         assert result["chosen_research_paper"]["url"] == real_paper["url"]
 
-    def test_llm_fallback_when_no_rankings(self):
+    async def test_llm_fallback_when_no_rankings(self):
         """When paper_rankings is empty, select_paper_node falls back to LLM selection."""
         from app.agents.research_graph import PaperSelection
 
@@ -771,7 +768,7 @@ class TestSelectPaperNode:
             mock_instance.with_structured_output.return_value = mock_chain
             MockLLM.return_value = mock_instance
 
-            result = select_paper_node({"raw_articles": [paper], "paper_rankings": []})
+            result = await select_paper_node({"raw_articles": [paper], "paper_rankings": []})
 
         assert result["current_step"] == "paper_selected"
         assert result["chosen_research_paper"]["url"] == paper["url"]
@@ -956,9 +953,7 @@ class TestSendNewsletterCoverage:
     def test_send_newsletter_calls_smtp(self):
         with patch("app.services.email_service.settings", self._mock_settings()), \
              patch("app.services.email_service.smtplib.SMTP") as MockSMTP:
-            mock_smtp = MagicMock()
-            MockSMTP.return_value.__enter__ = MagicMock(return_value=mock_smtp)
-            MockSMTP.return_value.__exit__ = MagicMock(return_value=False)
+            mock_smtp = MockSMTP.return_value
 
             EmailService().send_newsletter(
                 html_content="<h1>Weekly AI Digest</h1>",
@@ -971,9 +966,7 @@ class TestSendNewsletterCoverage:
         captured: list = []
         with patch("app.services.email_service.settings", self._mock_settings()), \
              patch("app.services.email_service.smtplib.SMTP") as MockSMTP:
-            mock_smtp = MagicMock()
-            MockSMTP.return_value.__enter__ = MagicMock(return_value=mock_smtp)
-            MockSMTP.return_value.__exit__ = MagicMock(return_value=False)
+            mock_smtp = MockSMTP.return_value
             mock_smtp.sendmail.side_effect = lambda s, r, m: captured.append(r)
 
             EmailService().send_newsletter(html_content="<p>Content</p>")
@@ -986,9 +979,7 @@ class TestSendNewsletterCoverage:
 
         with patch("app.services.email_service.settings", self._mock_settings()), \
              patch("app.services.email_service.smtplib.SMTP") as MockSMTP:
-            mock_smtp = MagicMock()
-            MockSMTP.return_value.__enter__ = MagicMock(return_value=mock_smtp)
-            MockSMTP.return_value.__exit__ = MagicMock(return_value=False)
+            mock_smtp = MockSMTP.return_value
 
             EmailService().send_newsletter(
                 html_content="<p>With image</p>",
@@ -1003,9 +994,7 @@ class TestSendNewsletterCoverage:
 
         with patch("app.services.email_service.settings", self._mock_settings()), \
              patch("app.services.email_service.smtplib.SMTP") as MockSMTP:
-            mock_smtp = MagicMock()
-            MockSMTP.return_value.__enter__ = MagicMock(return_value=mock_smtp)
-            MockSMTP.return_value.__exit__ = MagicMock(return_value=False)
+            mock_smtp = MockSMTP.return_value
 
             # Should not raise
             EmailService().send_newsletter(